@@ -10,15 +10,20 @@ FAT点表生成模块 - 用于生成FAT点表
 """
 
 import os
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 import traceback
-# 将tkinter导入替换为PySide6导入
-from PySide6.QtWidgets import QProgressDialog, QMessageBox
+import xlsxwriter
+from PySide6.QtWidgets import QApplication, QProgressDialog, QMessageBox
 from PySide6.QtCore import Qt
 from pathlib import Path
-import tempfile
 from io_generator import IOChannelModels
 
+# FAT点表统一使用的单元格格式：宋体11号
+# xlsxwriter的格式对象绑定在具体工作簿上，这里只保存格式属性，每个工作簿注册一次
+FAT_CELL_FORMAT = {'font_name': '宋体', 'font_size': 11}
+
 class FATGenerator:
     """
     FAT点表生成器类
@@ -28,6 +33,30 @@ class FATGenerator:
     支持UI进度显示和异常处理
     """
     
+    @staticmethod
+    def _blank_mask(values, numeric=False):
+        """
+        计算一列数据中的空单元格掩码
+        
+        空单元格指NaN或只包含空白字符的值；数值列只可能以NaN表示空，
+        此时无需再转换为字符串逐个去除空白
+        
+        Args:
+            values: 待检查的列(Series)
+            numeric: 该列在原始数据中是否为数值类型
+            
+        Returns:
+            Series: 布尔掩码，True表示空单元格
+        """
+        mask = values.isna().to_numpy(copy=True)
+        if not numeric:
+            # 在布尔数组上赋值，保证掩码始终为bool类型；
+            # 直接对Series部分赋值时，NaN与文本混合的列会使掩码变为object类型
+            present = ~mask
+            if present.any():
+                mask[present] = values[present].astype(str).str.strip().eq("").to_numpy(dtype=bool)
+        return pd.Series(mask, index=values.index)
+    
     @staticmethod
     def generate_fat_table(io_data, output_path, root_window=None):
         """
@@ -44,9 +73,6 @@ class FATGenerator:
         Returns:
             bool: 操作是否成功
         """
-        # 导入xlwt库，确保它在这个方法中可用
-        import xlwt
-        
         try:
             # 显示导出进度窗口
             export_window = None
@@ -72,30 +98,23 @@ class FATGenerator:
                     export_window.setLabelText("正在处理数据...")
                     export_window.setValue(10)
                 
-                # 确保输出路径是xls格式
-                xls_output_path = str(Path(output_path).with_suffix('.xls'))
+                # 确保输出路径是xlsx格式
+                xlsx_output_path = str(Path(output_path).with_suffix('.xlsx'))
                 
                 # 确保目标文件不存在
-                if os.path.exists(xls_output_path):
-                    os.remove(xls_output_path)
-                
-                # 创建FAT点表数据的副本，以便进行处理
-                fat_data = io_data.copy()
+                if os.path.exists(xlsx_output_path):
+                    os.remove(xlsx_output_path)
                 
                 # 获取需要高亮的字段列表（需要填写"/"的字段）
                 highlight_fields = IOChannelModels.get_highlight_fields()
                 
-                # 先将所有将要填入字符串值的列转换为object/string类型
-                if "变量名称（HMI）" in fat_data.columns:
-                    fat_data["变量名称（HMI）"] = fat_data["变量名称（HMI）"].astype(object)
-                
-                if "变量描述" in fat_data.columns:
-                    fat_data["变量描述"] = fat_data["变量描述"].astype(object)
-                
-                # 将所有需要填"/"的字段也转换为字符串类型
-                for field in highlight_fields:
-                    if field in fat_data.columns:
-                        fat_data[field] = fat_data[field].astype(object)
+                # 只复制需要修改的列，其余列在写入时直接引用原始数据（astype会生成新的副本）
+                mutable_cols = [
+                    col for col in dict.fromkeys(["变量名称（HMI）", "变量描述", *highlight_fields])
+                    if col in io_data.columns
+                ]
+                # 所有将要填入字符串值的列一次性转换为object类型
+                fat_data = io_data[mutable_cols].astype(object)
                 
                 # 更新进度
                 if export_window:
@@ -103,18 +122,24 @@ class FATGenerator:
                     export_window.setValue(30)
                 
                 # 第一步：处理变量名称为空的情况，补全变量名称和变量描述
-                for idx, row in fat_data.iterrows():
-                    # 获取变量名称和描述
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    channel_code = row.get("通道位号", "")
-                    
-                    # 检查变量名称是否为空
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
+                if "变量名称（HMI）" in fat_data.columns:
+                    mask = FATGenerator._blank_mask(
+                        fat_data["变量名称（HMI）"],
+                        is_numeric_dtype(io_data["变量名称（HMI）"])
+                    )
+
+                    if mask.any():
+                        # 通道位号转换为定长字符串数组，由np.char.add在C层完成拼接
+                        if "通道位号" in io_data.columns:
+                            codes = io_data.loc[mask, "通道位号"].to_numpy(dtype=str)
+                        else:
+                            codes = np.full(int(mask.sum()), "")
+
                         # 自动补全变量名称
-                        fat_data.at[idx, "变量名称（HMI）"] = f"YLDW{channel_code}"
-                        
+                        fat_data.loc[mask, "变量名称（HMI）"] = np.char.add("YLDW", codes).astype(object)
+
                         # 自动补全变量描述（无论原来是否为空）
-                        fat_data.at[idx, "变量描述"] = f"预留点位{channel_code}"
+                        fat_data.loc[mask, "变量描述"] = np.char.add("预留点位", codes).astype(object)
                 
                 # 更新进度
                 if export_window:
@@ -122,70 +147,83 @@ class FATGenerator:
                     export_window.setValue(50)
                 
                 # 第二步：处理所有标黄的空单元格，填写为"/"
-                for idx, row in fat_data.iterrows():
-                    for field in highlight_fields:
-                        if field in fat_data.columns:
-                            current_value = row.get(field, "")
-                            if pd.isna(current_value) or str(current_value).strip() == "":
-                                # 直接赋值，前面已经将列转换为对象类型
-                                fat_data.at[idx, field] = "/"
+                highlight_cols = [field for field in highlight_fields if field in fat_data.columns]
+                if highlight_cols:
+                    # 前面已经将列转换为对象类型，这里按列整体判断空值并替换
+                    sub = fat_data[highlight_cols]
+                    blank = pd.DataFrame({
+                        field: FATGenerator._blank_mask(
+                            sub[field],
+                            field in io_data.columns and is_numeric_dtype(io_data[field])
+                        )
+                        for field in highlight_cols
+                    })
+                    fat_data[highlight_cols] = sub.mask(blank, "/")
                 
                 # 更新进度
                 if export_window:
                     export_window.setLabelText("正在创建Excel文件...")
                     export_window.setValue(70)
                 
-                # 创建新的Excel工作簿
-                workbook = xlwt.Workbook(encoding='utf-8')
-                worksheet = workbook.add_sheet('FAT点表')
-                
-                # 创建宋体字体样式
-                font = xlwt.Font()
-                font.name = '宋体'
-                font.height = 220  # 字体大小 11 (220 = 11 * 20)
-                
-                # 设置单元格样式
-                common_style = xlwt.XFStyle()
-                common_style.font = font
-                
-                # 写入表头
-                for col_idx, col_name in enumerate(fat_data.columns):
-                    worksheet.write(0, col_idx, col_name, common_style)
-                
-                # 更新进度
-                if export_window:
-                    export_window.setLabelText("正在写入数据...")
-                    export_window.setValue(80)
-                
-                # 写入数据
-                total_rows = len(fat_data)
-                for row_idx, (_, row) in enumerate(fat_data.iterrows(), 1):
-                    # 周期性更新进度
-                    if export_window and row_idx % 10 == 0:  # 每10行更新一次进度
-                        progress = 80 + int((row_idx / total_rows) * 15)  # 从80%到95%的进度
-                        export_window.setValue(progress)
-                        export_window.setLabelText(f"正在写入数据... ({row_idx}/{total_rows})")
+                # 按原始列顺序组装输出列，修改过的列取自fat_data
+                output_columns = list(io_data.columns) + [
+                    col for col in fat_data.columns if col not in io_data.columns
+                ]
+                column_positions = {col: idx for idx, col in enumerate(output_columns)}
+                untouched_cols = [col for col in io_data.columns if col not in fat_data.columns]
+                
+                # 一次性转换为object数组，空值统一替换为空字符串，写入阶段不再经过pandas
+                total_rows = len(io_data)
+                values = np.empty((total_rows, len(output_columns)), dtype=object)
+                values[:, [column_positions[col] for col in untouched_cols]] = \
+                    io_data[untouched_cols].to_numpy(dtype=object, na_value="")
+                values[:, [column_positions[col] for col in fat_data.columns]] = \
+                    fat_data.to_numpy(dtype=object, na_value="")
+                
+                # 创建新的Excel工作簿，constant_memory模式下逐行写出并释放内存
+                with xlsxwriter.Workbook(xlsx_output_path, {'constant_memory': True, 'strings_to_numbers': False}) as workbook:
+                    worksheet = workbook.add_worksheet('FAT点表')
                     
-                    for col_idx, col_name in enumerate(fat_data.columns):
-                        value = row.get(col_name, "")
-                        # 处理空值
-                        if pd.isna(value):
-                            value = ""
-                        worksheet.write(row_idx, col_idx, value, common_style)
-                
-                # 保存工作簿
-                workbook.save(xls_output_path)
+                    # 所有单元格共用同一个格式
+                    common_style = workbook.add_format(FAT_CELL_FORMAT)
+                    
+                    # 写入表头
+                    worksheet.write_row(0, 0, output_columns, common_style)
+                    
+                    # 更新进度
+                    if export_window:
+                        export_window.setLabelText("正在写入数据...")
+                        export_window.setValue(80)
+                    
+                    # 进度最多刷新约20次，避免频繁的界面重绘拖慢写入
+                    progress_step = max(1, total_rows // 20)
+                    progress_label = "正在写入数据... ({}/" + f"{total_rows})"
+                    
+                    # 写入数据，逐行扫描object数组
+                    for row_idx, row in enumerate(values, 1):
+                        # 周期性更新进度
+                        if export_window and row_idx % progress_step == 0:
+                            progress = 80 + int((row_idx / total_rows) * 15)  # 从80%到95%的进度
+                            export_window.setValue(progress)
+                            export_window.setLabelText(progress_label.format(row_idx))
+                            QApplication.processEvents()
+                        
+                        worksheet.write_row(row_idx, 0, row, common_style)
                 
                 # 更新进度
                 if export_window:
                     export_window.setLabelText("正在完成操作...")
                     export_window.setValue(95)
                 
-                # 检查文件是否生成成功
-                if os.path.exists(xls_output_path) and os.path.getsize(xls_output_path) > 0:
+                # 检查文件是否生成成功，一次os.stat同时判断存在和大小
+                try:
+                    output_size = os.stat(xlsx_output_path).st_size
+                except OSError:
+                    output_size = 0
+                if output_size > 0:
                     result = True
                 else:
-                    raise ValueError(f"生成的文件不存在或为空: {xls_output_path}")
+                    raise ValueError(f"生成的文件不存在或为空: {xlsx_output_path}")
                 
                 # 关闭导出进度窗口
                 if export_window:
@@ -14,9 +14,13 @@
 该模块隔离了API访问逻辑，使系统更易于维护和扩展。
 """
 
+import sys
 import requests
 import json
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterable, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # 尝试导入PySide6，如果不可用则使用纯控制台输出
 try:
@@ -25,6 +29,20 @@ try:
 except ImportError:
     USE_GUI = False
 
+# 尝试导入orjson加速JSON编解码，如果不可用则使用标准库json
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# 尝试导入ijson，用于大体积响应的流式解析，如果不可用则整体解析
+try:
+    import ijson
+    USE_IJSON = True
+except ImportError:
+    USE_IJSON = False
+
 # 导入FormFields类用于字段访问
 from io_generator import FormFields
 
@@ -32,6 +50,104 @@ from io_generator import FormFields
 BASE_URL = "https://api.jiandaoyun.com/api"
 API_ENDPOINT = f"{BASE_URL}/v5/app/entry/data/list"
 
+# 响应体达到该大小时使用ijson流式解析（字节）
+STREAM_PARSE_THRESHOLD = 64 * 1024
+# 批量获取深化清单时每页的记录数（接口单次查询的上限）
+SHENHUA_PAGE_SIZE = 100
+# 单次响应允许读取的最大大小，防止异常响应占满内存（字节）
+MAX_RESPONSE_SIZE = 50 * 1024 * 1024
+
+def dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    将请求载荷编码为JSON字节串
+    
+    Args:
+        payload: 请求载荷字典
+        
+    Returns:
+        bytes: UTF-8编码的JSON数据
+    """
+    if USE_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+def loads_response(response: requests.Response) -> Any:
+    """
+    解析响应中的JSON数据
+    
+    解析失败时抛出json.JSONDecodeError（orjson的异常也是它的子类）
+    
+    Args:
+        response: HTTP响应对象
+        
+    Returns:
+        解析后的JSON数据
+    """
+    return loads_json(response.content)
+
+def loads_json(content: bytes) -> Any:
+    """
+    解析JSON字节串
+    
+    Args:
+        content: JSON数据
+        
+    Returns:
+        解析后的JSON数据
+    """
+    if USE_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def read_limited_content(response: requests.Response, max_size: int = MAX_RESPONSE_SIZE) -> bytes:
+    """
+    分块读取流式响应的内容，超过大小上限时立即停止读取
+    
+    Args:
+        response: 以stream=True发出的请求的响应对象
+        max_size: 允许读取的最大字节数
+        
+    Returns:
+        bytes: 响应内容
+        
+    Raises:
+        ValueError: 响应内容超过大小上限
+    """
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=STREAM_PARSE_THRESHOLD):
+        size += len(chunk)
+        if size > max_size:
+            raise ValueError(f"API响应超过 {max_size} 字节的上限，已停止读取")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+class LimitedReader:
+    """
+    为流式解析包装的文件对象，累计读取的字节数，超过大小上限时立即停止读取
+    
+    ijson直接从response.raw读取数据，不经过read_limited_content，
+    通过该包装使流式解析同样受MAX_RESPONSE_SIZE限制
+    """
+    
+    def __init__(self, raw, max_size: int = MAX_RESPONSE_SIZE):
+        self._raw = raw
+        self._max_size = max_size
+        self._size = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        """
+        读取数据并累计大小
+        
+        Raises:
+            ValueError: 累计读取的内容超过大小上限
+        """
+        chunk = self._raw.read(size)
+        self._size += len(chunk)
+        if self._size > self._max_size:
+            raise ValueError(f"API响应超过 {self._max_size} 字节的上限，已停止读取")
+        return chunk
+
 def show_message(title, message, message_type="error", parent=None):
     """
     显示消息，支持GUI和控制台两种方式
@@ -77,6 +193,34 @@ class JianDaoYunAPI:
         self.entry_id = entry_id
         self.field_mapping = field_mapping
         self.subform_field_id = subform_field_id
+        
+        # 预先计算各查询固定使用的字段列表，避免每次请求重复构建
+        # 字段ID统一驻留(intern)，后续作为字典键比较时可直接按引用命中
+        project_number_field = field_mapping.get(FormFields.MainForm.PROJECT_NUMBER)
+        self._project_number_field = sys.intern(project_number_field) if project_number_field else project_number_field
+        # 项目查询返回映射中的全部字段，并确保包含_id字段
+        self._fields_with_id = [sys.intern(field_id) for field_id in
+                                dict.fromkeys([*field_mapping.values(), "_id"]) if field_id]
+        # 批量获取深化清单时只取必要字段：_id、子表单以及场站、项目编号和项目名称
+        self._all_shenhua_fields = ["_id", subform_field_id] + [
+            field_id for field_name, field_id in field_mapping.items()
+            if field_name in ["场站", "项目编号", "项目名称"]
+        ]
+        # 项目查询载荷中固定不变的部分，每次查询只需补充过滤条件
+        self._search_payload_base = {
+            "app_id": self.app_id,             # 应用ID
+            "entry_id": self.entry_id,         # 表单ID
+            "limit": 100,                      # 最大返回数量
+            "fields": self._fields_with_id     # 需要返回的字段列表（包含_id）
+        }
+        
+        # 复用同一个会话，保持HTTP长连接，避免每次请求重新建立TCP/TLS连接
+        self._session = requests.Session()
+        self._session.headers.update(self.get_auth_header())
+        # 连接失败时自动重试（默认不会重试已发出的POST请求）
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self._session.mount("https://", adapter)
     
     def get_auth_header(self) -> Dict[str, str]:
         """
@@ -108,36 +252,24 @@ class JianDaoYunAPI:
             show_message("错误", "API凭证未配置，请在配置文件中设置有效的API_KEY")
             return []
             
-        # 指定要返回的字段，确保包含_id字段
-        fields = list(self.field_mapping.values())
-        # 添加_id字段，如果列表中不存在
-        if "_id" not in fields:
-            fields.append("_id")
-        
-        # 构建API请求载荷
+        # 构建API请求载荷：复用固定部分，只生成本次的查询条件
         payload = {
-            "app_id": self.app_id,         # 应用ID
-            "entry_id": self.entry_id,     # 表单ID
-            "limit": 100,                  # 最大返回数量
-            "fields": fields,              # 需要返回的字段列表
+            **self._search_payload_base,
             "filter": {                    # 查询条件
                 "rel": "and",              # 条件关系：且
                 "cond": [                  # 条件列表
                     {
-                        "field": self.field_mapping[FormFields.MainForm.PROJECT_NUMBER],  # 按项目编号字段过滤
-                        "operator": "eq",                                                 # 操作符：等于
-                        "value": project_number                                           # 查询值：项目编号
+                        "field": self._project_number_field,  # 按项目编号字段过滤
+                        "operator": "eq",                     # 操作符：等于
+                        "value": project_number               # 查询值：项目编号
                     }
                 ]
             }
         }
         
         try:
-            # 获取认证头
-            headers = self.get_auth_header()
-            
             # 发送API请求
-            response = requests.post(API_ENDPOINT, headers=headers, json=payload, timeout=10)
+            response = self._session.post(API_ENDPOINT, data=dumps_payload(payload), timeout=10)
             
             # 检查HTTP响应状态
             if response.status_code != 200:
@@ -146,20 +278,18 @@ class JianDaoYunAPI:
                 return []
             
             # 解析JSON响应
-            result = response.json()
+            result = loads_response(response)
             
             # 检查响应中是否包含数据
             if 'data' in result and isinstance(result['data'], list):
-                # 筛选出与指定项目编号匹配的记录
-                matched_data = []
-                for item in result['data']:
-                    # 确保记录中包含_id字段
-                    if '_id' not in item:
-                        print("警告: 记录中没有_id字段，可能无法查询详情")
-                        
-                    field_id = self.field_mapping[FormFields.MainForm.PROJECT_NUMBER]
-                    if item.get(field_id) == project_number:
-                        matched_data.append(item)
+                # 服务端已按项目编号过滤，这里只做一次防御性的匹配检查
+                matched_data = [item for item in result['data']
+                                if item.get(self._project_number_field) == project_number]
+                
+                # 确保记录中包含_id字段，缺失时汇总提示一次
+                missing_id_count = sum(1 for item in matched_data if '_id' not in item)
+                if missing_id_count:
+                    print(f"警告: {missing_id_count} 条记录中没有_id字段，可能无法查询详情")
                 
                 if matched_data:
                     return matched_data
@@ -198,9 +328,6 @@ class JianDaoYunAPI:
             return []
         
         try:
-            # 获取认证头
-            headers = self.get_auth_header()
-            
             # 构建API请求载荷
             payload = {
                 "app_id": self.app_id,     # 应用ID
@@ -219,7 +346,7 @@ class JianDaoYunAPI:
             }
             
             # 发送API请求获取数据
-            response = requests.post(API_ENDPOINT, headers=headers, json=payload, timeout=10)
+            response = self._session.post(API_ENDPOINT, data=dumps_payload(payload), timeout=10)
             
             # 检查HTTP响应状态
             if response.status_code != 200:
@@ -228,7 +355,7 @@ class JianDaoYunAPI:
                 return []
             
             # 解析JSON响应
-            result = response.json()
+            result = loads_response(response)
             
             # 判断是否有数据返回
             if 'data' not in result or not isinstance(result['data'], list) or not result['data']:
@@ -268,10 +395,137 @@ class JianDaoYunAPI:
             show_message("未知错误", error_msg)
             return []
 
+    def _fetch_record_by_id(self, data_id: str) -> Optional[Dict[str, Any]]:
+        """
+        按数据ID获取单条主表单记录
+        
+        不弹出任何提示，错误以异常形式抛出，可以安全地在工作线程中调用。
+        
+        Args:
+            data_id: 表单数据ID
+            
+        Returns:
+            dict: 记录数据，未找到时返回None
+        """
+        payload = {
+            "app_id": self.app_id,     # 应用ID
+            "entry_id": self.entry_id, # 表单ID
+            "limit": 1,                # 只需要1条记录
+            "fields": self._all_shenhua_fields,  # 只获取必要字段
+            "filter": {                # 查询条件
+                "rel": "and",
+                "cond": [
+                    {"field": "_id", "operator": "eq", "value": data_id}
+                ]
+            }
+        }
+        
+        response = self._session.post(API_ENDPOINT, data=dumps_payload(payload), timeout=10)
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError(
+                f"API请求失败，HTTP错误: {response.status_code}\n错误详情: {response.text}",
+                response=response
+            )
+        
+        result = loads_response(response)
+        data = result.get('data') if isinstance(result, dict) else None
+        if not isinstance(data, list) or not data:
+            return None
+        return data[0]
+    
+    def get_shenhua_by_id(self, data_id: str, raise_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        获取单条记录的深化清单数据
+        
+        只按_id查询一条主表单记录，返回结构与get_all_shenhua_data中的元素一致
+        （包含_id、深化清单子表单以及场站、项目编号和项目名称字段）。
+        
+        Args:
+            data_id: 表单数据ID
+            raise_errors: 为True时不弹出任何提示，请求和解析错误直接抛出，
+                          由调用方决定如何处理（例如退回到批量获取）
+            
+        Returns:
+            dict: 记录数据，未找到时返回None；raise_errors为False时发生错误也返回None
+        
+        Raises:
+            requests.exceptions.RequestException: raise_errors为True且请求失败
+            ValueError: raise_errors为True且API凭证未配置或响应无法解析
+        """
+        if raise_errors:
+            if not self.api_key:
+                raise ValueError("API凭证未配置")
+            return self._fetch_record_by_id(data_id)
+        
+        # 检查API凭证是否已设置
+        if not self.api_key:
+            show_message("错误", "API凭证未配置")
+            return None
+        
+        try:
+            record = self._fetch_record_by_id(data_id)
+            if record is None:
+                show_message("数据错误", "API响应中没有找到有效数据")
+            return record
+            
+        except requests.exceptions.RequestException as e:
+            show_message("网络错误", f"网络请求错误: {str(e)}")
+            return None
+        except json.JSONDecodeError as e:
+            show_message("解析错误", f"JSON解析错误: {str(e)}")
+            return None
+        except Exception as e:
+            show_message("未知错误", f"获取深化清单数据时发生未知错误: {str(e)}")
+            return None
+    
+    def get_shenhua_details_bulk(self, data_ids: Iterable[str],
+                                 max_workers: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        并发获取多条记录的深化清单详情
+        
+        请求在线程池中并发执行，共享会话的连接池；工作线程中不弹出消息框，
+        所有错误在全部请求完成后统一提示一次。单条记录获取失败不影响其他记录的结果。
+        
+        Args:
+            data_ids: 表单数据ID列表
+            max_workers: 最大并发请求数，默认与连接池大小一致
+        
+        Returns:
+            dict: {数据ID: 深化清单子表单数据列表}，获取失败的ID对应空列表
+        """
+        # 检查API凭证是否已设置
+        if not self.api_key:
+            show_message("错误", "API凭证未配置")
+            return {}
+        
+        results = {}
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch_record_by_id, data_id): data_id
+                       for data_id in dict.fromkeys(data_ids)}
+            for future in as_completed(futures):
+                data_id = futures[future]
+                try:
+                    record = future.result()
+                except Exception as e:
+                    # 任何异常都只记录到对应ID，已获取的结果继续保留
+                    errors.append(f"{data_id}: {str(e)}")
+                    record = None
+                
+                results[data_id] = (record or {}).get(self.subform_field_id) or []
+        
+        if errors:
+            show_message("网络错误", "以下记录的深化清单详情获取失败:\n" + "\n".join(errors))
+        
+        return results
+    
     def get_all_shenhua_data(self) -> List[Dict[str, Any]]:
         """
         获取所有深化清单数据
         
+        接口单次最多返回SHENHUA_PAGE_SIZE条记录，按data_id游标逐页获取直到取完；
+        每页都依赖上一页最后一条记录的_id，因此只能顺序请求
+        
         Returns:
             list: 所有深化清单数据列表
         """
@@ -281,41 +535,57 @@ class JianDaoYunAPI:
             return []
         
         try:
-            # 获取认证头
-            headers = self.get_auth_header()
-            
             # 构建API请求载荷 - 不设置筛选条件，获取所有数据
             payload = {
                 "app_id": self.app_id,     # 应用ID
                 "entry_id": self.entry_id, # 表单ID
-                "limit": 100,              # 最大返回数量
-                "fields": ["_id", self.subform_field_id]  # 只获取必要字段
+                "limit": SHENHUA_PAGE_SIZE,  # 每页最大返回数量
+                "fields": self._all_shenhua_fields  # 只获取必要字段
             }
             
-            # 添加场站和项目编号字段
-            for field_name, field_id in self.field_mapping.items():
-                if field_name in ["场站", "项目编号", "项目名称"]:
-                    payload["fields"].append(field_id)
-            
-            # 发送API请求获取数据
-            response = requests.post(API_ENDPOINT, headers=headers, json=payload, timeout=15)
-            
-            # 检查HTTP响应状态
-            if response.status_code != 200:
-                error_msg = f"API请求失败，HTTP错误: {response.status_code}\n错误详情: {response.text}"
-                show_message("API错误", error_msg)
-                return []
-            
-            # 解析JSON响应
-            result = response.json()
+            # 接口每次最多返回一页数据，以上一页最后一条记录的_id作为data_id继续获取，
+            # 直到返回的记录不足一页
+            all_data = []
+            while True:
+                # 发送API请求获取数据，以流式方式读取响应体
+                with self._session.post(API_ENDPOINT, data=dumps_payload(payload),
+                                        timeout=15, stream=True) as response:
+                    
+                    # 检查HTTP响应状态
+                    if response.status_code != 200:
+                        error_msg = f"API请求失败，HTTP错误: {response.status_code}\n错误详情: {response.text}"
+                        show_message("API错误", error_msg)
+                        return []
+                    
+                    # 响应头声明的大小超过上限时直接放弃读取
+                    content_length = int(response.headers.get("Content-Length") or 0)
+                    if content_length > MAX_RESPONSE_SIZE:
+                        show_message("数据错误", f"API响应过大（{content_length} 字节），已取消读取")
+                        return []
+                    
+                    if USE_IJSON and (content_length == 0 or content_length >= STREAM_PARSE_THRESHOLD):
+                        # 大体积或未知大小的响应：边接收边解析data数组中的记录，
+                        # 读取的字节数同样受MAX_RESPONSE_SIZE限制（分块传输时没有Content-Length）
+                        response.raw.decode_content = True
+                        page = list(ijson.items(LimitedReader(response.raw), "data.item", use_float=True))
+                    else:
+                        # 小体积响应：整体读取后解析
+                        result = loads_json(read_limited_content(response))
+                        data = result.get('data') if isinstance(result, dict) else None
+                        page = data if isinstance(data, list) else []
+                
+                all_data.extend(page)
+                last_id = page[-1].get("_id") if len(page) >= SHENHUA_PAGE_SIZE else None
+                if not last_id:
+                    break
+                payload["data_id"] = last_id
             
             # 判断是否有数据返回
-            if 'data' not in result or not isinstance(result['data'], list) or not result['data']:
+            if not all_data:
                 show_message("数据错误", "API响应中没有找到有效数据")
                 return []
             
             # 获取所有数据
-            all_data = result['data']
             return all_data
             
         except requests.exceptions.RequestException as e:
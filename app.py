@@ -8,7 +8,7 @@
 
 import sys
 import traceback
-from PySide6.QtWidgets import QApplication, QMessageBox
+import importlib.util
 
 # 导入配置
 from config.api_config import (
@@ -18,9 +18,7 @@ from config.api_config import (
 )
 from config.settings import UI_TITLE, UI_WIDTH, UI_HEIGHT
 
-# 从api模块导入JianDaoYunAPI
-from api import JianDaoYunAPI
-from ui_pyside import ProjectQueryApp
+# PySide6、API客户端和界面模块在main()中按需导入，缩短启动时间
 
 def main():
     """
@@ -31,15 +29,21 @@ def main():
     print("深化设计数据查询工具启动中...")
     print("=" * 50)
     
+    # 在PySide6导入之前发生的错误只能输出到控制台
+    QMessageBox = None
+    
     try:
-        # 检查PySide6是否已安装
-        try:
-            import PySide6
-            print("正在启动界面...")
-        except ImportError:
+        # 检查PySide6是否已安装（只查找模块，不实际加载）
+        if importlib.util.find_spec("PySide6") is None:
             print("导入PySide6失败，请确保已安装PySide6。")
             print("尝试使用命令安装: pip install PySide6")
             return 1
+        print("正在启动界面...")
+        
+        from PySide6.QtWidgets import QApplication, QMessageBox
+        # 从api模块导入JianDaoYunAPI
+        from api import JianDaoYunAPI
+        from ui_pyside import ProjectQueryApp
             
         # 检查API凭证是否已设置
         if not API_KEY:
@@ -76,7 +80,8 @@ def main():
     except Exception as e:
         error_message = f"程序发生错误: {str(e)}\n\n{traceback.format_exc()}"
         print(error_message)
-        QMessageBox.critical(None, "程序错误", error_message)
+        if QMessageBox is not None:
+            QMessageBox.critical(None, "程序错误", error_message)
         return 1
 
 if __name__ == "__main__":
@@ -4,6 +4,9 @@ API配置
 包括API凭证、应用信息以及字段映射关系
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # ===================== 通用 API 配置 =====================
 
 # 简道云API凭证（公共部分）
@@ -66,24 +69,57 @@ APPLICATIONS = {
     }
 }
 
+def _freeze(value):
+    """递归地将嵌套字典转换为只读的MappingProxyType"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+# 配置在运行期间不可修改，下面的查找表和缓存都依赖这一点
+APPLICATIONS = _freeze(APPLICATIONS)
+
 # ===================== 便捷访问函数 =====================
 
+_EMPTY_MAPPING = MappingProxyType({})
+
+# 模块加载时将APPLICATIONS展开为扁平的查找表，访问函数只需一次字典查找
+_APP_ID_BY_NAME = {
+    app_name: app_config.get("APP_ID")
+    for app_name, app_config in APPLICATIONS.items()
+}
+_ENTRY_ID_BY_KEY = {
+    (app_name, form_name): form_config.get("ENTRY_ID")
+    for app_name, app_config in APPLICATIONS.items()
+    for form_name, form_config in app_config.get("表单", _EMPTY_MAPPING).items()
+}
+# 字段映射本身已是只读视图，直接返回不会让调用方修改缓存结果和原始配置
+_FIELD_MAP_BY_KEY = {
+    (app_name, form_name): form_config.get("字段映射", _EMPTY_MAPPING)
+    for app_name, app_config in APPLICATIONS.items()
+    for form_name, form_config in app_config.get("表单", _EMPTY_MAPPING).items()
+}
+
+# 配置在运行期间不会变化，访问函数的结果可以直接缓存
+
+@lru_cache(maxsize=None)
 def get_app_id(app_name):
     """获取指定应用的APP_ID"""
-    return APPLICATIONS.get(app_name, {}).get("APP_ID")
+    return _APP_ID_BY_NAME.get(app_name)
 
+@lru_cache(maxsize=None)
 def get_entry_id(app_name, form_name):
     """获取指定应用下指定表单的ENTRY_ID"""
-    return APPLICATIONS.get(app_name, {}).get("表单", {}).get(form_name, {}).get("ENTRY_ID")
+    return _ENTRY_ID_BY_KEY.get((app_name, form_name))
 
+@lru_cache(maxsize=None)
 def get_field_mapping(app_name, form_name):
-    """获取指定应用下指定表单的字段映射"""
-    return APPLICATIONS.get(app_name, {}).get("表单", {}).get(form_name, {}).get("字段映射", {})
+    """获取指定应用下指定表单的字段映射（只读）"""
+    return _FIELD_MAP_BY_KEY.get((app_name, form_name), _EMPTY_MAPPING)
 
+@lru_cache(maxsize=None)
 def get_field_id(app_name, form_name, field_name):
     """获取指定应用下指定表单中指定字段的ID"""
-    field_mapping = get_field_mapping(app_name, form_name)
-    return field_mapping.get(field_name)
+    return _FIELD_MAP_BY_KEY.get((app_name, form_name), _EMPTY_MAPPING).get(field_name)
 
 # 为了向后兼容，保留原有变量名
 # 深化设计应用
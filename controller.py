@@ -9,10 +9,54 @@
 """
 
 import os
+from functools import lru_cache
 
 # 导入数据访问层和数据服务
 from data_service import  DataServiceFactory
 
+
+def _preflight_write(path):
+    """
+    导出前检查目标路径是否可写
+    
+    只使用os.stat/os.access查询文件系统元数据，不打开或创建目标文件
+    
+    Args:
+        path: 输出文件路径
+        
+    Raises:
+        FileNotFoundError: 目标目录不存在
+        PermissionError: 目标目录或已存在的目标文件不可写
+    """
+    parent_dir = os.path.dirname(os.path.abspath(path)) or "."
+    if not os.path.isdir(parent_dir):
+        raise FileNotFoundError(f"目标目录不存在: {parent_dir}")
+    if not os.access(parent_dir, os.W_OK):
+        raise PermissionError(f"无法写入文件: {path}")
+    
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        # 目标文件尚不存在，目录可写即可
+        return
+    if not os.access(path, os.W_OK):
+        raise PermissionError(f"无法写入文件: {path}")
+
+
+@lru_cache(maxsize=None)
+def _upload_functions():
+    """
+    延迟导入上传模块
+    
+    上传模块依赖网络库和点表生成器，首次生成点表时才导入，之后直接返回缓存的函数
+    
+    Returns:
+        tuple: (upload_hmi_table, upload_plc_table, upload_fat_table)
+    """
+    from upload import upload_hmi_table, upload_plc_table, upload_fat_table
+    return upload_hmi_table, upload_plc_table, upload_fat_table
+
+
 class ProjectController:
     """项目控制器类，处理业务逻辑"""
     
@@ -36,12 +80,13 @@ class ProjectController:
         self.uploaded_io_data = None
         self.uploaded_io_file_path = None
     
-    def search_project_data(self, project_number):
+    def search_project_data(self, project_number, force_refresh=False):
         """
         执行项目查询
         
         Args:
             project_number: 项目编号
+            force_refresh: 是否忽略缓存重新查询
             
         Returns:
             项目数据列表
@@ -50,7 +95,7 @@ class ProjectController:
             raise ValueError("项目编号不能为空")
             
         # 调用项目数据服务查询数据
-        return self.project_data_service.search_project_data(project_number)
+        return self.project_data_service.search_project_data(project_number, force_refresh=force_refresh)
     
     def clear_data(self):
         """清空所有数据"""
@@ -95,14 +140,9 @@ class ProjectController:
         if not self.current_equipment_data:
             raise ValueError("没有可用的设备数据")
         
-        # 检查文件是否可写
-        try:
-            with open(output_path, 'a') as f:
-                pass  # 只是测试文件是否可写
-        except PermissionError:
-            raise PermissionError(f"无法写入文件: {output_path}")
-        except Exception as e:
-            raise Exception(f"文件访问错误: {str(e)}")
+        # 检查目标路径是否可写，不预先打开目标文件（避免创建空文件）
+        # 文件被占用等其他写入错误由导出过程直接抛出
+        _preflight_write(output_path)
             
         # 使用Excel数据服务导出到Excel
         return self.excel_data_service.export_io_table_to_excel(self.current_equipment_data, output_path)
@@ -161,8 +201,8 @@ class ProjectController:
         # 使用IO点表数据服务生成HMI点表
         hmi_data = self.io_point_data_service.generate_hmi_table(self.uploaded_io_data)
         
-        # 导入上传模块
-        from upload import upload_hmi_table
+        # 获取上传函数（首次调用时导入上传模块）
+        upload_hmi_table, _, _ = _upload_functions()
         
         # 调用生成并上传HMI点表的函数
         upload_hmi_table(
@@ -186,8 +226,8 @@ class ProjectController:
         # 使用IO点表数据服务生成PLC点表
         plc_data = self.io_point_data_service.generate_plc_table(self.uploaded_io_data)
         
-        # 导入上传模块
-        from upload import upload_plc_table
+        # 获取上传函数（首次调用时导入上传模块）
+        _, upload_plc_table, _ = _upload_functions()
         
         # 调用生成并上传PLC点表的函数
         upload_plc_table(
@@ -211,8 +251,8 @@ class ProjectController:
         # 使用IO点表数据服务生成FAT点表
         fat_data = self.io_point_data_service.generate_fat_table(self.uploaded_io_data)
         
-        # 导入上传模块
-        from upload import upload_fat_table
+        # 获取上传函数（首次调用时导入上传模块）
+        _, _, upload_fat_table = _upload_functions()
         
         # 调用生成并上传FAT点表的函数
         upload_fat_table(
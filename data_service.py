@@ -9,9 +9,63 @@
 负责数据的格式化、转换和验证。
 """
 
+import time
+from itertools import repeat
+
+import numpy as np
 import pandas as pd
+from requests.exceptions import RequestException
+from pandas.api.types import is_numeric_dtype
 from io_generator import IOChannelCalculator, FormFields
 
+# 尝试导入calamine（Rust实现的Excel解析库），pandas 2.2及以上版本可用作read_excel的引擎
+try:
+    import python_calamine  # noqa: F401
+    USE_CALAMINE = tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+except ImportError:
+    USE_CALAMINE = False
+
+# IO点表验证使用的有效值集合
+VALID_POWER_TYPES = frozenset(("有源", "无源"))
+VALID_BOOL_WIRE_TYPES = frozenset(("常开", "常闭", "二线制", "2线制", "两线制", "三线制", "四线制"))
+VALID_REAL_WIRE_TYPES = frozenset(("2线制", "二线制", "三线制", "四线制", "两线制"))
+
+# 项目查询结果的缓存有效期（秒）
+SEARCH_CACHE_TTL = 60
+# 最多缓存的项目查询结果数量，超出时淘汰最久未使用的结果
+SEARCH_CACHE_MAX_SIZE = 32
+
+# 深化清单数据的缓存有效期（秒），过期后再次选中项目时重新获取
+SHENHUA_CACHE_TTL = 300
+
+# IO点表中的纯文本列，读取时直接按字符串处理，跳过类型推断
+IO_TABLE_TEXT_COLUMNS = (
+    "变量名称（HMI）", "变量描述", "数据类型", "模块类型", "供电类型（有源/无源）", "线制"
+)
+
+# 取值范围检查规则：(错误类别, 列名, 有效值集合, 前提条件, 为空时的错误信息, 无效值的错误信息)
+# 前提条件为(列名, 值, 是否相等)，如("模块类型", "AO", False)表示只检查模块类型不是AO的行；
+# 值为"/"的单元格表示不适用，跳过检查
+CHOICE_RULES = (
+    ("供电类型错误", "供电类型（有源/无源）", VALID_POWER_TYPES, ("模块类型", "AO", False),
+     "供电类型为空", "供电类型必须是有源或无源"),
+    ("数字量线制错误", "线制", VALID_BOOL_WIRE_TYPES, ("数据类型", "BOOL", True),
+     "线制为空", "BOOL类型的线制不是有效值"),
+    ("模拟量线制错误", "线制", VALID_REAL_WIRE_TYPES, ("数据类型", "REAL", True),
+     "线制为空", "REAL类型的线制不是有效值"),
+)
+
+# 验证结果中各类错误的输出顺序
+ERROR_CATEGORIES = (
+    *(rule[0] for rule in CHOICE_RULES), "设定值超出量程范围", "设定值顺序错误"
+)
+
+# REAL类型的设定值字段（按从低到高的顺序）及需要满足前小后大关系的设定值对
+SET_POINT_FIELDS = ("SLL设定值", "SL设定值", "SH设定值", "SHH设定值")
+SET_POINT_ORDER_PAIRS = tuple(zip(SET_POINT_FIELDS, SET_POINT_FIELDS[1:]))
+# 设定值单元格为这些值时表示未设置，跳过验证
+UNSET_SET_POINT_VALUES = frozenset(("", "/"))
+
 class ProjectDataService:
     """
     项目数据服务类
@@ -31,38 +85,132 @@ class ProjectDataService:
         self.field_mapping = field_mapping
         self.shenhua_field_mapping = shenhua_field_mapping
         
+        # 预先解析常用字段ID和深化清单字段映射，避免每次加载设备数据时重复查找
+        self._station_fid = field_mapping.get(FormFields.MainForm.STATION)
+        self._project_fid = field_mapping.get(FormFields.MainForm.PROJECT_NUMBER)
+        # 深化清单的显示字段名和对应字段ID，按相同顺序保存为两个元组
+        self._shenhua_names = tuple(shenhua_field_mapping.keys())
+        self._shenhua_ids = tuple(shenhua_field_mapping.values())
+        
         # 保存项目数据
         self.project_data = []
         
+        # 最近的项目查询结果缓存：{项目编号: (查询时间, 项目数据列表)}
+        self._search_cache = {}
+        
         # 保存所有设备数据，用于本地筛选
         self.all_equipment_data = []
         
-        # 保存所有深化清单数据（所有项目）
+        # 保存所有深化清单数据（所有项目），仅供批量处理使用
         self.all_shenhua_data = []
         
-        # 保存当前选中项目的设备数据
+        # 按_id缓存已获取的深化清单数据，选中项目时按需获取：{_id: (获取时间, 深化清单数据)}
+        self._shenhua_by_id = {}
+        
+        # 保存当前选中项目的设备数据及其所属的深化清单数据ID
         self.current_equipment_data = []
+        self._current_data_id = None
     
-    def search_project_data(self, project_number):
+    def search_project_data(self, project_number, force_refresh=False):
         """
         执行项目查询
         
+        短时间内重复查询同一项目编号时直接返回缓存结果，
+        缓存按最近使用顺序保存，超出数量上限时淘汰最久未使用的结果
+        
         Args:
             project_number: 项目编号
+            force_refresh: 是否忽略缓存重新查询
             
         Returns:
             项目数据列表
         """
+        now = time.monotonic()
+        cached = self._search_cache.pop(project_number, None)
+        if cached and not force_refresh and now - cached[0] < SEARCH_CACHE_TTL:
+            # 重新插入到末尾，标记为最近使用
+            self._search_cache[project_number] = cached
+            self.project_data = cached[1]
+            return self.project_data
+        
         # 调用API查询数据
         self.project_data = self.api_client.search_project_data(project_number)
+        
+        # 只缓存有结果的查询，查询失败或无结果时下次仍然请求API
+        if self.project_data:
+            self._search_cache[project_number] = (now, self.project_data)
+            if len(self._search_cache) > SEARCH_CACHE_MAX_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
         return self.project_data
     
     def clear_data(self):
         """清空所有数据"""
         self.project_data = []
+        self._search_cache = {}
         self.all_equipment_data = []
         self.all_shenhua_data = []
+        self._shenhua_by_id = {}
         self.current_equipment_data = []
+        self._current_data_id = None
+    
+    def load_all_shenhua_data(self):
+        """
+        批量获取所有深化清单数据，并按_id建立索引
+        
+        索引与按需获取共用同一个缓存，之后选中任意项目时直接按_id查找，无需逐条扫描
+        
+        Returns:
+            所有深化清单数据列表
+        """
+        self.all_shenhua_data = self.api_client.get_all_shenhua_data()
+        
+        now = time.monotonic()
+        self._shenhua_by_id.update(
+            (item["_id"], (now, item)) for item in self.all_shenhua_data if item.get("_id")
+        )
+        return self.all_shenhua_data
+    
+    def _get_shenhua_record(self, data_id):
+        """
+        获取指定项目的深化清单数据
+        
+        缓存未过期时直接返回缓存；过期后重新获取，获取失败时继续使用过期的缓存数据，
+        避免网络异常时已查看过的项目无法显示。
+        子表单数据已在加载后释放的缓存只保留了表头字段，不能直接使用，需要重新获取。
+        按_id查询发生请求或解析错误时，退回到批量获取所有深化清单数据后按_id查找；
+        查询成功但没有该记录时视为未找到，不再批量获取
+        
+        Args:
+            data_id: 深化清单数据ID
+            
+        Returns:
+            深化清单数据，获取失败且无缓存时返回None
+        """
+        now = time.monotonic()
+        cached = self._shenhua_by_id.get(data_id)
+        if cached and cached[1].get(self.api_client.subform_field_id) is None:
+            cached = None
+        if cached and now - cached[0] < SHENHUA_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            # 单条查询不弹出提示，出错时只由批量获取提示一次
+            selected_data = self.api_client.get_shenhua_by_id(data_id, raise_errors=True)
+        except (RequestException, ValueError):
+            # JSON解析错误也是ValueError的子类
+            self.load_all_shenhua_data()
+            selected_data = self._shenhua_by_id.get(data_id, (now, None))[1]
+        else:
+            if selected_data is None:
+                # 记录已不存在，丢弃该项目的缓存
+                self._shenhua_by_id.pop(data_id, None)
+                return None
+        
+        if selected_data:
+            self._shenhua_by_id[data_id] = (now, selected_data)
+            return selected_data
+        
+        return cached[1] if cached else None
     
     def load_equipment_data(self, project):
         """
@@ -82,25 +230,22 @@ class ProjectDataService:
             raise ValueError("无法获取项目数据ID (_id)")
         
         # 获取场站名称和项目编号
-        field_id = self.field_mapping.get(FormFields.MainForm.STATION)  # 使用FormFields中定义的常量
-        station_name = project.get(field_id, "[未知场站]")
+        station_name = project.get(self._station_fid, "[未知场站]")
+        project_number = project.get(self._project_fid, "[未知项目]")
         
-        field_id = self.field_mapping.get(FormFields.MainForm.PROJECT_NUMBER)  # 使用FormFields中定义的常量
-        project_number = project.get(field_id, "[未知项目]")
+        # 重复选中当前项目且缓存未过期时，直接使用已转换好的设备数据
+        cached = self._shenhua_by_id.get(data_id)
+        if (data_id == self._current_data_id and self.current_equipment_data
+                and cached and time.monotonic() - cached[0] < SHENHUA_CACHE_TTL):
+            return self.current_equipment_data, station_name, project_number
         
-        # 如果缓存为空则加载所有数据
-        if not self.all_shenhua_data:
-            # 获取所有深化清单数据
-            self.all_shenhua_data = self.api_client.get_all_shenhua_data()
-        
-        # 筛选出当前选中项目的数据
-        selected_data = None
-        for item in self.all_shenhua_data:
-            if item.get('_id') == data_id:
-                selected_data = item
-                break
+        # 只获取当前选中项目的深化清单数据，缓存未过期时直接使用
+        selected_data = self._get_shenhua_record(data_id)
         
         if not selected_data or self.api_client.subform_field_id not in selected_data:
+            # 重新获取失败时，当前项目仍使用已转换好的设备数据，网络异常时不至于无法显示
+            if data_id == self._current_data_id and self.current_equipment_data:
+                return self.current_equipment_data, station_name, project_number
             return None, station_name, project_number
         
         # 获取子表单数据
@@ -109,21 +254,27 @@ class ProjectDataService:
         if not detail_data:
             return None, station_name, project_number
         
+        # 添加该设备数据所属的场站信息，便于区分
+        source_info = {"_station": station_name, "_project": project_number, "_data_id": data_id}
+        
         # 将获取到的数据转换为显示格式并添加到设备列表中
-        equipment_list = []
-        for item in detail_data:
-            formatted_item = {}
-            for field_name, field_id in self.shenhua_field_mapping.items():
-                formatted_item[field_name] = item.get(field_id, "")
-            
-            # 添加该设备数据所属的场站信息，便于区分
-            formatted_item["_station"] = station_name
-            formatted_item["_project"] = project_number
-            formatted_item["_data_id"] = data_id
-            equipment_list.append(formatted_item)
+        # 按字段ID元组整体取值（缺失字段取空字符串），字段投影在map/zip内部完成
+        names, field_ids = self._shenhua_names, self._shenhua_ids
+        equipment_list = [
+            dict(zip(names, map(item.get, field_ids, repeat(""))), **source_info)
+            for item in detail_data
+        ]
         
         # 保存当前选中项目的设备数据，用于生成IO点表
         self.current_equipment_data = equipment_list
+        self._current_data_id = data_id
+        
+        # 子表单数据已转换到设备列表中，缓存换成不含子表单的表头副本以释放原始子表单，
+        # 缓存时间保持不变；原记录可能同时被all_shenhua_data引用，不能在原字典上修改
+        cached_at = self._shenhua_by_id.get(data_id, (time.monotonic(),))[0]
+        header = {key: value for key, value in selected_data.items()
+                  if key != self.api_client.subform_field_id}
+        self._shenhua_by_id[data_id] = (cached_at, header)
         
         return equipment_list, station_name, project_number
 
@@ -152,153 +303,204 @@ class ExcelDataService:
         # 导出到Excel，传递设备列表获得更详细的报表
         return IOChannelCalculator.export_to_excel(channel_data, output_path, equipment_data)
     
+    @staticmethod
+    def _column(df, column, default):
+        """
+        获取一列数据，列不存在时返回以默认值填充的列
+        
+        Args:
+            df: pandas DataFrame
+            column: 列名
+            default: 列不存在时使用的默认值
+            
+        Returns:
+            pandas Series
+        """
+        if column in df.columns:
+            return df[column]
+        return pd.Series(default, index=df.index, dtype=object)
+    
+    @staticmethod
+    def _float_values(values, mask, text=None):
+        """
+        将一列数据中掩码选中的值转换为浮点数组，未选中或无法转换的位置为NaN
+        
+        Excel中的数值列读取后已经是数值类型，直接整列转换；
+        混有文本的列去除空白后由pd.to_numeric整列解析，无法解析的值记为NaN
+        
+        Args:
+            values: 待转换的列(Series)
+            mask: 需要转换的行(NumPy布尔数组)
+            text: 调用方已经去除空白的文本列，传入时不再重复转换
+            
+        Returns:
+            NumPy浮点数组
+        """
+        if is_numeric_dtype(values):
+            return np.where(mask, values.to_numpy(dtype=float, na_value=np.nan), np.nan)
+        if text is None:
+            text = values.astype(str).str.strip()
+        return pd.to_numeric(text.where(mask), errors="coerce").to_numpy(dtype=float)
+    
     @staticmethod
     def validate_io_table(df):
         """
         验证IO点表数据
         
+        按列计算各项检查的布尔掩码，只对不通过的行生成错误信息
+        
         Args:
             df: pandas DataFrame，包含IO点表数据
             
         Returns:
             验证结果字典
         """
-        # 创建错误信息列表
-        invalid_power_type = []
-        invalid_wire_type_bool = []
-        invalid_wire_type_real = []
-        invalid_range_values = []  # 新增：超出量程范围的错误列表
-        invalid_order_values = []
-        
-        # 验证每一行
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # Excel行号从2开始（跳过表头）
+        # 空表没有需要验证的行
+        if df is None or len(df) == 0:
+            return {"has_errors": False, "errors": []}
+        
+        column = ExcelDataService._column
+        float_values_of = ExcelDataService._float_values
+        
+        # 按错误类别收集错误信息，元素为(行位置, 行内顺序, 错误信息)，最后按行排序
+        errors_by_category = {title: [] for title in ERROR_CATEGORIES}
+        invalid_range_values = errors_by_category["设定值超出量程范围"]
+        invalid_order_values = errors_by_category["设定值顺序错误"]
+        
+        # 预先生成每行错误信息的前缀"第N行: "，Excel行号从2开始（跳过表头）
+        prefixes = np.char.add(np.char.add("第", (df.index.to_numpy() + 2).astype(str)), "行: ")
+        
+        # 以下所有掩码都预先提取为NumPy布尔数组，组合时不再经过pandas的索引对齐
+        # 检查变量名称（HMI）是否为空，如果为空则跳过该行的所有验证
+        var_name = column(df, "变量名称（HMI）", "")
+        checked = ~(var_name.isna() | var_name.astype(str).str.strip().eq("")).to_numpy()
+        
+        # 所有行的变量名称都为空时，没有需要验证的行
+        if not checked.any():
+            return {"has_errors": False, "errors": []}
+        
+        # 获取每一行的数据类型
+        data_type = column(df, "数据类型", None)
+        is_real = checked & data_type.eq("REAL").to_numpy()
+        
+        # 各列去除空白后的文本和空值掩码，同一列被多条规则使用时只转换一次
+        normalized = {}
+        
+        # 按规则表检查取值范围，每条规则对整列只计算一次掩码
+        for title, field, valid_values, (cond_field, cond_value, cond_equal), empty_msg, invalid_msg in CHOICE_RULES:
+            cond = column(df, cond_field, None).eq(cond_value).to_numpy()
+            applies = checked & (cond if cond_equal else ~cond)
+            # 没有需要检查的行时（如点表中没有BOOL点），跳过该列的转换
+            if not applies.any():
+                continue
             
-            # 检查变量名称（HMI）是否为空，如果为空则跳过该行的所有验证
-            var_name = row.get("变量名称（HMI）", "")
-            if pd.isna(var_name) or str(var_name).strip() == "":
+            if field not in normalized:
+                values = column(df, field, "")
+                text = values.astype(str).str.strip()
+                is_na = values.isna().to_numpy()
+                normalized[field] = (
+                    values.to_numpy(dtype=object),
+                    text,
+                    ~is_na & text.eq("/").to_numpy(),  # 值为"/"表示不适用
+                    is_na | text.eq("").to_numpy(),
+                )
+            raw_values, text, not_applicable, blank = normalized[field]
+            
+            # 跳过值为"/"的情况
+            field_checked = applies & ~not_applicable
+            empty = field_checked & blank
+            invalid = field_checked & ~empty & ~text.isin(valid_values).to_numpy()
+            
+            # 空值和无效值合并为一个掩码，按行号顺序一次生成该规则的全部错误信息
+            errors_by_category[title].extend(
+                (pos, 0, f"{prefixes[pos]}{empty_msg}" if empty[pos]
+                 else f"{prefixes[pos]}{invalid_msg}，当前值: {raw_values[pos]}")
+                for pos in np.flatnonzero(empty | invalid)
+            )
+        
+        # 对REAL类型进行设定值相关验证，先检查量程值是否有效
+        range_low = column(df, "量程低限", None)
+        range_high = column(df, "量程高限", None)
+        range_missing = is_real & (range_low.isna() | range_high.isna()).to_numpy()
+        
+        low_values = float_values_of(range_low, is_real)
+        high_values = float_values_of(range_high, is_real)
+        range_not_number = is_real & ~range_missing & (np.isnan(low_values) | np.isnan(high_values))
+        range_inverted = is_real & ~range_missing & ~range_not_number & (low_values >= high_values)
+        valid_range = is_real & ~range_missing & ~range_not_number & ~range_inverted
+        
+        invalid_range_values.extend(
+            (pos, 0, f"{prefixes[pos]}量程低限或量程高限未设置")
+            for pos in np.flatnonzero(range_missing)
+        )
+        invalid_range_values.extend(
+            (pos, 0, f"{prefixes[pos]}量程低限或量程高限不是有效数字")
+            for pos in np.flatnonzero(range_not_number)
+        )
+        invalid_range_values.extend(
+            (pos, 0, f"{prefixes[pos]}量程设置错误，低限 {low_values[pos]} 应小于高限 {high_values[pos]}")
+            for pos in np.flatnonzero(range_inverted)
+        )
+        
+        # 收集并验证各设定值
+        set_point_values = {}
+        for order, field in enumerate(SET_POINT_FIELDS, 1):
+            if field not in df.columns:
                 continue
             
-            # 获取此行的数据类型
-            data_type = row.get("数据类型")
+            field_value = df[field]
+            if is_numeric_dtype(field_value):
+                # 数值列只可能以NaN表示未设置，无需转换为文本
+                field_text = None
+                field_checked = is_real & field_value.notna().to_numpy()
+            else:
+                field_text = field_value.astype(str).str.strip()
+                # 如果是NaN、空字符串或"/"，则跳过验证
+                field_checked = is_real & ~(field_value.isna() | field_text.isin(UNSET_SET_POINT_VALUES)).to_numpy()
             
-            # 验证供电类型
-            power_type = row.get("供电类型（有源/无源）", "")
-            module_type = row.get("模块类型", "")
-            # 对于AO类型模块，不进行供电类型验证
-            if module_type != "AO":
-                # 跳过值为"/"的情况
-                if not pd.isna(power_type) and str(power_type).strip() == "/":
-                    pass
-                elif pd.isna(power_type) or str(power_type).strip() == "":
-                    invalid_power_type.append(f"第{row_num}行: 供电类型为空")
-                elif str(power_type).strip() not in ["有源", "无源"]:
-                    invalid_power_type.append(f"第{row_num}行: 供电类型必须是有源或无源，当前值: {power_type}")
+            # 验证设定值是否为有效数字，文本列直接复用上面去除空白后的结果
+            float_values = float_values_of(field_value, field_checked, field_text)
+            not_number = field_checked & np.isnan(float_values)
+            present = field_checked & ~not_number
+            set_point_values[field] = (present, float_values)
             
-            # 验证线制
-            wire_type = row.get("线制", "")
-            # 跳过值为"/"的情况
-            if not pd.isna(wire_type) and str(wire_type).strip() == "/":
-                pass
-            elif data_type == "BOOL":
-                if pd.isna(wire_type) or str(wire_type).strip() == "":
-                    invalid_wire_type_bool.append(f"第{row_num}行: 线制为空")
-                elif str(wire_type).strip() not in ["常开", "常闭", "二线制", "2线制", "两线制", "三线制", "四线制"]:
-                    invalid_wire_type_bool.append(f"第{row_num}行: BOOL类型的线制不是有效值，当前值: {wire_type}")
-            elif data_type == "REAL":
-                if pd.isna(wire_type) or str(wire_type).strip() == "":
-                    invalid_wire_type_real.append(f"第{row_num}行: 线制为空")
-                elif str(wire_type).strip() not in ["2线制", "二线制", "三线制", "四线制", "两线制"]:
-                    invalid_wire_type_real.append(f"第{row_num}行: REAL类型的线制不是有效值，当前值: {wire_type}")
+            # 验证设定值是否在量程范围内
+            with np.errstate(invalid="ignore"):
+                out_of_range = present & valid_range & ((float_values < low_values) | (float_values > high_values))
             
-            # 如果是REAL类型，进行设定值相关验证
-            if data_type == "REAL":
-                set_point_fields = ["SLL设定值", "SL设定值", "SH设定值", "SHH设定值"]
-                set_point_values = {}
-                
-                # 获取量程范围
-                range_low = row.get("量程低限", None)
-                range_high = row.get("量程高限", None)
-                
-                # 先检查量程值是否有效
-                valid_range = True
-                if pd.isna(range_low) or pd.isna(range_high):
-                    valid_range = False
-                    invalid_range_values.append(f"第{row_num}行: 量程低限或量程高限未设置")
-                else:
-                    try:
-                        range_low = float(range_low)
-                        range_high = float(range_high)
-                        if range_low >= range_high:
-                            valid_range = False
-                            invalid_range_values.append(f"第{row_num}行: 量程设置错误，低限 {range_low} 应小于高限 {range_high}")
-                    except (ValueError, TypeError):
-                        valid_range = False
-                        invalid_range_values.append(f"第{row_num}行: 量程低限或量程高限不是有效数字")
-                
-                # 收集并验证各设定值
-                for field in set_point_fields:
-                    if field in df.columns:
-                        field_value = row.get(field, "")
-                        
-                        # 如果不是NaN且是"/"，则跳过验证
-                        if not pd.isna(field_value) and str(field_value).strip() == "/":
-                            continue
-                        
-                        # 如果是NaN或空字符串，跳过验证
-                        if pd.isna(field_value) or str(field_value).strip() == "":
-                            continue
-                        
-                        # 验证设定值是否为有效数字
-                        try:
-                            float_value = float(field_value)
-                            set_point_values[field] = float_value
-                            
-                            # 验证设定值是否在量程范围内
-                            if valid_range and (float_value < range_low or float_value > range_high):
-                                invalid_range_values.append(
-                                    f"第{row_num}行: {field} 值 {float_value} 超出量程范围 [{range_low}, {range_high}]"
-                                )
-                        except (ValueError, TypeError):
-                            invalid_range_values.append(f"第{row_num}行: {field} 不是有效数字")
-                
-                # 验证设定值的顺序关系
-                if len(set_point_values) >= 2:  # 至少要有两个值才能比较
-                    if "SLL设定值" in set_point_values and "SL设定值" in set_point_values:
-                        if set_point_values["SLL设定值"] >= set_point_values["SL设定值"]:
-                            invalid_order_values.append(
-                                f"第{row_num}行: SLL设定值 {set_point_values['SLL设定值']} 应小于 SL设定值 {set_point_values['SL设定值']}"
-                            )
-                    
-                    if "SL设定值" in set_point_values and "SH设定值" in set_point_values:
-                        if set_point_values["SL设定值"] >= set_point_values["SH设定值"]:
-                            invalid_order_values.append(
-                                f"第{row_num}行: SL设定值 {set_point_values['SL设定值']} 应小于 SH设定值 {set_point_values['SH设定值']}"
-                            )
-                    
-                    if "SH设定值" in set_point_values and "SHH设定值" in set_point_values:
-                        if set_point_values["SH设定值"] >= set_point_values["SHH设定值"]:
-                            invalid_order_values.append(
-                                f"第{row_num}行: SH设定值 {set_point_values['SH设定值']} 应小于 SHH设定值 {set_point_values['SHH设定值']}"
-                            )
-        
-        # 合并所有错误信息
-        all_errors = []
-        
-        if invalid_power_type:
-            all_errors.append("供电类型错误:\n" + "\n".join(invalid_power_type))
-        
-        if invalid_wire_type_bool:
-            all_errors.append("数字量线制错误:\n" + "\n".join(invalid_wire_type_bool))
-        
-        if invalid_wire_type_real:
-            all_errors.append("模拟量线制错误:\n" + "\n".join(invalid_wire_type_real))
+            invalid_range_values.extend(
+                (pos, order, f"{prefixes[pos]}{field} 不是有效数字")
+                for pos in np.flatnonzero(not_number)
+            )
+            invalid_range_values.extend(
+                (pos, order,
+                 f"{prefixes[pos]}{field} 值 {float_values[pos]} 超出量程范围 [{low_values[pos]}, {high_values[pos]}]")
+                for pos in np.flatnonzero(out_of_range)
+            )
+        
+        # 验证设定值的顺序关系，两个设定值都有效时才比较
+        for order, (lower_field, upper_field) in enumerate(SET_POINT_ORDER_PAIRS):
+            if lower_field not in set_point_values or upper_field not in set_point_values:
+                continue
+            
+            lower_present, lower_values = set_point_values[lower_field]
+            upper_present, upper_values = set_point_values[upper_field]
+            with np.errstate(invalid="ignore"):
+                wrong_order = lower_present & upper_present & (lower_values >= upper_values)
+            
+            invalid_order_values.extend(
+                (pos, order,
+                 f"{prefixes[pos]}{lower_field} {lower_values[pos]} 应小于 {upper_field} {upper_values[pos]}")
+                for pos in np.flatnonzero(wrong_order)
+            )
         
-        if invalid_range_values:
-            all_errors.append("设定值超出量程范围:\n" + "\n".join(invalid_range_values))
+        # 合并所有错误信息，每类错误按行号顺序排列
+        all_errors = []
         
-        if invalid_order_values:
-            all_errors.append("设定值顺序错误:\n" + "\n".join(invalid_order_values))
+        for title, errors in errors_by_category.items():
+            if errors:
+                errors.sort(key=lambda error: error[:2])
+                all_errors.append(f"{title}:\n" + "\n".join(message for _, _, message in errors))
         
         return {
             "has_errors": len(all_errors) > 0,
@@ -306,26 +508,89 @@ class ExcelDataService:
         }
     
     @staticmethod
-    def read_io_table(file_path, sheet_name="IO点表"):
+    def read_io_table(file_path, sheet_name="IO点表", usecols=None, dtype=None):
         """
         读取IO点表Excel文件
         
         Args:
             file_path: Excel文件路径
             sheet_name: 工作表名称
+            usecols: 只读取的列，默认读取全部列
+            dtype: 各列的数据类型，默认将IO点表的文本列指定为字符串类型
             
         Returns:
             pandas DataFrame
         """
-        return pd.read_excel(file_path, sheet_name=sheet_name)
+        # 按扩展名直接指定解析引擎，省去pandas对文件格式的探测；安装了calamine时优先使用
+        if USE_CALAMINE:
+            engine = "calamine"
+        elif str(file_path).lower().endswith(".xls"):
+            engine = "xlrd"
+        else:
+            engine = "openpyxl"
+        
+        # 上传的点表后续还要用于生成HMI/PLC/FAT点表，因此默认读取全部列；
+        # 文本列指定为字符串类型，空单元格仍保留为NaN
+        if dtype is None:
+            dtype = {column: str for column in IO_TABLE_TEXT_COLUMNS}
+        
+        return pd.read_excel(
+            file_path,
+            sheet_name=sheet_name,
+            engine=engine,
+            usecols=usecols,
+            dtype=dtype
+        )
 
 
 class IOPointDataService:
     """
     IO点表数据服务类
     负责IO点表相关的数据处理和转换
+    
+    约定：点表转换只能使用按列操作（重命名、.map/.replace、df.loc[掩码, 列] = 值），
+    不允许使用iterrows/itertuples/apply(axis=1)逐行处理；
+    不修改传入的DataFrame时直接返回原对象，不做多余的复制
     """
     
+    @staticmethod
+    def _apply_mapping(df, field_map):
+        """
+        按字段映射重命名列
+        
+        Args:
+            df: 点表数据(DataFrame)
+            field_map: {原列名: 新列名}
+            
+        Returns:
+            重命名后的点表数据(DataFrame)
+        """
+        if not field_map:
+            return df
+        return df.rename(columns=field_map)
+    
+    @staticmethod
+    def _vectorized_transform(df, rules):
+        """
+        按规则对点表做列级赋值
+        
+        有规则需要执行时先复制一次数据，保证不修改调用方的DataFrame
+        
+        Args:
+            df: 点表数据(DataFrame)
+            rules: [(掩码函数, 列名, 值)]，掩码函数接收DataFrame并返回布尔Series
+            
+        Returns:
+            转换后的点表数据(DataFrame)
+        """
+        if not rules:
+            return df
+        
+        df = df.copy()
+        for mask_fn, column, value in rules:
+            df.loc[mask_fn(df), column] = value
+        return df
+    
     @staticmethod
     def generate_hmi_table(io_data):
         """
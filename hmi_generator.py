@@ -11,16 +11,337 @@ HMI点表生成模块 - 用于生成亚控HMI点表
 
 import os
 import traceback
-# 将tkinter导入替换为PySide6导入
-from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout, QProgressDialog, QMessageBox
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from types import MappingProxyType
+from PySide6.QtWidgets import QApplication, QProgressDialog, QMessageBox
 from PySide6.QtCore import Qt
 from pathlib import Path
 from config.settings import TEMPLATE_DIR, HMI_TEMPLATE
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
+import xlsxwriter
 
 # 添加数据词典模板配置常量
 DATA_DICTIONARY_TEMPLATE = "数据词典点表模板.xls"
 
+# 亚控HMI点表默认字段值，只读共享，调用方无需每次重新创建
+_BOOL_DEFAULT_FIELD_VALUES = MappingProxyType({
+    "TagType": "用户变量",
+    "TagDataType": "IODisc",
+    "ChannelName": "Network1",
+    "ChannelDriver": "ModbusMaster",
+    "DeviceSeries": "ModbusTCP",
+    "CollectInterval": 1000
+})
+
+_REAL_DEFAULT_FIELD_VALUES = MappingProxyType({
+    "TagType": "用户变量",
+    "TagDataType": "IOFloat",
+    "ChannelName": "Network1",
+    "ChannelDriver": "ModbusMaster",
+    "DeviceSeries": "ModbusTCP",
+    "CollectInterval": 1000
+})
+
+# HMI点表IO_DISC、IO_FLOAT工作表中各点位相同的固定字段值
+_IO_DISC_FIXED_VALUES = MappingProxyType({
+    "TagType": "用户变量",
+    "TagDataType": "IODisc",
+    "ChannelName": "Network1",
+    "ChannelDriver": "ModbusMaster",
+    "DeviceSeries": "ModbusTCP",
+    "DeviceSeriesType": "0",
+    "CollectControl": "否",
+    "CollectInterval": 1000,
+    "CollectOffset": 0,
+    "TimeZoneBias": 0,
+    "TimeAdjustment": 0,
+    "Enable": "是",
+    "ForceWrite": "否",
+    "RegName": 0,
+    "RegType": 0,
+    "ItemDataType": "BIT",
+    "ItemAccessMode": "读写",
+    "HisRecordMode": "不记录",
+    "HisDeadBand": 0.000000,
+    "HisInterval": 60
+})
+
+_IO_FLOAT_FIXED_VALUES = MappingProxyType({
+    "TagType": "用户变量",
+    "TagDataType": "IOFloat",
+    "MaxRawValue": 1000000000.000000,  # 使用数字而非字符串
+    "MinRawValue": -1000000000.000000,  # 使用数字而非字符串
+    "MaxValue": 1000000000.000000,  # 使用数字而非字符串
+    "MinValue": -1000000000.000000,  # 使用数字而非字符串
+    "ConvertType": "无",
+    "IsFilter": "否",
+    "DeadBand": 0,  # 使用数字而非字符串
+    "ChannelName": "Network1",
+    "ChannelDriver": "ModbusMaster",
+    "DeviceSeries": "ModbusTCP",
+    "DeviceSeriesType": 0,  # 使用数字而非字符串
+    "CollectControl": "否",
+    "CollectInterval": 1000,  # 使用数字而非字符串
+    "CollectOffset": 0,  # 使用数字而非字符串
+    "TimeZoneBias": 0,  # 使用数字而非字符串
+    "TimeAdjustment": 0,  # 使用数字而非字符串
+    "Enable": "是",
+    "ForceWrite": "否",
+    "RegName": 4,  # 使用数字而非字符串
+    "RegType": 3,  # 使用数字而非字符串
+    "ItemDataType": "FLOAT",
+    "ItemAccessMode": "读写",
+    "HisRecordMode": "不记录",
+    "HisDeadBand": 0.000000,  # 使用数字而非字符串
+    "HisInterval": 60  # 使用数字而非字符串
+})
+
+# 数据词典点表IO_DISC、IO_FLOAT工作表中各点位相同的固定字段值，数值字段使用数字而非字符串
+_DICT_DISC_FIXED_VALUES = MappingProxyType({
+    "ContainerType": 1,  # 改为数字
+    "InitialValueBool": "false",
+    "SecurityZoneID": "None",
+    "RecordEvent": "false",
+    "SaveValue": "true",
+    "SaveParameter": "true",
+    "AccessByOtherApplication": "false",
+    "ExtentField1": "",
+    "ExtentField2": "",
+    "HisRecMode": 2,  # 改为数字
+    "HisRecInterval": 60,  # 改为数字
+    "AlarmType": 256,  # 改为数字
+    "CloseString": "关闭",
+    "OpenString": "打开",
+    "AlarmDelay": 0,  # 改为数字
+    "DiscInhibitor": "",
+    "ExtentField3": "",
+    "ExtentField4": "",
+    "ExtentField5": "",
+    "ExtentField6": "",
+    "ExtentField7": "",
+    "ExtentField8": "",
+    "CloseToOpen": "关到开",
+    "OpenToClose": "开到关",
+    "StateEnumTable": "",
+    "IOConfigControl": "true",
+    "IOEnable": "true",
+    "ForceRead": "false",
+    "ForceWrite": "false",
+    "DataConvertMode": 1  # 改为数字
+})
+
+_DICT_FLOAT_FIXED_VALUES = MappingProxyType({
+    "ContainerType": 1,  # 改为数字
+    "MaxValue": 1000000000,  # 改为数字
+    "MinValue": -1000000000,  # 改为数字
+    "InitialValue": 0,  # 改为数字
+    "Sensitivity": 0,  # 改为数字
+    "EngineerUnits": "",
+    "SecurityZoneID": "None",
+    "RecordEvent": "false",
+    "SaveValue": "true",
+    "SaveParameter": "true",
+    "AccessByOtherApplication": "false",
+    "ExtentField1": "",
+    "ExtentField2": "",
+    "HisRecMode": 2,  # 改为数字
+    "HisRecChangeDeadband": 0,  # 改为数字
+    "HisRecInterval": 60,  # 改为数字
+    "HiHiText": "高高",
+    "HiHiPriority": 1,  # 改为数字
+    "HiHiInhibitor": "",
+    "HiText": "高",
+    "HiPriority": 1,  # 改为数字
+    "HiInhibitor": "",
+    "LoText": "低",
+    "LoPriority": 1,  # 改为数字
+    "LoInhibitor": "",
+    "LoLoText": "低低",
+    "LoLoPriority": 1,  # 改为数字
+    "LoLoInhibitor": "",
+    "LimitDeadband": 0,  # 改为数字
+    "LimitDelay": 0,  # 改为数字
+    "DevMajorEnabled": "false",
+    "DevMajorLimit": 80,  # 改为数字
+    "DevMajorText": "主要",
+    "DevMajorPriority": 1,  # 改为数字
+    "MajorInhibitor": "",
+    "DevMinorEnabled": "false",
+    "DevMinorLimit": 20,  # 改为数字
+    "DevMinorText": "次要",
+    "DevMinorPriority": 1,  # 改为数字
+    "MinorInhibitor": "",
+    "DevDeadband": 0,  # 改为数字
+    "DevTargetValue": 100,  # 改为数字
+    "DevDelay": 0,  # 改为数字
+    "RocEnabled": "false",
+    "RocPercent": 20,  # 改为数字
+    "RocTimeUnit": 0,  # 改为数字
+    "RocText": "变化率",
+    "RocDelay": 0,  # 改为数字
+    "RocPriority": 1,  # 改为数字
+    "RocInhibitor": "",
+    "StatusAlarmTableID": 0,  # 改为数字
+    "StatusAlarmEnabled": "false",
+    "StatusAlarmTableName": "",
+    "StatusInhibitor": "",
+    # 移除AlarmGroup字段，避免重复写入
+    # "AlarmGroup": "",
+    "ExtentField3": "",
+    "ExtentField4": "",
+    "ExtentField5": "",
+    "ExtentField6": "",
+    "ExtentField7": "",
+    "ExtentField8": "",
+    "StateEnumTable": "",
+    "IOConfigControl": "true",
+    "MaxRaw": 1000000000,  # 改为数字
+    "MinRaw": -1000000000,  # 改为数字
+    "IOEnable": "true",
+    "ForceRead": "false",
+    "ForceWrite": "false",
+    "DataConvertMode": 1,  # 改为数字
+    "NlnTableID": 0,  # 改为数字
+    "AddupMaxVal": 0,  # 改为数字
+    "AddupMinVal": 0  # 改为数字
+})
+
+# HMI点表单元格的基础格式：宋体10号，文本、整数和浮点数格式在此基础上增加数字格式
+HMI_CELL_FORMAT = {'font_name': '宋体', 'font_size': 10}
+
+# HMI点表工作簿选项：字符串按原样写入，不自动转换为公式、数字或链接；
+# 点表中的空数值(NaN)写为错误值而不是中断导出。
+# constant_memory模式逐行写出，每个工作表必须按行号递增的顺序写入，已写出的行不能再修改
+XLSX_WORKBOOK_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_numbers': False,
+    'strings_to_urls': False,
+    'nan_inf_to_errors': True,
+}
+
+# 解析后的HMI模板：各工作表名称、各表逐行的单元格值和各表表头的列索引，三者按工作表顺序对应
+HMITemplate = namedtuple("HMITemplate", ["sheet_names", "sheet_rows", "column_indices"])
+
+
+@lru_cache(maxsize=4)
+def _load_template(template_file, mtime):
+    """
+    读取并解析HMI点表模板
+    
+    模板内容只与文件本身有关，解析结果按(路径, 修改时间)缓存，
+    模板文件被替换或修改后修改时间变化，下次导出会重新读取
+    
+    Args:
+        template_file: 模板文件路径
+        mtime: 模板文件的修改时间，只作为缓存键
+    
+    Returns:
+        HMITemplate: 解析后的模板，调用方不应修改其中的内容
+    """
+    import xlrd
+    
+    template_workbook = xlrd.open_workbook(template_file)
+    sheet_names = []
+    sheet_rows = []
+    column_indices = []
+    for template_sheet in template_workbook.sheets():
+        rows = tuple(tuple(template_sheet.row_values(row)) for row in range(template_sheet.nrows))
+        sheet_names.append(template_sheet.name)
+        sheet_rows.append(rows)
+        # 表头中的列名到列索引的映射，空列名跳过
+        column_indices.append({header: col for col, header in enumerate(rows[0]) if header} if rows else {})
+    
+    return HMITemplate(tuple(sheet_names), tuple(sheet_rows), tuple(column_indices))
+
+
+def _file_stat(path):
+    """获取文件状态，文件不存在时返回None，存在性检查与读取大小、修改时间共用一次os.stat"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _data_dictionary_styles():
+    """
+    创建数据词典点表使用的xlwt单元格样式，均为宋体10号字体
+    
+    XFStyle只描述格式，保存时由各工作簿登记为自己的XF记录，样式对象本身不会被修改，
+    因此只在首次导出时创建一次，之后的导出直接复用
+    
+    Returns:
+        tuple: (标准样式, 整数样式, 浮点数样式)
+    """
+    import xlwt
+    
+    font = xlwt.Font()
+    font.name = '宋体'
+    font.height = 20 * 10  # 10号字体对应的高度是200
+    
+    # 标准单元格样式（非文本格式）
+    standard_style = xlwt.XFStyle()
+    standard_style.font = font
+    
+    # 整数格式样式
+    number_style = xlwt.XFStyle()
+    number_style.font = font
+    number_style.num_format_str = '0'
+    
+    # 浮点数格式样式
+    float_style = xlwt.XFStyle()
+    float_style.font = font
+    float_style.num_format_str = '0.000000'
+    
+    return standard_style, number_style, float_style
+
+
+# 生成点表的后台线程，同一时间只执行一个导出任务
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+def _run_in_background(export_window, func, *args):
+    """
+    在后台线程中执行点表生成，主线程等待期间刷新进度窗口并处理界面事件
+    
+    Qt控件不是线程安全的：func只通过最后一个参数report(进度值, 提示文本)记录最新进度，
+    由主线程读取后更新进度窗口。没有进度窗口时直接在当前线程执行
+    
+    Args:
+        export_window: 进度窗口(QProgressDialog)，可以为None
+        func: 生成函数，最后一个参数为进度回调
+        *args: 传给func的其余参数
+    
+    Returns:
+        func的返回值，func抛出的异常在调用线程中重新抛出
+    """
+    if export_window is None:
+        return func(*args, lambda value, text: None)
+    
+    latest = [None]
+    
+    def report(value, text):
+        latest[0] = (value, text)
+    
+    future = _EXPORT_EXECUTOR.submit(func, *args, report)
+    shown = None
+    while not future.done():
+        state = latest[0]
+        if state is not shown:
+            shown = state
+            export_window.setValue(state[0])
+            export_window.setLabelText(state[1])
+        QApplication.processEvents()
+        wait((future,), timeout=0.05)
+    
+    return future.result()
+
+
 class HMIGenerator:
     """
     HMI点表生成器类
@@ -30,68 +351,489 @@ class HMIGenerator:
     支持UI进度显示和异常处理
     """
     
-    # 定义需要处理的扩展点位列表
-    EXTENDED_POINTS = [
-        {"name": "SLL设定点位", "comm_addr": "SLL设定点位_通讯地址", "suffix": "_LoLoLimit", "is_bool": False},
-        {"name": "SL设定点位", "comm_addr": "SL设定点位_通讯地址", "suffix": "_LoLimit", "is_bool": False},
-        {"name": "SH设定点位", "comm_addr": "SH设定点位_通讯地址", "suffix": "_HiLimit", "is_bool": False},
-        {"name": "SHH设定点位", "comm_addr": "SHH设定点位_通讯地址", "suffix": "_HiHiLimit", "is_bool": False},
-        {"name": "LL报警", "comm_addr": "LL报警_通讯地址", "suffix": "_LL", "is_bool": True},
-        {"name": "L报警", "comm_addr": "L报警_通讯地址", "suffix": "_L", "is_bool": True},
-        {"name": "H报警", "comm_addr": "H报警_通讯地址", "suffix": "_H", "is_bool": True},
-        {"name": "HH报警", "comm_addr": "HH报警_通讯地址", "suffix": "_HH", "is_bool": True},
-        {"name": "维护值设定点位", "comm_addr": "维护值设定点位_通讯地址", "suffix": "_whz", "is_bool": False},
-        {"name": "维护使能开关点位", "comm_addr": "维护使能开关点位_通讯地址", "suffix": "_MAIN_EN", "is_bool": True}
-    ]
+    # 需要处理的扩展点位，以下四个元组按下标一一对应：点位名称、通讯地址列、变量名后缀、是否为BOOL点位
+    EXT_NAMES = ("SLL设定点位", "SL设定点位", "SH设定点位", "SHH设定点位", "LL报警",
+                 "L报警", "H报警", "HH报警", "维护值设定点位", "维护使能开关点位")
+    EXT_COMM_COLS = ("SLL设定点位_通讯地址", "SL设定点位_通讯地址", "SH设定点位_通讯地址",
+                     "SHH设定点位_通讯地址", "LL报警_通讯地址", "L报警_通讯地址", "H报警_通讯地址",
+                     "HH报警_通讯地址", "维护值设定点位_通讯地址", "维护使能开关点位_通讯地址")
+    EXT_SUFFIXES = ("_LoLoLimit", "_LoLimit", "_HiLimit", "_HiHiLimit", "_LL",
+                    "_L", "_H", "_HH", "_whz", "_MAIN_EN")
+    EXT_IS_BOOL = (False, False, False, False, True, True, True, True, False, True)
     
     # 亚控HMI点表默认字段值
     @classmethod
     def get_default_bool_field_values(cls):
-        """获取布尔类型点位的默认字段值"""
-        return {
-            "TagType": "用户变量",
-            "TagDataType": "IODisc",
-            "ChannelName": "Network1",
-            "ChannelDriver": "ModbusMaster",
-            "DeviceSeries": "ModbusTCP",
-            "CollectInterval": 1000
-        }
+        """获取布尔类型点位的默认字段值(只读映射)"""
+        return _BOOL_DEFAULT_FIELD_VALUES
         
     @classmethod
     def get_default_real_field_values(cls):
-        """获取实数类型点位的默认字段值"""
-        return {
-            "TagType": "用户变量",
-            "TagDataType": "IOFloat",
-            "ChannelName": "Network1",
-            "ChannelDriver": "ModbusMaster",
-            "DeviceSeries": "ModbusTCP",
-            "CollectInterval": 1000
-        }
+        """获取实数类型点位的默认字段值(只读映射)"""
+        return _REAL_DEFAULT_FIELD_VALUES
     
     @staticmethod
-    def generate_hmi_table(io_data, output_path, root_window=None):
+    def _column(df, column, default):
         """
-        生成HMI点表(BOOL类型数据)
+        获取一列数据，列不存在时返回以默认值填充的列
         
-        处理IO数据并生成符合亚控HMI要求的布尔类型点表Excel文件
-        支持进度显示窗口，提供用户友好的导出体验
+        Args:
+            df: pandas DataFrame
+            column: 列名
+            default: 列不存在时使用的默认值
+        
+        Returns:
+            pandas Series
+        """
+        if column in df.columns:
+            return df[column]
+        return pd.Series(default, index=df.index, dtype=object)
+    
+    @staticmethod
+    def _split_by_data_type(io_data):
+        """
+        按数据类型一次分组，取出BOOL和REAL两部分数据
+        
+        分组保持各行在IO点表中的原有顺序，结果只读，不复制
+        
+        Args:
+            io_data: 上传的IO点表数据(DataFrame)
+        
+        Returns:
+            tuple: (BOOL数据, REAL数据)，没有对应类型时为空表
+        """
+        groups = dict(tuple(io_data.groupby("数据类型", sort=False)))
+        empty = io_data.iloc[:0]
+        return groups.get("BOOL", empty), groups.get("REAL", empty)
+    
+    @staticmethod
+    def _row_tuples(df, fields):
+        """
+        按给定字段顺序逐行返回纯元组，避免iterrows为每行构造Series
+        
+        Args:
+            df: pandas DataFrame
+            fields: (列名, 列不存在时的默认值) 序列
+        
+        Returns:
+            逐行产生元组的迭代器
+        """
+        return zip(*(HMIGenerator._column(df, column, default) for column, default in fields))
+    
+    @staticmethod
+    def _point_name_columns(df):
+        """
+        按列计算基本点位的变量名称、变量描述和场站名
+        
+        变量名称为空的行补全为"YLDW"+通道位号，其中原描述为空的补全为"预留点位"+通道位号；
+        空描述写为空字符串，空场站名写为"未知站点"
+        
+        Args:
+            df: 基本点位数据(DataFrame)
+        
+        Returns:
+            tuple: (变量名称, 变量描述, 场站名)三个object数组，与df的行一一对应
+        """
+        names = HMIGenerator._column(df, "变量名称（HMI）", "")
+        descriptions = HMIGenerator._column(df, "变量描述", "")
+        stations = HMIGenerator._column(df, "场站名", "未知站点")
+        
+        blank = names.isna() | names.astype(str).str.strip().eq("")
+        if blank.any():
+            codes = HMIGenerator._column(df, "通道位号", "").astype(str)
+            blank_desc = descriptions.isna() | descriptions.astype(str).str.strip().eq("")
+            names = names.mask(blank, "YLDW" + codes)
+            descriptions = descriptions.mask(blank & blank_desc, "预留点位" + codes)
+        
+        return (
+            names.to_numpy(dtype=object),
+            descriptions.fillna("").to_numpy(dtype=object),
+            stations.fillna("未知站点").to_numpy(dtype=object)
+        )
+    
+    @staticmethod
+    def _item_names(df, column, prefix=""):
+        """
+        按列计算ItemName：取通讯地址中小数点前的部分并加上前缀
+        
+        Excel中的通讯地址列通常读取为数值列，此时按整数转换；混有文本的列按字符串拆分。
+        扩展点位展开后的地址列为object类型，先推断实际类型，全为数值时同样按整数转换
+        
+        Args:
+            df: 点位数据(DataFrame)
+            column: 通讯地址列名
+            prefix: ItemName前缀，BOOL点位为"0"
+        
+        Returns:
+            numpy.ndarray: ItemName字符串数组
+        """
+        addresses = HMIGenerator._column(df, column, "").infer_objects()
+        if is_numeric_dtype(addresses):
+            # 有限且在int64范围内的数值直接截去小数部分转为整数文本，不必逐个转为字符串再拆分；
+            # inf等无法表示为整数的值仍按字符串拆分，不转换为无意义的整数
+            values = addresses.to_numpy(dtype="float64", na_value=np.nan)
+            fast = np.isfinite(values) & (np.abs(values) < 2.0 ** 63)
+            slow = ~fast & addresses.notna().to_numpy()
+            text = pd.Series("", index=addresses.index, dtype=object)
+            text[fast] = np.trunc(values[fast]).astype("int64").astype(str)
+            if slow.any():
+                text[slow] = addresses[slow].astype(str).str.split(".", n=1).str[0]
+        else:
+            # 空值在NumPy数组上替换为空字符串，避免fillna对object列做类型向下转换
+            values = addresses.to_numpy(dtype=object)
+            values = np.where(pd.isna(values), "", values)
+            text = pd.Series(values, index=addresses.index, dtype=object).astype(str).str.split(".", n=1).str[0]
+        return (prefix + text).to_numpy(dtype=object)
+    
+    @staticmethod
+    def _extended_point_frame(io_data, base_columns):
+        """
+        将IO点表各行的全部扩展点位一次展开为长表，每个有效的扩展点位占一行
+        
+        扩展点位的值和通讯地址都不为空且不为"/"时才有效；结果按IO点表的行顺序排列，
+        同一行内按EXT_NAMES的顺序排列，与逐行逐点位处理的顺序一致。按is_bool列
+        筛选后即得到BOOL或REAL扩展点位，顺序不变
+        
+        Args:
+            io_data: 上传的IO点表数据(DataFrame)
+            base_columns: _point_name_columns(io_data)的结果，扩展点位的名称和描述以此为基础
+        
+        Returns:
+            DataFrame: 包含name、description、station、address、is_bool五列
+        """
+        names, descriptions, stations = base_columns
+        names = names.astype(str).astype(object)
+        descriptions = descriptions.astype(str).astype(object)
+        
+        # 各扩展点位的值列和通讯地址列一次取成二维数组，不存在的列整列为NaN
+        value_cols = list(HMIGenerator.EXT_NAMES)
+        addr_cols = list(HMIGenerator.EXT_COMM_COLS)
+        block = io_data.reindex(columns=value_cols + addr_cols).to_numpy(dtype=object)
+        
+        # 有效值：非空值、按真值判断非空且不为"/"；值和通讯地址都有效的扩展点位才生成
+        # 空值先替换为空字符串，避免对pd.NA做真值判断
+        filled = np.where(pd.notna(block), block, "")
+        present = filled.astype(bool) & (filled != "/")
+        count = len(value_cols)
+        valid = present[:, :count] & present[:, count:]
+        
+        # 二维掩码按行优先展开，顺序即先IO点表行、再行内扩展点位
+        rows, points = np.nonzero(valid)
+        suffixes = np.array(HMIGenerator.EXT_SUFFIXES, dtype=object)
+        desc_suffixes = np.array(["_" + name for name in value_cols], dtype=object)
+        
+        return pd.DataFrame({
+            "name": names[rows] + suffixes[points],
+            "description": descriptions[rows] + desc_suffixes[points],
+            "station": stations[rows],
+            "address": block[:, count:][rows, points],
+            "is_bool": np.array(HMIGenerator.EXT_IS_BOOL)[points],
+        })
+    
+    @staticmethod
+    def _row_template(column_indices, fixed_values, dynamic_fields, field_styles, default_style):
+        """
+        按模板列顺序预先生成一行数据及各列的单元格格式
+        
+        固定值只在这里填入一次，动态字段的值由调用方逐行填入；模板中没有的字段不写入，
+        对应列的格式为None。列表末尾多留一个格式为None的占位列，供_field_positions
+        将模板中不存在的字段指向该列
+        
+        Args:
+            column_indices: 字段名到列索引的映射
+            fixed_values: 固定值字段及其值
+            dynamic_fields: 逐行填写的字段名
+            field_styles: 字段名到单元格格式的映射，未列出的字段使用默认格式
+            default_style: 默认单元格格式
+        
+        Returns:
+            tuple: (行数据列表, 各列格式列表)
+        """
+        ncols = max(column_indices.values(), default=-1) + 1
+        values = [""] * (ncols + 1)
+        styles = [None] * (ncols + 1)
+        
+        for field in dynamic_fields:
+            if field in column_indices:
+                styles[column_indices[field]] = field_styles.get(field, default_style)
+        for field, value in fixed_values.items():
+            if field in column_indices:
+                values[column_indices[field]] = value
+                styles[column_indices[field]] = field_styles.get(field, default_style)
+        
+        return values, styles
+    
+    @staticmethod
+    def _field_positions(column_indices, fields):
+        """
+        获取各字段在行模板中的位置，模板中不存在的字段指向行末不写入的占位列
+        
+        Args:
+            column_indices: 字段名到列索引的映射
+            fields: 字段名列表
+        
+        Returns:
+            tuple: 与fields一一对应的列索引
+        """
+        placeholder = max(column_indices.values(), default=-1) + 1
+        return tuple(column_indices.get(field, placeholder) for field in fields)
+    
+    @staticmethod
+    def _write_row(sheet, row_idx, values, styles):
+        """
+        按行模板的列格式向xlwt工作表写入一行，格式为None的列跳过
+        
+        行对象只取一次，各单元格直接写入该行，不再经sheet.write逐个查找行；
+        返回该行对象，供调用方继续写入同一行的其他单元格
+        """
+        row = sheet.row(row_idx)
+        write = row.write
+        for col, (value, style) in enumerate(zip(values, styles)):
+            if style is not None:
+                write(col, value, style)
+        return row
+    
+    @staticmethod
+    def _write_points(sheet, row_template, row_styles, positions, points, first_row, first_id):
+        """
+        将点位逐行写入IO_DISC或IO_FLOAT工作表
+        
+        Args:
+            sheet: 目标工作表
+            row_template: _row_template生成的行数据模板
+            row_styles: 与行模板对应的各列格式
+            positions: TagID、TagName、Description、DeviceName、TagGroup、ItemName在行模板中的位置
+            points: 可迭代的(变量名称, 变量描述, 场站名, ItemName)
+            first_row: 第一个点位写入的行号
+            first_id: 第一个点位的TagID，之后逐行递增
+        
+        Returns:
+            int: 写入的点位数量
+        """
+        ci_tagid, ci_tagname, ci_desc, ci_dev, ci_grp, ci_item = positions
+        # 需要写入的列及其格式只筛选一次，逐行循环中只访问局部变量
+        cells = [(col, style) for col, style in enumerate(row_styles) if style is not None]
+        write = sheet.write
+        copy_template = row_template.copy
+        count = 0
+        for count, (hmi_name, description, station_name, item_name) in enumerate(points, 1):
+            # 在行模板上填入动态字段后整行写入
+            row_values = copy_template()
+            row_values[ci_tagid] = first_id + count - 1
+            row_values[ci_tagname] = hmi_name
+            row_values[ci_desc] = description
+            row_values[ci_dev] = station_name
+            row_values[ci_grp] = station_name
+            row_values[ci_item] = item_name
+            row_idx = first_row + count - 1
+            for col, style in cells:
+                write(row_idx, col, row_values[col], style)
+        return count
+    
+    @staticmethod
+    def _generate_hmi_table_core(io_data, template_future, xlsx_output_path, include_bool, report):
+        """
+        生成HMI点表文件，在后台线程中执行
+        
+        不操作任何界面控件，进度通过report(进度值, 提示文本)报告，出错时直接抛出异常。
+        IO_DISC表的TagID从1开始，IO_FLOAT表的TagID接在IO_DISC最后一个ID之后；
+        只生成REAL点位时IO_FLOAT表的TagID从1开始
+        
+        Args:
+            io_data: 上传的IO点表数据(DataFrame)
+            template_future: 解析HMI模板的Future，结果为HMITemplate
+            xlsx_output_path: 输出文件路径(.xlsx)
+            include_bool: 是否生成BOOL点位(IO_DISC表)，为False时只生成REAL点位
+            report: 进度回调函数
+        """
+        # 确保目标文件不存在
+        if os.path.exists(xlsx_output_path):
+            os.remove(xlsx_output_path)
+        
+        # 更新进度
+        report(10, "正在读取模板文件...")
+        
+        # 等待模板解析完成，模板未修改时直接使用上次解析的结果
+        template = template_future.result()
+        
+        # 创建新的工作簿
+        workbook = xlsxwriter.Workbook(xlsx_output_path, XLSX_WORKBOOK_OPTIONS)
+        
+        # 更新进度
+        report(20, "正在创建新工作簿...")
+        
+        # 所有单元格使用宋体10号字体
+        # 设置标准单元格样式（非文本格式）
+        standard_style = workbook.add_format(HMI_CELL_FORMAT)
+        
+        # 设置文本格式
+        text_style = workbook.add_format({**HMI_CELL_FORMAT, 'num_format': '@'})
+        
+        # 设置数字格式样式
+        number_style = workbook.add_format({**HMI_CELL_FORMAT, 'num_format': '0'})  # 整数格式
+        
+        # 设置浮点数格式样式
+        float_style = workbook.add_format({**HMI_CELL_FORMAT, 'num_format': '0.000000'})  # 浮点数格式
+        
+        # 更新进度
+        report(30, "正在复制模板...")
+        
+        # 首先复制模板中的所有工作表
+        disc_sheet_idx = -1
+        float_sheet_idx = -1
+        
+        # 第一遍循环，复制所有工作表并获取IO_DISC和IO_FLOAT的索引
+        for idx, (sheet_name, rows) in enumerate(zip(template.sheet_names, template.sheet_rows)):
+            # 复制工作表
+            new_sheet = workbook.add_worksheet(sheet_name)
+            
+            # IO_DISC和IO_FLOAT的数据行全部由生成的点位填写，只复制表头；其余工作表复制全部内容
+            if sheet_name in ("IO_DISC", "IO_FLOAT"):
+                rows = rows[:1]
+            
+            # 整行写入，使用宋体字体样式
+            for row, row_values in enumerate(rows):
+                new_sheet.write_row(row, 0, row_values, standard_style)
+            
+            # 记录特殊工作表的索引
+            if sheet_name == "IO_DISC":
+                disc_sheet_idx = idx
+            elif sheet_name == "IO_FLOAT":
+                float_sheet_idx = idx
+        
+        # 检查是否找到了需要的工作表
+        if include_bool and disc_sheet_idx == -1:
+            raise ValueError("模板文件中没有找到IO_DISC工作表")
+        if not include_bool and float_sheet_idx == -1:
+            raise ValueError("模板文件中没有找到IO_FLOAT工作表")
+        
+        # 数字字段列表
+        number_fields = ["TagID", "CollectInterval", "CollectOffset", "TimeZoneBias", "TimeAdjustment", 
+                        "RegName", "RegType", "HisDeadBand", "HisInterval"]
+        
+        # 浮点数字段列表
+        float_fields = ["HiHiLimit", "HiLimit", "LoLimit", "LoLoLimit"]
+        
+        # 各列格式：数字字段用整数格式，限值字段用浮点数格式，ItemName用文本格式
+        field_styles = dict.fromkeys(number_fields, number_style)
+        field_styles.update(dict.fromkeys(float_fields, float_style))
+        field_styles["ItemName"] = text_style
+        
+        # 逐行填写的字段，其余字段取固定值
+        dynamic_fields = ("TagID", "TagName", "Description", "DeviceName", "TagGroup", "ItemName")
+        
+        # 按数据类型一次分组得到BOOL和REAL基本点位
+        bool_df, real_df = HMIGenerator._split_by_data_type(io_data)
+        
+        # 扩展点位只扫描一遍IO点表，展开后再按类型分别写入IO_DISC和IO_FLOAT
+        ext_points = HMIGenerator._extended_point_frame(io_data, HMIGenerator._point_name_columns(io_data))
+        ext_is_bool = ext_points["is_bool"].to_numpy()
+        
+        # 设置从第二行开始填充数据（表头是第一行）
+        row_start = 1
+        
+        # IO_DISC最后一个TagID，只生成REAL点位时为0
+        last_disc_id = 0
+        
+        if include_bool:
+            # 更新进度
+            report(50, "正在处理布尔型数据...")
+            
+            disc_sheet = workbook.worksheets()[disc_sheet_idx]
+            column_indices = template.column_indices[disc_sheet_idx]
+            disc_row_template, disc_row_styles = HMIGenerator._row_template(
+                column_indices, _IO_DISC_FIXED_VALUES, dynamic_fields, field_styles, standard_style
+            )
+            disc_positions = HMIGenerator._field_positions(column_indices, dynamic_fields)
+            
+            # 基本点位：ItemName = 上位机通讯地址前面部分，使用文本格式且在前面加0
+            base_count = HMIGenerator._write_points(
+                disc_sheet, disc_row_template, disc_row_styles, disc_positions,
+                zip(*HMIGenerator._point_name_columns(bool_df),
+                    HMIGenerator._item_names(bool_df, "上位机通讯地址", "0")),
+                row_start, row_start
+            )
+            
+            # 更新进度
+            report(65, "正在处理布尔型扩展点位...")
+            
+            # 扩展点位接在基本点位之后，TagID与行号一致
+            bool_ext = ext_points[ext_is_bool]
+            ext_count = HMIGenerator._write_points(
+                disc_sheet, disc_row_template, disc_row_styles, disc_positions,
+                zip(bool_ext["name"], bool_ext["description"], bool_ext["station"],
+                    HMIGenerator._item_names(bool_ext, "address", "0")),
+                row_start + base_count, row_start + base_count
+            )
+            last_disc_id = base_count + ext_count
+        
+        # 处理REAL类型数据，模板中没有IO_FLOAT工作表时只生成IO_DISC
+        if float_sheet_idx != -1:
+            # 更新进度
+            report(80, "正在处理实数型数据...")
+            
+            float_sheet = workbook.worksheets()[float_sheet_idx]
+            float_column_indices = template.column_indices[float_sheet_idx]
+            float_row_template, float_row_styles = HMIGenerator._row_template(
+                float_column_indices, _IO_FLOAT_FIXED_VALUES, dynamic_fields, field_styles, standard_style
+            )
+            float_positions = HMIGenerator._field_positions(float_column_indices, dynamic_fields)
+            
+            # 基本点位：ItemName = 上位机通讯地址前面部分，使用文本格式；TagID从IO_DISC的最后ID+1开始
+            base_count = HMIGenerator._write_points(
+                float_sheet, float_row_template, float_row_styles, float_positions,
+                zip(*HMIGenerator._point_name_columns(real_df),
+                    HMIGenerator._item_names(real_df, "上位机通讯地址")),
+                row_start, last_disc_id + 1
+            )
+            
+            # 更新进度
+            report(90, "正在处理实数型扩展点位...")
+            
+            # 扩展点位接在基本点位之后，TagID继续递增
+            real_ext = ext_points[~ext_is_bool]
+            HMIGenerator._write_points(
+                float_sheet, float_row_template, float_row_styles, float_positions,
+                zip(real_ext["name"], real_ext["description"], real_ext["station"],
+                    HMIGenerator._item_names(real_ext, "address")),
+                row_start + base_count, last_disc_id + 1 + base_count
+            )
+        
+        # 保存工作簿
+        workbook.close()
+        
+        # 检查文件是否生成成功
+        output_stat = _file_stat(xlsx_output_path)
+        if output_stat is None or output_stat.st_size == 0:
+            raise ValueError(f"生成的文件不存在或为空: {xlsx_output_path}")
+    
+    @staticmethod
+    def _generate(io_data, output_path, root_window, include_bool):
+        """
+        显示进度窗口并在后台生成HMI点表，generate_hmi_table和generate_io_real共用
         
         Args:
             io_data: 上传的IO点表数据(DataFrame)
             output_path: 输出文件路径
             root_window: 父窗口，用于显示进度窗口
+            include_bool: 是否生成BOOL点位，为False时只生成REAL点位
             
         Returns:
             bool: 操作是否成功
         """
-        # 导入xlrd和xlwt库，确保它们在这个方法中可用
-        import xlrd 
-        import xlwt
-        
         try:
-            # 显示导出进度窗口
             export_window = None
+            
+            # 先在后台线程中开始解析模板，与创建进度窗口同时进行
+            template_file = os.path.join(TEMPLATE_DIR, HMI_TEMPLATE)
+            template_stat = _file_stat(template_file)
+            template_future = None
+            if template_stat is not None:
+                template_future = _EXPORT_EXECUTOR.submit(
+                    _load_template, template_file, template_stat.st_mtime
+                )
+            
+            # 显示导出进度窗口
             if root_window:
                 # 使用PySide6的QProgressDialog替代Toplevel
                 export_window = QProgressDialog("正在生成HMI点表，请稍候...", "取消", 0, 100, root_window)
@@ -101,481 +843,31 @@ class HMIGenerator:
                 export_window.setValue(0)
                 export_window.show()
             
-            # 从上传的IO点表中筛选出BOOL类型的点位
-            bool_df = io_data[io_data["数据类型"] == "BOOL"].copy()
-            
-            # 如果没有BOOL类型数据，显示警告
-            if len(bool_df) == 0:
+            # 检查上传的IO点表中是否有需要生成的点位，没有则显示警告
+            data_type = "BOOL" if include_bool else "REAL"
+            if not (io_data["数据类型"].to_numpy() == data_type).any():
                 if export_window:
                     export_window.close()
-                QMessageBox.warning(root_window, "警告", "上传的IO点表中没有BOOL类型的数据点！")
+                QMessageBox.warning(root_window, "警告", f"上传的IO点表中没有{data_type}类型的数据点！")
                 return False
             
             # 检查本地模板文件是否存在
-            template_file = os.path.join(TEMPLATE_DIR, HMI_TEMPLATE)
-            if not os.path.exists(template_file):
+            if template_future is None:
                 if export_window:
                     export_window.close()
                 QMessageBox.warning(root_window, "警告", f"找不到模板文件: {template_file}，请确保该文件在 {TEMPLATE_DIR} 目录下！")
                 return False
             
-            # 定义输出路径，只使用.xls格式
-            xls_output_path = str(Path(output_path).with_suffix('.xls'))
+            # 定义输出路径，使用.xlsx格式
+            xlsx_output_path = str(Path(output_path).with_suffix('.xlsx'))
             
             try:
-                # 确保目标文件不存在
-                if os.path.exists(xls_output_path):
-                    os.remove(xls_output_path)
-                
-                # 更新进度
-                if export_window:
-                    export_window.setLabelText("正在读取模板文件...")
-                    export_window.setValue(10)
-                
-                # 读取模板获取结构
-                template_workbook = xlrd.open_workbook(template_file)
-                
-                # 创建新的工作簿
-                workbook = xlwt.Workbook(encoding='utf-8')
-                
-                # 更新进度
-                if export_window:
-                    export_window.setLabelText("正在创建新工作簿...")
-                    export_window.setValue(20)
-                
-                # 创建宋体字体样式，大小为10
-                font = xlwt.Font()
-                font.name = '宋体'
-                font.height = 20 * 10  # 10号字体对应的高度是200
-                
-                # 设置文本格式
-                text_style = xlwt.XFStyle()
-                text_style.num_format_str = '@'
-                text_style.font = font
-                
-                # 设置标准单元格样式（非文本格式）
-                standard_style = xlwt.XFStyle()
-                standard_style.font = font
-                
-                # 设置数字格式样式
-                number_style = xlwt.XFStyle()
-                number_style.font = font
-                number_style.num_format_str = '0'  # 整数格式
-                
-                # 设置浮点数格式样式
-                float_style = xlwt.XFStyle()
-                float_style.font = font
-                float_style.num_format_str = '0.000000'  # 浮点数格式
-                
-                # 更新进度
-                if export_window:
-                    export_window.setLabelText("正在复制模板...")
-                    export_window.setValue(30)
-                
-                # 首先复制模板中的所有工作表
-                disc_sheet_idx = -1
-                float_sheet_idx = -1
-                
-                # 第一遍循环，复制所有工作表并获取IO_DISC和IO_FLOAT的索引
-                for idx in range(template_workbook.nsheets):
-                    template_sheet = template_workbook.sheet_by_index(idx)
-                    sheet_name = template_sheet.name
-                    
-                    # 复制工作表
-                    new_sheet = workbook.add_sheet(sheet_name)
-                    
-                    # 复制表头和所有内容
-                    for row in range(template_sheet.nrows):
-                        for col in range(template_sheet.ncols):
-                            value = template_sheet.cell_value(row, col)
-                            # 使用宋体字体样式写入单元格
-                            new_sheet.write(row, col, value, standard_style)
-                    
-                    # 记录特殊工作表的索引
-                    if sheet_name == "IO_DISC":
-                        disc_sheet_idx = idx
-                    elif sheet_name == "IO_FLOAT":
-                        float_sheet_idx = idx
-                
-                # 检查是否找到了IO_DISC和IO_FLOAT工作表
-                if disc_sheet_idx == -1:
-                    raise ValueError("模板文件中没有找到IO_DISC工作表")
-                
-                # 更新进度
-                if export_window:
-                    export_window.setLabelText("正在处理布尔型数据...")
-                    export_window.setValue(50)
-                
-                # 重新获取工作表引用
-                disc_sheet = workbook.get_sheet(disc_sheet_idx)
-                
-                # 获取模板中IO_DISC工作表
-                template_disc_sheet = template_workbook.sheet_by_index(disc_sheet_idx)
-                
-                # 查找表中的所有列索引和列名
-                column_indices = {}
-                for col in range(template_disc_sheet.ncols):
-                    header = template_disc_sheet.cell_value(0, col)
-                    if header:
-                        column_indices[header] = col
-                
-                # 设置IO_DISC工作簿的固定值
-                disc_fixed_values = {
-                    "TagType": "用户变量",
-                    "TagDataType": "IODisc",
-                    "ChannelName": "Network1",
-                    "ChannelDriver": "ModbusMaster",
-                    "DeviceSeries": "ModbusTCP",
-                    "DeviceSeriesType": "0",
-                    "CollectControl": "否",
-                    "CollectInterval": 1000,
-                    "CollectOffset": 0,
-                    "TimeZoneBias": 0,
-                    "TimeAdjustment": 0,
-                    "Enable": "是",
-                    "ForceWrite": "否",
-                    "RegName": 0,
-                    "RegType": 0,
-                    "ItemDataType": "BIT",
-                    "ItemAccessMode": "读写",
-                    "HisRecordMode": "不记录",
-                    "HisDeadBand": 0.000000,
-                    "HisInterval": 60
-                }
-                
-                # 数字字段列表
-                number_fields = ["TagID", "CollectInterval", "CollectOffset", "TimeZoneBias", "TimeAdjustment", 
-                                "RegName", "RegType", "HisDeadBand", "HisInterval"]
-                
-                # 设置从第二行开始填充数据（表头是第一行）
-                disc_row_start = 1
-                
-                # 填充BOOL数据 - 从表头后的第二行开始添加
-                total_rows = len(bool_df)
-                for i, (_, row) in enumerate(bool_df.iterrows()):
-                    # 更新进度
-                    if export_window and i % 10 == 0:  # 每10行更新一次进度
-                        progress = 50 + int((i / total_rows) * 40)  # 从50%到90%的进度
-                        export_window.setValue(progress)
-                        export_window.setLabelText(f"正在填充数据... ({i}/{total_rows})")
-                    
-                    # 获取变量信息
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")
-                    comm_address = row.get("上位机通讯地址", "")
-                    channel_code = row.get("通道位号", "")
-                    
-                    # 如果变量名为空，则自动补全
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                        hmi_name = f"YLDW{channel_code}"
-                        description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
-                    
-                    # 填充数据到Excel - 行索引从表头后的第二行开始添加
-                    excel_row = disc_row_start + i
-                    
-                    # 先填充必要的字段
-                    if "TagID" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagID"], excel_row, number_style)
-                    if "TagName" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagName"], hmi_name, standard_style)
-                    if "Description" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["Description"], description, standard_style)
-                    if "DeviceName" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["DeviceName"], station_name, standard_style)
-                    if "TagGroup" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagGroup"], station_name, standard_style)
-                    if "ItemName" in column_indices:
-                        # ItemName = 上位机通讯地址前面部分，使用文本格式且在前面加0
-                        try:
-                            item_name_value = str(comm_address).split('.')[0]
-                            # 在前面加上0
-                            item_name_with_zero = '0' + item_name_value
-                            disc_sheet.write(excel_row, column_indices["ItemName"], item_name_with_zero, text_style)
-                        except (ValueError, TypeError):
-                            disc_sheet.write(excel_row, column_indices["ItemName"], '0' + str(item_name_value), text_style)
-                    
-                    # 填充固定值字段
-                    for field, value in disc_fixed_values.items():
-                        if field in column_indices:
-                            # 根据字段类型选择样式
-                            if field in number_fields:
-                                disc_sheet.write(excel_row, column_indices[field], value, number_style)
-                            else:
-                                disc_sheet.write(excel_row, column_indices[field], value, standard_style)
-                
-                # 处理布尔类型的扩展点位
-                bool_ext_row_counter = disc_row_start + len(bool_df)  # 从基本点位后开始添加
-                bool_ext_id_counter = disc_row_start + len(bool_df) - 1  # 从最后一个ID开始递增
-                
-                # 遍历所有数据行
-                for _, row in io_data.iterrows():
-                    # 获取基础信息
-                    base_hmi_name = row.get("变量名称（HMI）", "")
-                    base_description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")
-                    channel_code = row.get("通道位号", "")
-                    
-                    # 如果变量名为空，则自动补全
-                    if pd.isna(base_hmi_name) or str(base_hmi_name).strip() == "":
-                        base_hmi_name = f"YLDW{channel_code}"
-                        base_description = f"预留点位{channel_code}" if pd.isna(base_description) or str(base_description).strip() == "" else base_description
-                    
-                    # 处理该行的BOOL类型扩展点位
-                    for ext_point in HMIGenerator.EXTENDED_POINTS:
-                        # 只处理BOOL类型点位
-                        if not ext_point["is_bool"]:
-                            continue
-                            
-                        point_name = ext_point["name"]
-                        comm_addr_field = ext_point["comm_addr"]
-                        point_suffix = ext_point["suffix"]
-                        
-                        # 获取扩展点位的值和通讯地址
-                        point_value = row.get(point_name, "")
-                        point_comm_addr = row.get(comm_addr_field, "")
-                        
-                        # 如果扩展点位值为空或"/"，则跳过
-                        if not point_value or point_value == "/":
-                            continue
-                        
-                        # 如果通讯地址为空或"/"，则跳过
-                        if not point_comm_addr or point_comm_addr == "/":
-                            continue
-                        
-                        # 为扩展点位创建变量名和描述
-                        ext_hmi_name = str(base_hmi_name) + point_suffix
-                        ext_description = str(base_description) + "_" + point_name
-                        
-                        # 填充扩展点位数据
-                        bool_ext_id_counter += 1
-                        
-                        if "TagID" in column_indices:
-                            disc_sheet.write(bool_ext_row_counter, column_indices["TagID"], bool_ext_id_counter, number_style)
-                        if "TagName" in column_indices:
-                            disc_sheet.write(bool_ext_row_counter, column_indices["TagName"], ext_hmi_name, standard_style)
-                        if "Description" in column_indices:
-                            disc_sheet.write(bool_ext_row_counter, column_indices["Description"], ext_description, standard_style)
-                        if "DeviceName" in column_indices:
-                            disc_sheet.write(bool_ext_row_counter, column_indices["DeviceName"], station_name, standard_style)
-                        if "TagGroup" in column_indices:
-                            disc_sheet.write(bool_ext_row_counter, column_indices["TagGroup"], station_name, standard_style)
-                        if "ItemName" in column_indices:
-                            # ItemName = 上位机通讯地址，使用文本格式且在前面加0
-                            try:
-                                item_name_value = str(point_comm_addr).split('.')[0]
-                                # 在前面加上0
-                                item_name_with_zero = '0' + item_name_value
-                                disc_sheet.write(bool_ext_row_counter, column_indices["ItemName"], item_name_with_zero, text_style)
-                            except (ValueError, TypeError):
-                                disc_sheet.write(bool_ext_row_counter, column_indices["ItemName"], '0' + str(item_name_value), text_style)
-                        
-                        # 填充固定值字段
-                        for field, value in disc_fixed_values.items():
-                            if field in column_indices:
-                                if field in number_fields:
-                                    disc_sheet.write(bool_ext_row_counter, column_indices[field], value, number_style)
-                                else:
-                                    disc_sheet.write(bool_ext_row_counter, column_indices[field], value, standard_style)
-                        
-                        # 递增行计数器
-                        bool_ext_row_counter += 1
-                
-                # 处理REAL类型数据
-                real_df = io_data[io_data["数据类型"] == "REAL"].copy()
-                if len(real_df) > 0 and float_sheet_idx != -1:
-                    # 获取FLOAT工作表的引用
-                    float_sheet = workbook.get_sheet(float_sheet_idx)
-                    
-                    # 获取模板中的IO_FLOAT工作表
-                    template_float_sheet = template_workbook.sheet_by_index(float_sheet_idx)
-                    
-                    # 查找FLOAT表中的所有列索引和列名
-                    float_column_indices = {}
-                    for col in range(template_float_sheet.ncols):
-                        header = template_float_sheet.cell_value(0, col)
-                        if header:
-                            float_column_indices[header] = col
-                    
-                    # 设置IO_FLOAT工作簿的固定值
-                    float_fixed_values = {
-                        "TagType": "用户变量",
-                        "TagDataType": "IOFloat",
-                        "MaxRawValue": 1000000000.000000,  # 使用数字而非字符串
-                        "MinRawValue": -1000000000.000000,  # 使用数字而非字符串
-                        "MaxValue": 1000000000.000000,  # 使用数字而非字符串
-                        "MinValue": -1000000000.000000,  # 使用数字而非字符串
-                        "ConvertType": "无",
-                        "IsFilter": "否",
-                        "DeadBand": 0,  # 使用数字而非字符串
-                        "ChannelName": "Network1",
-                        "ChannelDriver": "ModbusMaster",
-                        "DeviceSeries": "ModbusTCP",
-                        "DeviceSeriesType": 0,  # 使用数字而非字符串
-                        "CollectControl": "否",
-                        "CollectInterval": 1000,  # 使用数字而非字符串
-                        "CollectOffset": 0,  # 使用数字而非字符串
-                        "TimeZoneBias": 0,  # 使用数字而非字符串
-                        "TimeAdjustment": 0,  # 使用数字而非字符串
-                        "Enable": "是",
-                        "ForceWrite": "否",
-                        "RegName": 4,  # 使用数字而非字符串
-                        "RegType": 3,  # 使用数字而非字符串
-                        "ItemDataType": "FLOAT",
-                        "ItemAccessMode": "读写",
-                        "HisRecordMode": "不记录",
-                        "HisDeadBand": 0.000000,  # 使用数字而非字符串
-                        "HisInterval": 60  # 使用数字而非字符串
-                    }
-                    
-                    # 浮点数字段列表
-                    float_fields = ["HiHiLimit", "HiLimit", "LoLimit", "LoLoLimit"]
-                    
-                    # 设置从第二行开始填充数据（表头是第一行）
-                    float_row_start = 1
-                    
-                    # BOOL ID计数器值
-                    last_disc_id = bool_ext_id_counter
-                    
-                    # 填充REAL数据
-                    start_id = last_disc_id + 1  # 从DISC表的最后ID+1开始
-                    
-                    # 行计数器，从表头后开始
-                    excel_row_counter = float_row_start  # 从第二行开始添加
-                    current_id_counter = start_id  # ID计数器从last_disc_id+1开始
-                    
-                    for i, (_, row) in enumerate(real_df.iterrows()):
-                        # 获取变量信息
-                        hmi_name = row.get("变量名称（HMI）", "")
-                        description = row.get("变量描述", "")
-                        station_name = row.get("场站名", "未知站点")
-                        comm_address = row.get("上位机通讯地址", "")
-                        channel_code = row.get("通道位号", "")
-                        
-                        # 如果变量名为空，则自动补全
-                        if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                            hmi_name = f"YLDW{channel_code}"
-                            description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
-                        
-                        # 当前ID
-                        current_id = current_id_counter
-                        current_id_counter += 1
-                        
-                        # 填充数据到Excel - 使用行计数器
-                        if "TagID" in float_column_indices:
-                            float_sheet.write(excel_row_counter, float_column_indices["TagID"], current_id, number_style)
-                        if "TagName" in float_column_indices:
-                            float_sheet.write(excel_row_counter, float_column_indices["TagName"], hmi_name, standard_style)
-                        if "Description" in float_column_indices:
-                            float_sheet.write(excel_row_counter, float_column_indices["Description"], description, standard_style)
-                        if "DeviceName" in float_column_indices:
-                            float_sheet.write(excel_row_counter, float_column_indices["DeviceName"], station_name, standard_style)
-                        if "TagGroup" in float_column_indices:
-                            float_sheet.write(excel_row_counter, float_column_indices["TagGroup"], station_name, standard_style)
-                        if "ItemName" in float_column_indices:
-                            # 确保值为文本格式
-                            try:
-                                item_name_value = str(comm_address).split('.')[0]
-                                float_sheet.write(excel_row_counter, float_column_indices["ItemName"], item_name_value, text_style)
-                            except (ValueError, TypeError):
-                                float_sheet.write(excel_row_counter, float_column_indices["ItemName"], item_name_value, text_style)
-                        
-                        # 填充固定值字段
-                        for field, value in float_fixed_values.items():
-                            if field in float_column_indices:
-                                if field in float_fields:
-                                    float_sheet.write(excel_row_counter, float_column_indices[field], value, float_style)
-                                elif field in number_fields:
-                                    float_sheet.write(excel_row_counter, float_column_indices[field], value, number_style)
-                                else:
-                                    float_sheet.write(excel_row_counter, float_column_indices[field], value, standard_style)
-                        
-                        # 递增行计数器
-                        excel_row_counter += 1
-                
-                # 处理REAL类型的扩展点位
-                real_ext_row_counter = float_row_start + len(real_df)  # 从基本点位后开始添加
-                real_ext_id_counter = last_disc_id + len(real_df)  # 从最后一个ID计数
-                
-                # 遍历所有数据行
-                for _, row in io_data.iterrows():
-                    # 获取基础信息
-                    base_hmi_name = row.get("变量名称（HMI）", "")
-                    base_description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")
-                    channel_code = row.get("通道位号", "")
-                    
-                    # 如果变量名为空，则自动补全
-                    if pd.isna(base_hmi_name) or str(base_hmi_name).strip() == "":
-                        base_hmi_name = f"YLDW{channel_code}"
-                        base_description = f"预留点位{channel_code}" if pd.isna(base_description) or str(base_description).strip() == "" else base_description
-                    
-                    # 处理该行的REAL类型扩展点位
-                    for ext_point in HMIGenerator.EXTENDED_POINTS:
-                        # 只处理REAL类型点位
-                        if ext_point["is_bool"]:
-                            continue
-                            
-                        point_name = ext_point["name"]
-                        comm_addr_field = ext_point["comm_addr"]
-                        point_suffix = ext_point["suffix"]
-                        
-                        # 获取扩展点位的值和通讯地址
-                        point_value = row.get(point_name, "")
-                        point_comm_addr = row.get(comm_addr_field, "")
-                        
-                        # 如果扩展点位值为空或"/"或None，则跳过
-                        if pd.isna(point_value) or not point_value or point_value == "/":
-                            continue
-                        
-                        # 如果通讯地址为空或"/"或None，则跳过
-                        if pd.isna(point_comm_addr) or not point_comm_addr or point_comm_addr == "/":
-                            continue
-                        
-                        # 为扩展点位创建变量名和描述
-                        ext_hmi_name = str(base_hmi_name) + point_suffix
-                        ext_description = str(base_description) + "_" + point_name
-                        
-                        # 填充扩展点位数据
-                        real_ext_id_counter += 1
-                        
-                        if "TagID" in float_column_indices:
-                            float_sheet.write(real_ext_row_counter, float_column_indices["TagID"], real_ext_id_counter, number_style)
-                        if "TagName" in float_column_indices:
-                            float_sheet.write(real_ext_row_counter, float_column_indices["TagName"], ext_hmi_name, standard_style)
-                        if "Description" in float_column_indices:
-                            float_sheet.write(real_ext_row_counter, float_column_indices["Description"], ext_description, standard_style)
-                        if "DeviceName" in float_column_indices:
-                            float_sheet.write(real_ext_row_counter, float_column_indices["DeviceName"], station_name, standard_style)
-                        if "TagGroup" in float_column_indices:
-                            float_sheet.write(real_ext_row_counter, float_column_indices["TagGroup"], station_name, standard_style)
-                        if "ItemName" in float_column_indices:
-                            # 确保值为文本格式
-                            try:
-                                item_name_value = str(point_comm_addr).split('.')[0]
-                                float_sheet.write(real_ext_row_counter, float_column_indices["ItemName"], item_name_value, text_style)
-                            except (ValueError, TypeError):
-                                float_sheet.write(real_ext_row_counter, float_column_indices["ItemName"], item_name_value, text_style)
-                        
-                        # 填充固定值字段
-                        for field, value in float_fixed_values.items():
-                            if field in float_column_indices:
-                                if field in float_fields:
-                                    float_sheet.write(real_ext_row_counter, float_column_indices[field], value, float_style)
-                                elif field in number_fields:
-                                    float_sheet.write(real_ext_row_counter, float_column_indices[field], value, number_style)
-                                else:
-                                    float_sheet.write(real_ext_row_counter, float_column_indices[field], value, standard_style)
-                        
-                        # 递增行计数器
-                        real_ext_row_counter += 1
-                
-                # 保存工作簿
-                workbook.save(xls_output_path)
-                
-                # 检查文件是否生成成功
-                if not (os.path.exists(xls_output_path) and os.path.getsize(xls_output_path) > 0):
-                    raise ValueError(f"生成的文件不存在或为空: {xls_output_path}")
+                # 点表在后台线程中生成，主线程只刷新进度窗口，导出期间界面保持响应；
+                # 生成任务排在模板解析之后执行，直接使用解析结果
+                _run_in_background(
+                    export_window, HMIGenerator._generate_hmi_table_core,
+                    io_data, template_future, xlsx_output_path, include_bool
+                )
                 
                 # 不再自动打开文件，由UI层负责显示消息和打开文件
                 
@@ -600,11 +892,32 @@ class HMIGenerator:
             QMessageBox.critical(root_window, "错误", f"生成HMI REAL点表时发生错误:\n{str(e)}\n\n详细错误信息:\n{error_details}")
             return False
     
+    @staticmethod
+    def generate_hmi_table(io_data, output_path, root_window=None):
+        """
+        生成HMI点表(BOOL类型数据)
+        
+        处理IO数据并生成符合亚控HMI要求的布尔类型点表Excel文件，
+        同时生成IO_FLOAT表中的REAL类型点位
+        支持进度显示窗口，提供用户友好的导出体验
+        
+        Args:
+            io_data: 上传的IO点表数据(DataFrame)
+            output_path: 输出文件路径
+            root_window: 父窗口，用于显示进度窗口
+        
+        Returns:
+            bool: 操作是否成功
+        """
+        return HMIGenerator._generate(io_data, output_path, root_window, include_bool=True)
+    
     @staticmethod
     def generate_io_real(io_data, output_path, root_window=None):
         """
         生成IO_REAL工作簿（用于模拟量点位）
         
+        只生成IO_FLOAT表中的REAL类型点位，TagID从1开始
+        
         Args:
             io_data: 上传的IO点表数据(DataFrame)
             output_path: 输出文件路径
@@ -613,449 +926,7 @@ class HMIGenerator:
         Returns:
             bool: 操作是否成功
         """
-        # 导入xlrd和xlwt库，确保它们在这个方法中可用
-        import xlrd
-        import xlwt
-        
-        try:
-            # 显示导出进度窗口
-            export_window = None
-            if root_window:
-                export_window = QProgressDialog("正在生成HMI点表，请稍候...", "取消", 0, 100, root_window)
-                export_window.setWindowTitle("正在导出HMI点表")
-                export_window.setWindowModality(Qt.WindowModal)
-                export_window.setMinimumDuration(0)
-                export_window.setValue(0)
-                export_window.show()
-            
-            # 从上传的IO点表中筛选出REAL类型的点位
-            real_df = io_data[io_data["数据类型"] == "REAL"].copy()
-            
-            # 如果没有REAL类型数据，显示警告
-            if len(real_df) == 0:
-                if export_window:
-                    export_window.close()
-                QMessageBox.warning(root_window, "警告", "上传的IO点表中没有REAL类型的数据点！")
-                return False
-            
-            # 检查本地模板文件是否存在
-            template_file = os.path.join(TEMPLATE_DIR, HMI_TEMPLATE)
-            if not os.path.exists(template_file):
-                if export_window:
-                    export_window.close()
-                QMessageBox.warning(root_window, "警告", f"找不到模板文件: {template_file}，请确保该文件在 {TEMPLATE_DIR} 目录下！")
-                return False
-            
-            # 定义输出路径，只使用.xls格式
-            xls_output_path = str(Path(output_path).with_suffix('.xls'))
-            
-            try:
-                # 检查输出文件是否存在，不存在则创建新文件
-                if os.path.exists(xls_output_path):
-                    os.remove(xls_output_path)
-                
-                # 读取模板获取结构
-                template_workbook = xlrd.open_workbook(template_file)
-                
-                # 创建新的工作簿
-                workbook = xlwt.Workbook(encoding='utf-8')
-                
-                # 创建宋体字体样式，大小为10
-                font = xlwt.Font()
-                font.name = '宋体'
-                font.height = 20 * 10  # 10号字体对应的高度是200
-                
-                # 设置文本格式
-                text_style = xlwt.XFStyle()
-                text_style.num_format_str = '@'
-                text_style.font = font
-                
-                # 设置标准单元格样式（非文本格式）
-                standard_style = xlwt.XFStyle()
-                standard_style.font = font
-                
-                # 设置数字格式样式
-                number_style = xlwt.XFStyle()
-                number_style.font = font
-                number_style.num_format_str = '0'  # 整数格式
-                
-                # 设置浮点数格式样式
-                float_style = xlwt.XFStyle()
-                float_style.font = font
-                float_style.num_format_str = '0.000000'  # 浮点数格式
-                
-                # 首先复制模板中的所有工作表
-                float_sheet_idx = -1
-                
-                # 第一遍循环，复制所有工作表并获取IO_FLOAT的索引
-                for idx in range(template_workbook.nsheets):
-                    template_sheet = template_workbook.sheet_by_index(idx)
-                    sheet_name = template_sheet.name
-                    
-                    # 复制工作表
-                    new_sheet = workbook.add_sheet(sheet_name)
-                    
-                    # 复制表头和所有内容
-                    for row in range(template_sheet.nrows):
-                        for col in range(template_sheet.ncols):
-                            value = template_sheet.cell_value(row, col)
-                            # 使用宋体字体样式写入单元格
-                            new_sheet.write(row, col, value, standard_style)
-                    
-                    # 记录IO_FLOAT工作表的索引
-                    if sheet_name == "IO_FLOAT":
-                        float_sheet_idx = idx
-                
-                # 检查是否找到了IO_FLOAT工作表
-                if float_sheet_idx == -1:
-                    raise ValueError("模板文件中没有找到IO_FLOAT工作表")
-                
-                # 查找IO_DISC工作表以获取TagID计数
-                last_disc_id = 0
-                disc_sheet_idx = -1
-                
-                for idx in range(template_workbook.nsheets):
-                    template_sheet = template_workbook.sheet_by_index(idx)
-                    if template_sheet.name == "IO_DISC":
-                        disc_sheet_idx = idx
-                        # 有数据行则计算最后的ID
-                        if template_sheet.nrows > 1:
-                            # 查找TagID列
-                            for col in range(template_sheet.ncols):
-                                if template_sheet.cell_value(0, col) == "TagID":
-                                    if template_sheet.nrows > 1:
-                                        try:
-                                            last_id_value = template_sheet.cell_value(template_sheet.nrows-1, col)
-                                            last_disc_id = int(last_id_value)
-                                        except (ValueError, TypeError):
-                                            pass
-                                    break
-                        break
-                
-                # 获取工作表引用和模板信息
-                float_sheet = workbook.get_sheet(float_sheet_idx)
-                template_float_sheet = template_workbook.sheet_by_index(float_sheet_idx)
-                
-                # 查找FLOAT表中的所有列索引和列名
-                column_indices = {}
-                for col in range(template_float_sheet.ncols):
-                    header = template_float_sheet.cell_value(0, col)
-                    if header:
-                        column_indices[header] = col
-                
-                # 设置IO_DISC工作簿的固定值 - 改为使用数字而非字符串
-                disc_fixed_values = {
-                    "ContainerType": 1,  # 改为数字
-                    "InitialValueBool": "false",
-                    "SecurityZoneID": "None",
-                    "RecordEvent": "false",
-                    "SaveValue": "true",
-                    "SaveParameter": "true",
-                    "AccessByOtherApplication": "false",
-                    "ExtentField1": "",
-                    "ExtentField2": "",
-                    "HisRecMode": 2,  # 改为数字
-                    "HisRecInterval": 60,  # 改为数字
-                    "AlarmType": 256,  # 改为数字
-                    "CloseString": "关闭",
-                    "OpenString": "打开",
-                    "AlarmDelay": 0,  # 改为数字
-                    "DiscInhibitor": "",
-                    "ExtentField3": "",
-                    "ExtentField4": "",
-                    "ExtentField5": "",
-                    "ExtentField6": "",
-                    "ExtentField7": "",
-                    "ExtentField8": "",
-                    "CloseToOpen": "关到开",
-                    "OpenToClose": "开到关",
-                    "StateEnumTable": "",
-                    "IOConfigControl": "true",
-                    "IOEnable": "true",
-                    "ForceRead": "false",
-                    "ForceWrite": "false",
-                    "DataConvertMode": 1  # 改为数字
-                }
-                
-                # 设置IO_FLOAT工作簿的固定值 - 改为使用数字而非字符串
-                float_fixed_values = {
-                    "ContainerType": 1,  # 改为数字
-                    "MaxValue": 1000000000,  # 改为数字
-                    "MinValue": -1000000000,  # 改为数字
-                    "InitialValue": 0,  # 改为数字
-                    "Sensitivity": 0,  # 改为数字
-                    "EngineerUnits": "",
-                    "SecurityZoneID": "None",
-                    "RecordEvent": "false",
-                    "SaveValue": "true",
-                    "SaveParameter": "true",
-                    "AccessByOtherApplication": "false",
-                    "ExtentField1": "",
-                    "ExtentField2": "",
-                    "HisRecMode": 2,  # 改为数字
-                    "HisRecChangeDeadband": 0,  # 改为数字
-                    "HisRecInterval": 60,  # 改为数字
-                    "HiHiText": "高高",
-                    "HiHiPriority": 1,  # 改为数字
-                    "HiHiInhibitor": "",
-                    "HiText": "高",
-                    "HiPriority": 1,  # 改为数字
-                    "HiInhibitor": "",
-                    "LoText": "低",
-                    "LoPriority": 1,  # 改为数字
-                    "LoInhibitor": "",
-                    "LoLoText": "低低",
-                    "LoLoPriority": 1,  # 改为数字
-                    "LoLoInhibitor": "",
-                    "LimitDeadband": 0,  # 改为数字
-                    "LimitDelay": 0,  # 改为数字
-                    "DevMajorEnabled": "false",
-                    "DevMajorLimit": 80,  # 改为数字
-                    "DevMajorText": "主要",
-                    "DevMajorPriority": 1,  # 改为数字
-                    "MajorInhibitor": "",
-                    "DevMinorEnabled": "false",
-                    "DevMinorLimit": 20,  # 改为数字
-                    "DevMinorText": "次要",
-                    "DevMinorPriority": 1,  # 改为数字
-                    "MinorInhibitor": "",
-                    "DevDeadband": 0,  # 改为数字
-                    "DevTargetValue": 100,  # 改为数字
-                    "DevDelay": 0,  # 改为数字
-                    "RocEnabled": "false",
-                    "RocPercent": 20,  # 改为数字
-                    "RocTimeUnit": 0,  # 改为数字
-                    "RocText": "变化率",
-                    "RocDelay": 0,  # 改为数字
-                    "RocPriority": 1,  # 改为数字
-                    "RocInhibitor": "",
-                    "StatusAlarmTableID": 0,  # 改为数字
-                    "StatusAlarmEnabled": "false",
-                    "StatusAlarmTableName": "",
-                    "StatusInhibitor": "",
-                    # 移除AlarmGroup字段，避免重复写入
-                    # "AlarmGroup": "",
-                    "ExtentField3": "",
-                    "ExtentField4": "",
-                    "ExtentField5": "",
-                    "ExtentField6": "",
-                    "ExtentField7": "",
-                    "ExtentField8": "",
-                    "StateEnumTable": "",
-                    "IOConfigControl": "true",
-                    "MaxRaw": 1000000000,  # 改为数字
-                    "MinRaw": -1000000000,  # 改为数字
-                    "IOEnable": "true",
-                    "ForceRead": "false",
-                    "ForceWrite": "false",
-                    "DataConvertMode": 1,  # 改为数字
-                    "NlnTableID": 0,  # 改为数字
-                    "AddupMaxVal": 0,  # 改为数字
-                    "AddupMinVal": 0  # 改为数字
-                }
-                
-                # 数值型字段列表 - 用于判断应使用哪种样式
-                number_fields = ["TagID", "ContainerType", "HisRecMode", "HisRecInterval", "AlarmType", 
-                                "AlarmDelay", "DataConvertMode", "MaxValue", "MinValue", "InitialValue", 
-                                "Sensitivity", "HisRecChangeDeadband", "HiHiPriority", "HiPriority", 
-                                "LoPriority", "LoLoPriority", "LimitDeadband", "LimitDelay", "DevMajorLimit",
-                                "DevMajorPriority", "DevMinorLimit", "DevMinorPriority", "DevDeadband", 
-                                "DevTargetValue", "DevDelay", "RocPercent", "RocTimeUnit", "RocDelay", 
-                                "RocPriority", "StatusAlarmTableID", "MaxRaw", "MinRaw", "NlnTableID", 
-                                "AddupMaxVal", "AddupMinVal"]
-                
-                # 浮点数字段
-                float_fields = ["HiHiLimit", "HiLimit", "LoLimit", "LoLoLimit"]
-                
-                # 设置从第二行开始填充数据（表头是第一行）
-                disc_row_start = 1
-                
-                # 填充BOOL数据 - 从表头后的第二行开始添加
-                for i, (_, row) in enumerate(bool_df.iterrows()):
-                    # 获取变量信息
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")
-                    alarm_priority = row.get("报警等级", 1)  # 默认为1，确保为数字
-                    
-                    # 如果变量名为空，则自动补全
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                        channel_code = row.get("通道位号", "")
-                        hmi_name = f"YLDW{channel_code}"
-                        description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
-                    
-                    # 如果报警等级为空，则设为默认值1
-                    if pd.isna(alarm_priority) or str(alarm_priority).strip() == "":
-                        alarm_priority = 1
-                    else:
-                        # 尝试将报警等级转换为数字
-                        try:
-                            alarm_priority = int(alarm_priority)
-                        except (ValueError, TypeError):
-                            alarm_priority = 1
-                    
-                    # 当前行索引
-                    excel_row = disc_row_start + i
-                    
-                    # 填充必要的字段
-                    if "TagID" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagID"], excel_row, number_style)
-                    if "TagName" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagName"], hmi_name, standard_style)
-                    if "Description" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["Description"], description, standard_style)
-                    if "AlarmPriority" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["AlarmPriority"], alarm_priority, number_style)
-                    if "AlarmGroup" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["AlarmGroup"], station_name, standard_style)
-                    if "IOAccess" in column_indices:
-                        io_access = f"Sever1.{hmi_name}.Value"
-                        disc_sheet.write(excel_row, column_indices["IOAccess"], io_access, standard_style)
-                    
-                    # 填充固定值字段
-                    for field, value in disc_fixed_values.items():
-                        if field in column_indices:
-                            if field in number_fields:
-                                disc_sheet.write(excel_row, column_indices[field], value, number_style)
-                            else:
-                                disc_sheet.write(excel_row, column_indices[field], value, standard_style)
-                
-                # 确定REAL数据的起始ID
-                float_start_id = disc_row_start + len(bool_df)
-                
-                # 填充REAL数据
-                for i, (_, row) in enumerate(real_df.iterrows()):
-                    # 获取变量信息
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")  # 获取场站名
-                    alarm_priority = row.get("报警等级", 1)  # 默认为1，确保为数字
-                    
-                    # 如果变量名为空，则自动补全
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                        channel_code = row.get("通道位号", "")
-                        hmi_name = f"YLDW{channel_code}"
-                        description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
-                    
-                    # 如果报警等级为空，则设为默认值1
-                    if pd.isna(alarm_priority) or str(alarm_priority).strip() == "":
-                        alarm_priority = 1
-                    else:
-                        # 尝试将报警等级转换为数字
-                        try:
-                            alarm_priority = int(alarm_priority)
-                        except (ValueError, TypeError):
-                            alarm_priority = 1
-                    
-                    # 获取各类限值和报警信息
-                    shh_value = row.get("SHH设定值", "")
-                    sh_value = row.get("SH设定值", "")
-                    sl_value = row.get("SL设定值", "")
-                    sll_value = row.get("SLL设定值", "")
-                    
-                    # 判断是否启用各类报警
-                    hihi_enabled = "true" if not pd.isna(shh_value) and shh_value and shh_value != "/" else "false"
-                    hi_enabled = "true" if not pd.isna(sh_value) and sh_value and sh_value != "/" else "false"
-                    lo_enabled = "true" if not pd.isna(sl_value) and sl_value and sl_value != "/" else "false"
-                    lolo_enabled = "true" if not pd.isna(sll_value) and sll_value and sll_value != "/" else "false"
-                    
-                    # 当前行索引和ID
-                    excel_row = disc_row_start + i
-                    current_id = float_start_id + i
-                    
-                    # 填充必要的字段
-                    if "TagID" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagID"], current_id, number_style)
-                    if "TagName" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["TagName"], hmi_name, standard_style)
-                    if "Description" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["Description"], description, standard_style)
-                    if "AlarmPriority" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["AlarmPriority"], alarm_priority, number_style)
-                    if "AlarmGroup" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["AlarmGroup"], station_name, standard_style)
-                    if "IOAccess" in column_indices:
-                        io_access = f"Sever1.{hmi_name}.Value"
-                        disc_sheet.write(excel_row, column_indices["IOAccess"], io_access, standard_style)
-                    
-                    # 填充报警启用和限值信息
-                    if "HiHiEnabled" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["HiHiEnabled"], hihi_enabled, standard_style)
-                    if "HiHiLimit" in column_indices and not pd.isna(shh_value) and shh_value and shh_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            shh_float = float(shh_value)
-                            disc_sheet.write(excel_row, column_indices["HiHiLimit"], shh_float, float_style)
-                        except (ValueError, TypeError):
-                            disc_sheet.write(excel_row, column_indices["HiHiLimit"], shh_value, standard_style)
-                    
-                    if "HiEnabled" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["HiEnabled"], hi_enabled, standard_style)
-                    if "HiLimit" in column_indices and not pd.isna(sh_value) and sh_value and sh_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            sh_float = float(sh_value)
-                            disc_sheet.write(excel_row, column_indices["HiLimit"], sh_float, float_style)
-                        except (ValueError, TypeError):
-                            disc_sheet.write(excel_row, column_indices["HiLimit"], sh_value, standard_style)
-                    
-                    if "LoEnabled" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["LoEnabled"], lo_enabled, standard_style)
-                    if "LoLimit" in column_indices and not pd.isna(sl_value) and sl_value and sl_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            sl_float = float(sl_value)
-                            disc_sheet.write(excel_row, column_indices["LoLimit"], sl_float, float_style)
-                        except (ValueError, TypeError):
-                            disc_sheet.write(excel_row, column_indices["LoLimit"], sl_value, standard_style)
-                    
-                    if "LoLoEnabled" in column_indices:
-                        disc_sheet.write(excel_row, column_indices["LoLoEnabled"], lolo_enabled, standard_style)
-                    if "LoLoLimit" in column_indices and not pd.isna(sll_value) and sll_value and sll_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            sll_float = float(sll_value)
-                            disc_sheet.write(excel_row, column_indices["LoLoLimit"], sll_float, float_style)
-                        except (ValueError, TypeError):
-                            disc_sheet.write(excel_row, column_indices["LoLoLimit"], sll_value, standard_style)
-                    
-                    # 填充固定值字段
-                    for field, value in disc_fixed_values.items():
-                        if field in column_indices:
-                            if field in number_fields:
-                                disc_sheet.write(excel_row, column_indices[field], value, number_style)
-                            else:
-                                disc_sheet.write(excel_row, column_indices[field], value, standard_style)
-                
-                # 保存工作簿
-                workbook.save(xls_output_path)
-                
-                # 检查文件是否生成成功
-                if not (os.path.exists(xls_output_path) and os.path.getsize(xls_output_path) > 0):
-                    raise ValueError(f"生成的文件不存在或为空: {xls_output_path}")
-                
-                # 不再自动打开文件，由UI层负责显示消息和打开文件
-                
-                # 关闭导出进度窗口
-                if export_window:
-                    export_window.close()
-                
-                return True
-                
-            except Exception as e:
-                error_msg = f"生成HMI REAL点表失败: {str(e)}\n{traceback.format_exc()}"
-                QMessageBox.critical(root_window, "错误", error_msg)
-                
-                if export_window:
-                    export_window.close()
-                return False
-                
-        except Exception as e:
-            if export_window and export_window.isVisible():
-                export_window.close()
-            error_details = traceback.format_exc()
-            QMessageBox.critical(root_window, "错误", f"生成HMI REAL点表时发生错误:\n{str(e)}\n\n详细错误信息:\n{error_details}")
-            return False
+        return HMIGenerator._generate(io_data, output_path, root_window, include_bool=False)
     
     @staticmethod
     def generate_data_dictionary_table(io_data, output_path, root_window=None):
@@ -1070,8 +941,7 @@ class HMIGenerator:
         Returns:
             bool: 操作是否成功
         """
-        # 导入xlrd和xlwt库，确保它们在这个方法中可用
-        import xlrd 
+        # 导入xlwt库，确保它在这个方法中可用
         import xlwt
         
         try:
@@ -1085,13 +955,13 @@ class HMIGenerator:
                 export_window.setValue(0)
                 export_window.show()
             
-            # 筛选出BOOL和REAL类型数据
-            bool_df = io_data[io_data["数据类型"] == "BOOL"].copy()
-            real_df = io_data[io_data["数据类型"] == "REAL"].copy()
+            # 按数据类型一次分组，筛选出BOOL和REAL类型数据
+            bool_df, real_df = HMIGenerator._split_by_data_type(io_data)
             
             # 检查本地模板文件是否存在
             template_file = os.path.join(TEMPLATE_DIR, DATA_DICTIONARY_TEMPLATE)
-            if not os.path.exists(template_file):
+            template_stat = _file_stat(template_file)
+            if template_stat is None:
                 if export_window:
                     export_window.close()
                 QMessageBox.warning(root_window, "警告", f"找不到模板文件: {template_file}，请确保该文件在 {TEMPLATE_DIR} 目录下！")
@@ -1110,8 +980,8 @@ class HMIGenerator:
                     export_window.setLabelText("正在读取模板文件...")
                     export_window.setValue(10)
                 
-                # 读取模板获取结构
-                template_workbook = xlrd.open_workbook(template_file)
+                # 读取模板获取结构，模板未修改时直接使用上次解析的结果
+                template = _load_template(template_file, template_stat.st_mtime)
                 
                 # 创建新的工作簿
                 workbook = xlwt.Workbook(encoding='utf-8')
@@ -1121,29 +991,8 @@ class HMIGenerator:
                     export_window.setLabelText("正在创建新工作簿...")
                     export_window.setValue(20)
                 
-                # 创建宋体字体样式，大小为10
-                font = xlwt.Font()
-                font.name = '宋体'
-                font.height = 20 * 10  # 10号字体对应的高度是200
-                
-                # 设置文本格式
-                text_style = xlwt.XFStyle()
-                text_style.num_format_str = '@'
-                text_style.font = font
-                
-                # 设置标准单元格样式（非文本格式）
-                standard_style = xlwt.XFStyle()
-                standard_style.font = font
-                
-                # 设置数字格式样式
-                number_style = xlwt.XFStyle()
-                number_style.font = font
-                number_style.num_format_str = '0'  # 整数格式
-                
-                # 设置浮点数格式样式
-                float_style = xlwt.XFStyle()
-                float_style.font = font
-                float_style.num_format_str = '0.000000'  # 浮点数格式
+                # 宋体10号字体的标准、整数和浮点数样式，多次导出共用同一组样式对象
+                standard_style, number_style, float_style = _data_dictionary_styles()
                 
                 # 更新进度
                 if export_window:
@@ -1155,19 +1004,16 @@ class HMIGenerator:
                 float_sheet_idx = -1
                 
                 # 第一遍循环，复制所有工作表并获取IO_DISC和IO_FLOAT的索引
-                for idx in range(template_workbook.nsheets):
-                    template_sheet = template_workbook.sheet_by_index(idx)
-                    sheet_name = template_sheet.name
-                    
+                for idx, (sheet_name, rows) in enumerate(zip(template.sheet_names, template.sheet_rows)):
                     # 复制工作表
                     new_sheet = workbook.add_sheet(sheet_name)
                     
-                    # 复制表头和所有内容
-                    for row in range(template_sheet.nrows):
-                        for col in range(template_sheet.ncols):
-                            value = template_sheet.cell_value(row, col)
+                    # 复制表头和所有内容，每行只取一次行对象
+                    for row, row_values in enumerate(rows):
+                        write = new_sheet.row(row).write
+                        for col, value in enumerate(row_values):
                             # 使用宋体字体样式写入单元格
-                            new_sheet.write(row, col, value, standard_style)
+                            write(col, value, standard_style)
                     
                     # 记录特殊工作表的索引
                     if sheet_name == "IO_DISC":
@@ -1183,136 +1029,9 @@ class HMIGenerator:
                 disc_sheet = workbook.get_sheet(disc_sheet_idx)
                 float_sheet = workbook.get_sheet(float_sheet_idx)
                 
-                # 获取模板中IO_DISC工作表
-                template_disc_sheet = template_workbook.sheet_by_index(disc_sheet_idx)
-                
-                # 查找表中的所有列索引和列名
-                disc_column_indices = {}
-                for col in range(template_disc_sheet.ncols):
-                    header = template_disc_sheet.cell_value(0, col)
-                    if header:
-                        disc_column_indices[header] = col
-                
-                # 获取模板中IO_FLOAT工作表
-                template_float_sheet = template_workbook.sheet_by_index(float_sheet_idx)
-                
-                # 查找表中的所有列索引和列名
-                float_column_indices = {}
-                for col in range(template_float_sheet.ncols):
-                    header = template_float_sheet.cell_value(0, col)
-                    if header:
-                        float_column_indices[header] = col
-                
-                # 设置IO_DISC工作簿的固定值 - 改为使用数字而非字符串
-                disc_fixed_values = {
-                    "ContainerType": 1,  # 改为数字
-                    "InitialValueBool": "false",
-                    "SecurityZoneID": "None",
-                    "RecordEvent": "false",
-                    "SaveValue": "true",
-                    "SaveParameter": "true",
-                    "AccessByOtherApplication": "false",
-                    "ExtentField1": "",
-                    "ExtentField2": "",
-                    "HisRecMode": 2,  # 改为数字
-                    "HisRecInterval": 60,  # 改为数字
-                    "AlarmType": 256,  # 改为数字
-                    "CloseString": "关闭",
-                    "OpenString": "打开",
-                    "AlarmDelay": 0,  # 改为数字
-                    "DiscInhibitor": "",
-                    "ExtentField3": "",
-                    "ExtentField4": "",
-                    "ExtentField5": "",
-                    "ExtentField6": "",
-                    "ExtentField7": "",
-                    "ExtentField8": "",
-                    "CloseToOpen": "关到开",
-                    "OpenToClose": "开到关",
-                    "StateEnumTable": "",
-                    "IOConfigControl": "true",
-                    "IOEnable": "true",
-                    "ForceRead": "false",
-                    "ForceWrite": "false",
-                    "DataConvertMode": 1  # 改为数字
-                }
-                
-                # 设置IO_FLOAT工作簿的固定值 - 改为使用数字而非字符串
-                float_fixed_values = {
-                    "ContainerType": 1,  # 改为数字
-                    "MaxValue": 1000000000,  # 改为数字
-                    "MinValue": -1000000000,  # 改为数字
-                    "InitialValue": 0,  # 改为数字
-                    "Sensitivity": 0,  # 改为数字
-                    "EngineerUnits": "",
-                    "SecurityZoneID": "None",
-                    "RecordEvent": "false",
-                    "SaveValue": "true",
-                    "SaveParameter": "true",
-                    "AccessByOtherApplication": "false",
-                    "ExtentField1": "",
-                    "ExtentField2": "",
-                    "HisRecMode": 2,  # 改为数字
-                    "HisRecChangeDeadband": 0,  # 改为数字
-                    "HisRecInterval": 60,  # 改为数字
-                    "HiHiText": "高高",
-                    "HiHiPriority": 1,  # 改为数字
-                    "HiHiInhibitor": "",
-                    "HiText": "高",
-                    "HiPriority": 1,  # 改为数字
-                    "HiInhibitor": "",
-                    "LoText": "低",
-                    "LoPriority": 1,  # 改为数字
-                    "LoInhibitor": "",
-                    "LoLoText": "低低",
-                    "LoLoPriority": 1,  # 改为数字
-                    "LoLoInhibitor": "",
-                    "LimitDeadband": 0,  # 改为数字
-                    "LimitDelay": 0,  # 改为数字
-                    "DevMajorEnabled": "false",
-                    "DevMajorLimit": 80,  # 改为数字
-                    "DevMajorText": "主要",
-                    "DevMajorPriority": 1,  # 改为数字
-                    "MajorInhibitor": "",
-                    "DevMinorEnabled": "false",
-                    "DevMinorLimit": 20,  # 改为数字
-                    "DevMinorText": "次要",
-                    "DevMinorPriority": 1,  # 改为数字
-                    "MinorInhibitor": "",
-                    "DevDeadband": 0,  # 改为数字
-                    "DevTargetValue": 100,  # 改为数字
-                    "DevDelay": 0,  # 改为数字
-                    "RocEnabled": "false",
-                    "RocPercent": 20,  # 改为数字
-                    "RocTimeUnit": 0,  # 改为数字
-                    "RocText": "变化率",
-                    "RocDelay": 0,  # 改为数字
-                    "RocPriority": 1,  # 改为数字
-                    "RocInhibitor": "",
-                    "StatusAlarmTableID": 0,  # 改为数字
-                    "StatusAlarmEnabled": "false",
-                    "StatusAlarmTableName": "",
-                    "StatusInhibitor": "",
-                    # 移除AlarmGroup字段，避免重复写入
-                    # "AlarmGroup": "",
-                    "ExtentField3": "",
-                    "ExtentField4": "",
-                    "ExtentField5": "",
-                    "ExtentField6": "",
-                    "ExtentField7": "",
-                    "ExtentField8": "",
-                    "StateEnumTable": "",
-                    "IOConfigControl": "true",
-                    "MaxRaw": 1000000000,  # 改为数字
-                    "MinRaw": -1000000000,  # 改为数字
-                    "IOEnable": "true",
-                    "ForceRead": "false",
-                    "ForceWrite": "false",
-                    "DataConvertMode": 1,  # 改为数字
-                    "NlnTableID": 0,  # 改为数字
-                    "AddupMaxVal": 0,  # 改为数字
-                    "AddupMinVal": 0  # 改为数字
-                }
+                # 模板表头中的列名和列索引
+                disc_column_indices = template.column_indices[disc_sheet_idx]
+                float_column_indices = template.column_indices[float_sheet_idx]
                 
                 # 数值型字段列表 - 用于判断应使用哪种样式
                 number_fields = ["TagID", "ContainerType", "HisRecMode", "HisRecInterval", "AlarmType", 
@@ -1327,25 +1046,54 @@ class HMIGenerator:
                 # 浮点数字段
                 float_fields = ["HiHiLimit", "HiLimit", "LoLimit", "LoLoLimit"]
                 
+                # 按模板列顺序预先生成两张表的行模板，逐行只填写动态字段
+                field_styles = dict.fromkeys(number_fields, number_style)
+                field_styles.update(dict.fromkeys(float_fields, float_style))
+                field_styles["AlarmPriority"] = number_style
+                dynamic_fields = ("TagID", "TagName", "Description", "AlarmPriority", "AlarmGroup", "IOAccess")
+                disc_row_template, disc_row_styles = HMIGenerator._row_template(
+                    disc_column_indices, _DICT_DISC_FIXED_VALUES, dynamic_fields, field_styles, standard_style
+                )
+                d_tagid, d_name, d_desc, d_priority, d_group, d_access = HMIGenerator._field_positions(
+                    disc_column_indices, dynamic_fields
+                )
+                
+                # FLOAT表还需逐行填写各报警的启用状态
+                float_dynamic_fields = dynamic_fields + ("HiHiEnabled", "HiEnabled", "LoEnabled", "LoLoEnabled")
+                float_row_template, float_row_styles = HMIGenerator._row_template(
+                    float_column_indices, _DICT_FLOAT_FIXED_VALUES, float_dynamic_fields, field_styles, standard_style
+                )
+                (f_tagid, f_name, f_desc, f_priority, f_group, f_access,
+                 f_hihi_enabled, f_hi_enabled, f_lo_enabled, f_lolo_enabled) = HMIGenerator._field_positions(
+                    float_column_indices, float_dynamic_fields
+                )
+                # 限值只在设定值有效时写入，列不存在时为-1
+                f_hihi_limit, f_hi_limit, f_lo_limit, f_lolo_limit = (
+                    float_column_indices.get(field, -1) for field in float_fields
+                )
+                
+                # 逐行读取的字段及列不存在时的默认值，报警等级默认为1，确保为数字
+                base_fields = (("变量名称（HMI）", ""), ("变量描述", ""), ("场站名", "未知站点"),
+                               ("报警等级", 1), ("通道位号", ""))
+                limit_fields = (("SHH设定值", ""), ("SH设定值", ""), ("SL设定值", ""), ("SLL设定值", ""))
+                
                 # 设置从第二行开始填充数据（表头是第一行）
                 disc_row_start = 1
                 
+                # 逐行循环中用到的函数绑定为局部变量
+                isna = pd.isna
+                write_row = HMIGenerator._write_row
+                
                 # 填充BOOL数据 - 从表头后的第二行开始添加
-                for i, (_, row) in enumerate(bool_df.iterrows()):
-                    # 获取变量信息
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")
-                    alarm_priority = row.get("报警等级", 1)  # 默认为1，确保为数字
-                    
+                bool_rows = HMIGenerator._row_tuples(bool_df, base_fields)
+                for i, (hmi_name, description, station_name, alarm_priority, channel_code) in enumerate(bool_rows):
                     # 如果变量名为空，则自动补全
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                        channel_code = row.get("通道位号", "")
+                    if isna(hmi_name) or str(hmi_name).strip() == "":
                         hmi_name = f"YLDW{channel_code}"
-                        description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
+                        description = f"预留点位{channel_code}" if isna(description) or str(description).strip() == "" else description
                     
                     # 如果报警等级为空，则设为默认值1
-                    if pd.isna(alarm_priority) or str(alarm_priority).strip() == "":
+                    if isna(alarm_priority) or str(alarm_priority).strip() == "":
                         alarm_priority = 1
                     else:
                         # 尝试将报警等级转换为数字
@@ -1357,48 +1105,30 @@ class HMIGenerator:
                     # 当前行索引
                     excel_row = disc_row_start + i
                     
-                    # 填充必要的字段
-                    if "TagID" in disc_column_indices:
-                        disc_sheet.write(excel_row, disc_column_indices["TagID"], excel_row, number_style)
-                    if "TagName" in disc_column_indices:
-                        disc_sheet.write(excel_row, disc_column_indices["TagName"], hmi_name, standard_style)
-                    if "Description" in disc_column_indices:
-                        disc_sheet.write(excel_row, disc_column_indices["Description"], description, standard_style)
-                    if "AlarmPriority" in disc_column_indices:
-                        disc_sheet.write(excel_row, disc_column_indices["AlarmPriority"], alarm_priority, number_style)
-                    if "AlarmGroup" in disc_column_indices:
-                        disc_sheet.write(excel_row, disc_column_indices["AlarmGroup"], station_name, standard_style)
-                    if "IOAccess" in disc_column_indices:
-                        io_access = f"Sever1.{hmi_name}.Value"
-                        disc_sheet.write(excel_row, disc_column_indices["IOAccess"], io_access, standard_style)
-                    
-                    # 填充固定值字段
-                    for field, value in disc_fixed_values.items():
-                        if field in disc_column_indices:
-                            if field in number_fields:
-                                disc_sheet.write(excel_row, disc_column_indices[field], value, number_style)
-                            else:
-                                disc_sheet.write(excel_row, disc_column_indices[field], value, standard_style)
+                    # 在行模板上填入动态字段后整行写入
+                    row_values = disc_row_template.copy()
+                    row_values[d_tagid] = excel_row
+                    row_values[d_name] = hmi_name
+                    row_values[d_desc] = description
+                    row_values[d_priority] = alarm_priority
+                    row_values[d_group] = station_name
+                    row_values[d_access] = f"Sever1.{hmi_name}.Value"
+                    write_row(disc_sheet, excel_row, row_values, disc_row_styles)
                 
                 # 确定REAL数据的起始ID
                 float_start_id = disc_row_start + len(bool_df)
                 
                 # 填充REAL数据
-                for i, (_, row) in enumerate(real_df.iterrows()):
-                    # 获取变量信息
-                    hmi_name = row.get("变量名称（HMI）", "")
-                    description = row.get("变量描述", "")
-                    station_name = row.get("场站名", "未知站点")  # 获取场站名
-                    alarm_priority = row.get("报警等级", 1)  # 默认为1，确保为数字
-                    
+                real_rows = HMIGenerator._row_tuples(real_df, base_fields + limit_fields)
+                for i, (hmi_name, description, station_name, alarm_priority, channel_code,
+                        shh_value, sh_value, sl_value, sll_value) in enumerate(real_rows):
                     # 如果变量名为空，则自动补全
-                    if pd.isna(hmi_name) or str(hmi_name).strip() == "":
-                        channel_code = row.get("通道位号", "")
+                    if isna(hmi_name) or str(hmi_name).strip() == "":
                         hmi_name = f"YLDW{channel_code}"
-                        description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
+                        description = f"预留点位{channel_code}" if isna(description) or str(description).strip() == "" else description
                     
                     # 如果报警等级为空，则设为默认值1
-                    if pd.isna(alarm_priority) or str(alarm_priority).strip() == "":
+                    if isna(alarm_priority) or str(alarm_priority).strip() == "":
                         alarm_priority = 1
                     else:
                         # 尝试将报警等级转换为数字
@@ -1407,93 +1137,50 @@ class HMIGenerator:
                         except (ValueError, TypeError):
                             alarm_priority = 1
                     
-                    # 获取各类限值和报警信息
-                    shh_value = row.get("SHH设定值", "")
-                    sh_value = row.get("SH设定值", "")
-                    sl_value = row.get("SL设定值", "")
-                    sll_value = row.get("SLL设定值", "")
-                    
                     # 判断是否启用各类报警
-                    hihi_enabled = "true" if not pd.isna(shh_value) and shh_value and shh_value != "/" else "false"
-                    hi_enabled = "true" if not pd.isna(sh_value) and sh_value and sh_value != "/" else "false"
-                    lo_enabled = "true" if not pd.isna(sl_value) and sl_value and sl_value != "/" else "false"
-                    lolo_enabled = "true" if not pd.isna(sll_value) and sll_value and sll_value != "/" else "false"
+                    hihi_enabled = "true" if not isna(shh_value) and shh_value and shh_value != "/" else "false"
+                    hi_enabled = "true" if not isna(sh_value) and sh_value and sh_value != "/" else "false"
+                    lo_enabled = "true" if not isna(sl_value) and sl_value and sl_value != "/" else "false"
+                    lolo_enabled = "true" if not isna(sll_value) and sll_value and sll_value != "/" else "false"
                     
                     # 当前行索引和ID
                     excel_row = disc_row_start + i
                     current_id = float_start_id + i
                     
-                    # 填充必要的字段
-                    if "TagID" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["TagID"], current_id, number_style)
-                    if "TagName" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["TagName"], hmi_name, standard_style)
-                    if "Description" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["Description"], description, standard_style)
-                    if "AlarmPriority" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["AlarmPriority"], alarm_priority, number_style)
-                    if "AlarmGroup" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["AlarmGroup"], station_name, standard_style)
-                    if "IOAccess" in float_column_indices:
-                        io_access = f"Sever1.{hmi_name}.Value"
-                        float_sheet.write(excel_row, float_column_indices["IOAccess"], io_access, standard_style)
-                    
-                    # 填充报警启用和限值信息
-                    if "HiHiEnabled" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["HiHiEnabled"], hihi_enabled, standard_style)
-                    if "HiHiLimit" in float_column_indices and not pd.isna(shh_value) and shh_value and shh_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            shh_float = float(shh_value)
-                            float_sheet.write(excel_row, float_column_indices["HiHiLimit"], shh_float, float_style)
-                        except (ValueError, TypeError):
-                            float_sheet.write(excel_row, float_column_indices["HiHiLimit"], shh_value, standard_style)
+                    # 在行模板上填入动态字段后整行写入
+                    row_values = float_row_template.copy()
+                    row_values[f_tagid] = current_id
+                    row_values[f_name] = hmi_name
+                    row_values[f_desc] = description
+                    row_values[f_priority] = alarm_priority
+                    row_values[f_group] = station_name
+                    row_values[f_access] = f"Sever1.{hmi_name}.Value"
+                    row_values[f_hihi_enabled] = hihi_enabled
+                    row_values[f_hi_enabled] = hi_enabled
+                    row_values[f_lo_enabled] = lo_enabled
+                    row_values[f_lolo_enabled] = lolo_enabled
+                    float_row = write_row(float_sheet, excel_row, row_values, float_row_styles)
                     
-                    if "HiEnabled" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["HiEnabled"], hi_enabled, standard_style)
-                    if "HiLimit" in float_column_indices and not pd.isna(sh_value) and sh_value and sh_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            sh_float = float(sh_value)
-                            float_sheet.write(excel_row, float_column_indices["HiLimit"], sh_float, float_style)
-                        except (ValueError, TypeError):
-                            float_sheet.write(excel_row, float_column_indices["HiLimit"], sh_value, standard_style)
-                    
-                    if "LoEnabled" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["LoEnabled"], lo_enabled, standard_style)
-                    if "LoLimit" in float_column_indices and not pd.isna(sl_value) and sl_value and sl_value != "/":
-                        # 尝试将限值转换为浮点数
-                        try:
-                            sl_float = float(sl_value)
-                            float_sheet.write(excel_row, float_column_indices["LoLimit"], sl_float, float_style)
-                        except (ValueError, TypeError):
-                            float_sheet.write(excel_row, float_column_indices["LoLimit"], sl_value, standard_style)
-                    
-                    if "LoLoEnabled" in float_column_indices:
-                        float_sheet.write(excel_row, float_column_indices["LoLoEnabled"], lolo_enabled, standard_style)
-                    if "LoLoLimit" in float_column_indices and not pd.isna(sll_value) and sll_value and sll_value != "/":
+                    # 填充限值信息，设定值有效时才写入
+                    for limit_col, enabled, limit_value in (
+                            (f_hihi_limit, hihi_enabled, shh_value),
+                            (f_hi_limit, hi_enabled, sh_value),
+                            (f_lo_limit, lo_enabled, sl_value),
+                            (f_lolo_limit, lolo_enabled, sll_value)):
+                        if limit_col == -1 or enabled != "true":
+                            continue
                         # 尝试将限值转换为浮点数
                         try:
-                            sll_float = float(sll_value)
-                            float_sheet.write(excel_row, float_column_indices["LoLoLimit"], sll_float, float_style)
+                            float_row.write(limit_col, float(limit_value), float_style)
                         except (ValueError, TypeError):
-                            float_sheet.write(excel_row, float_column_indices["LoLoLimit"], sll_value, standard_style)
-                    
-                    # 填充固定值字段
-                    for field, value in float_fixed_values.items():
-                        if field in float_column_indices:
-                            if field in float_fields:
-                                float_sheet.write(excel_row, float_column_indices[field], value, float_style)
-                            elif field in number_fields:
-                                float_sheet.write(excel_row, float_column_indices[field], value, number_style)
-                            else:
-                                float_sheet.write(excel_row, float_column_indices[field], value, standard_style)
+                            float_row.write(limit_col, limit_value, standard_style)
                 
                 # 保存工作簿
                 workbook.save(xls_output_path)
                 
                 # 检查文件是否生成成功
-                if not (os.path.exists(xls_output_path) and os.path.getsize(xls_output_path) > 0):
+                output_stat = _file_stat(xls_output_path)
+                if output_stat is None or output_stat.st_size == 0:
                     raise ValueError(f"生成的文件不存在或为空: {xls_output_path}")
                 
                 # 关闭导出进度窗口
@@ -12,9 +12,10 @@ IO点表生成器模块
 该模块主要负责IO点表的生成和导出功能，是整个应用的数据处理层
 JianDaoYunAPI类已移至api.py模块，实现了关注点分离
 """
-import pandas as pd
 import os
 from typing import List, Dict, Any
+import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
 from PySide6.QtWidgets import QMessageBox
 
 class FormFields:
@@ -310,6 +311,23 @@ class IOChannelCalculator:
     提供基础的通道计算和数据处理功能
     """
     
+    # REAL类型点位中需要分配REAL附加地址的字段（按地址分配顺序）
+    REAL_EXTRA_ADDRESS_FIELDS = ("SLL设定点位", "SL设定点位", "SH设定点位", "SHH设定点位", "维护值设定点位")
+    
+    # REAL类型点位中由变量名称（HMI）加后缀生成的点位字段
+    POINT_NAME_SUFFIXES = (
+        ("SLL设定点位", "_LoLoLimit"), ("SL设定点位", "_LoLimit"),
+        ("SH设定点位", "_HiLimit"), ("SHH设定点位", "_HiHiLimit"),
+        ("LL报警", "_LL"), ("L报警", "_L"), ("H报警", "_H"), ("HH报警", "_HH"),
+        ("维护值设定点位", "_whz"), ("维护使能开关点位", "_MAIN_EN"),
+    )
+    
+    # BOOL类型点位中不适用、统一填写"/"的字段
+    BOOL_PLACEHOLDER_FIELDS = (
+        "量程低限", "量程高限", "SLL设定值", "SL设定值", "SH设定值", "SHH设定值", "维护值设定",
+        *(f"{field}{suffix}" for field, _ in POINT_NAME_SUFFIXES for suffix in ("", "_PLC地址", "_通讯地址")),
+    )
+    
     # 使用IOChannelModels类获取配置数据
     @classmethod
     def calculate_channels(cls, equipment_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -453,519 +471,193 @@ class IOChannelCalculator:
                     "DO": []
                 }
                 
-                # 遍历设备列表进行分类
+                # 遍历设备列表进行分类，同时保存匹配到的通道信息，后续不再重复匹配型号
                 for equipment in equipment_list:
                     spec_model = equipment.get("规格型号", "")
                     # 检查是否是IO模块
                     for model_key, channel_info in model_channel_mapping.items():
                         if model_key in spec_model:
                             io_type = channel_info["type"]
-                            io_equipment_groups[io_type].append(equipment)
+                            io_equipment_groups[io_type].append((equipment, channel_info))
                             break
                 
                 # 按照AI/AO/DI/DO的顺序遍历处理设备
                 for io_type in ["AI", "AO", "DI", "DO"]:
-                    for equipment in io_equipment_groups[io_type]:
-                        spec_model = equipment.get("规格型号", "")
+                    for equipment, channel_info in io_equipment_groups[io_type]:
                         # 获取该设备的通道信息
-                        is_io_module = False
-                        channels = 0
-                        data_type = ""
+                        channels = channel_info["channels"]
+                        data_type = channel_info["data_type"]
                         
-                        for model_key, channel_info in model_channel_mapping.items():
-                            if model_key in spec_model:
-                                is_io_module = True
-                                io_type = channel_info["type"]  # 这里重新获取io_type是为了保险
-                                channels = channel_info["channels"]
-                                data_type = channel_info["data_type"]
-                                break
+                        quantity = int(equipment.get("数量", 0))
+                        equipment_name = equipment.get("设备名称", "未命名设备")
+                        station_name = equipment.get("_station", "")
                         
-                        if is_io_module:
-                            quantity = int(equipment.get("数量", 0))
-                            equipment_name = equipment.get("设备名称", "未命名设备")
-                            station_name = equipment.get("_station", "")
+                        # 为每个设备的每个通道创建单独的点表条目
+                        for q in range(quantity):
+                            # 获取当前模块号
+                            module_num = module_counters[io_type]
+                            
+                            # 计算机架号和槽号
+                            # 当前槽位已达到最大值时，移动到下一个机架
+                            if current_slot > 11 or current_slot > available_slots_per_rack + 1:
+                                current_rack += 1
+                                current_slot = 2  # 重置为2，跳过第一个槽位
+                                
+                                # 检查是否超出机架数量
+                                if current_rack > rack_count:
+                                    error_msg = f"警告：IO模块数量超出了可用机架数量 ({rack_count})，请增加机架数量。"
+                                    QMessageBox.warning(None, "机架不足", error_msg)
+                                    # 继续使用最后一个机架
                             
-                            # 为每个设备的每个通道创建单独的点表条目
-                            for q in range(quantity):
-                                # 获取当前模块号
-                                module_num = module_counters[io_type]
+                            # 为该模块的每个通道创建条目
+                            for ch in range(channels):
+                                # 生成新的通道位号格式（例如：1_1_AO_0）
+                                channel_code = f"{current_rack}_{current_slot}_{io_type}_{ch}"
                                 
-                                # 计算机架号和槽号
-                                # 当前槽位已达到最大值时，移动到下一个机架
-                                if current_slot > 11 or current_slot > available_slots_per_rack + 1:
-                                    current_rack += 1
-                                    current_slot = 2  # 重置为2，跳过第一个槽位
-                                    
-                                    # 检查是否超出机架数量
-                                    if current_rack > rack_count:
-                                        error_msg = f"警告：IO模块数量超出了可用机架数量 ({rack_count})，请增加机架数量。"
-                                        QMessageBox.warning(None, "机架不足", error_msg)
-                                        # 继续使用最后一个机架
+                                # 生成PLC绝对地址
+                                plc_address = ""
+                                if data_type == "REAL":
+                                    plc_address = f"%MD{real_address_counter}"
+                                    real_address_counter += 4  # REAL类型每个点位加4
+                                else:  # BOOL类型
+                                    plc_address = f"%MX{bool_address_counter[0]}.{bool_address_counter[1]}"
+                                    # 更新BOOL地址计数器
+                                    bool_address_counter[1] += 1
+                                    if bool_address_counter[1] > 7:
+                                        bool_address_counter[0] += 1
+                                        bool_address_counter[1] = 0
                                 
-                                # 为该模块的每个通道创建条目
-                                for ch in range(channels):
-                                    # 生成新的通道位号格式（例如：1_1_AO_0）
-                                    channel_code = f"{current_rack}_{current_slot}_{io_type}_{ch}"
-                                    
-                                    # 生成PLC绝对地址
-                                    plc_address = ""
-                                    if data_type == "REAL":
-                                        plc_address = f"%MD{real_address_counter}"
-                                        real_address_counter += 4  # REAL类型每个点位加4
-                                    else:  # BOOL类型
-                                        plc_address = f"%MX{bool_address_counter[0]}.{bool_address_counter[1]}"
-                                        # 更新BOOL地址计数器
-                                        bool_address_counter[1] += 1
-                                        if bool_address_counter[1] > 7:
-                                            bool_address_counter[0] += 1
-                                            bool_address_counter[1] = 0
-                                    
-                                    # 计算上位机通讯地址
-                                    modbus_address = cls.calculate_modbus_address(plc_address, data_type)
-                                    
-                                    # 准备该通道的点表数据
-                                    point_data = {
-                                        "序号": index_counter,
-                                        "模块名称": equipment_name,
-                                        "模块类型": io_type,
-                                        "供电类型（有源/无源）": "/" if io_type == "AO" else "",
-                                        "线制": "/" if io_type == "AO" else "",
-                                        "通道位号": channel_code,
-                                        "位号": "",
-                                        "场站名": station_name,
-                                        "变量名称（HMI）": "",
-                                        "变量描述": "",
-                                        "数据类型": data_type,
-                                        "读写属性": "R/W",  # 所有点位统一设置为R/W
-                                        "保存历史": "是",   # 默认"是"
-                                        "掉电保护": "是",   # 默认"是"
-                                        "量程低限": "" if data_type == "REAL" else "/",
-                                        "量程高限": "" if data_type == "REAL" else "/",
-                                        "SLL设定值": "" if data_type == "REAL" else "/",
-                                        "SLL设定点位": "",
-                                        "SLL设定点位_PLC地址": "",
-                                        "SLL设定点位_通讯地址": "",
-                                        "SL设定值": "" if data_type == "REAL" else "/",
-                                        "SL设定点位": "",
-                                        "SL设定点位_PLC地址": "",
-                                        "SL设定点位_通讯地址": "",
-                                        "SH设定值": "" if data_type == "REAL" else "/",
-                                        "SH设定点位": "",
-                                        "SH设定点位_PLC地址": "",
-                                        "SH设定点位_通讯地址": "",
-                                        "SHH设定值": "" if data_type == "REAL" else "/",
-                                        "SHH设定点位": "",
-                                        "SHH设定点位_PLC地址": "",
-                                        "SHH设定点位_通讯地址": "",
-                                        "LL报警": "",
-                                        "LL报警_PLC地址": "",
-                                        "LL报警_通讯地址": "",
-                                        "L报警": "",
-                                        "L报警_PLC地址": "",
-                                        "L报警_通讯地址": "",
-                                        "H报警": "",
-                                        "H报警_PLC地址": "",
-                                        "H报警_通讯地址": "",
-                                        "HH报警": "",
-                                        "HH报警_PLC地址": "",
-                                        "HH报警_通讯地址": "",
-                                        "维护值设定": "/",
-                                        "维护值设定点位": "",
-                                        "维护值设定点位_PLC地址": "",
-                                        "维护值设定点位_通讯地址": "",
-                                        "维护使能开关点位": "",
-                                        "维护使能开关点位_PLC地址": "",
-                                        "维护使能开关点位_通讯地址": "",
-                                        "PLC绝对地址": plc_address,
-                                        "上位机通讯地址": str(modbus_address)
-                                    }
-                                    
-                                    # 添加到点表列表
-                                    io_points.append(point_data)
-                                    index_counter += 1
+                                # 计算上位机通讯地址
+                                modbus_address = cls.calculate_modbus_address(plc_address, data_type)
                                 
-                                # 每个设备模块增加模块计数器和槽位计数器
-                                module_counters[io_type] += 1
-                                current_slot += 1
+                                # 准备该通道的点表数据
+                                point_data = {
+                                    "序号": index_counter,
+                                    "模块名称": equipment_name,
+                                    "模块类型": io_type,
+                                    "供电类型（有源/无源）": "/" if io_type == "AO" else "",
+                                    "线制": "/" if io_type == "AO" else "",
+                                    "通道位号": channel_code,
+                                    "位号": "",
+                                    "场站名": station_name,
+                                    "变量名称（HMI）": "",
+                                    "变量描述": "",
+                                    "数据类型": data_type,
+                                    "读写属性": "R/W",  # 所有点位统一设置为R/W
+                                    "保存历史": "是",   # 默认"是"
+                                    "掉电保护": "是",   # 默认"是"
+                                    "量程低限": "" if data_type == "REAL" else "/",
+                                    "量程高限": "" if data_type == "REAL" else "/",
+                                    "SLL设定值": "" if data_type == "REAL" else "/",
+                                    "SLL设定点位": "",
+                                    "SLL设定点位_PLC地址": "",
+                                    "SLL设定点位_通讯地址": "",
+                                    "SL设定值": "" if data_type == "REAL" else "/",
+                                    "SL设定点位": "",
+                                    "SL设定点位_PLC地址": "",
+                                    "SL设定点位_通讯地址": "",
+                                    "SH设定值": "" if data_type == "REAL" else "/",
+                                    "SH设定点位": "",
+                                    "SH设定点位_PLC地址": "",
+                                    "SH设定点位_通讯地址": "",
+                                    "SHH设定值": "" if data_type == "REAL" else "/",
+                                    "SHH设定点位": "",
+                                    "SHH设定点位_PLC地址": "",
+                                    "SHH设定点位_通讯地址": "",
+                                    "LL报警": "",
+                                    "LL报警_PLC地址": "",
+                                    "LL报警_通讯地址": "",
+                                    "L报警": "",
+                                    "L报警_PLC地址": "",
+                                    "L报警_通讯地址": "",
+                                    "H报警": "",
+                                    "H报警_PLC地址": "",
+                                    "H报警_通讯地址": "",
+                                    "HH报警": "",
+                                    "HH报警_PLC地址": "",
+                                    "HH报警_通讯地址": "",
+                                    "维护值设定": "/",
+                                    "维护值设定点位": "",
+                                    "维护值设定点位_PLC地址": "",
+                                    "维护值设定点位_通讯地址": "",
+                                    "维护使能开关点位": "",
+                                    "维护使能开关点位_PLC地址": "",
+                                    "维护使能开关点位_通讯地址": "",
+                                    "PLC绝对地址": plc_address,
+                                    "上位机通讯地址": str(modbus_address)
+                                }
+                                
+                                # 添加到点表列表
+                                io_points.append(point_data)
+                                index_counter += 1
+                            
+                            # 每个设备模块增加模块计数器和槽位计数器
+                            module_counters[io_type] += 1
+                            current_slot += 1
             
-            # 创建Excel写入器
-            with pd.ExcelWriter(temp_file, engine='openpyxl') as writer:
-                # 只创建IO点表
-                if io_points:
-                    # 创建DataFrame并确保列顺序与IO_POINT_FIELDS一致
-                    points_df = pd.DataFrame(io_points)
-                    
-                    # 获取IO点表字段
-                    io_point_fields = IOChannelModels.get_io_point_fields()
-                    
-                    # 确保所有字段都在DataFrame中
-                    for field in io_point_fields:
-                        if field not in points_df.columns:
-                            points_df[field] = ""
-                    
-                    # 按照IO_POINT_FIELDS中定义的顺序重排列
-                    points_df = points_df[io_point_fields]
-                    
-                    # 导出到Excel
-                    points_df.to_excel(writer, sheet_name="IO点表", index=False)
-                else:
-                    # 没有点位数据时，创建一个空表
-                    empty_df = pd.DataFrame(columns=IOChannelModels.get_io_point_fields())
-                    empty_df.to_excel(writer, sheet_name="IO点表", index=False)
-                
-                # 获取工作簿和工作表
-                workbook = writer.book
-                worksheet = writer.sheets["IO点表"]
-                
-                # 导入openpyxl的边框样式和填充样式
-                from openpyxl.styles import Border, Side, PatternFill, Font
-                
-                # 定义边框样式（细线边框）
-                thin_border = Border(left=Side(style='thin'), 
-                                  right=Side(style='thin'), 
-                                  top=Side(style='thin'), 
-                                  bottom=Side(style='thin'))
-                
-                # 定义黄色填充样式（用于高亮需要用户填写的字段）
-                yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-                # 定义深黄色填充样式（用于高亮表头）
-                dark_yellow_fill = PatternFill(start_color="FFDD00", end_color="FFDD00", fill_type="solid")
-                # 定义表头字体样式
-                header_font = Font(bold=True)
-                
-                # 获取表头行的单元格范围
-                header_row = 1  # Excel中的第一行
-                max_col = len(io_point_fields)
-                
-                # 应用表头字体样式和边框
-                for col in range(1, max_col + 1):  # Excel列从1开始
-                    cell = worksheet.cell(row=header_row, column=col)
-                    cell.font = header_font
-                    cell.border = thin_border
-                
-                # 查找需要高亮的列索引
-                highlight_cols = []
-                for field in IOChannelModels.get_highlight_fields():
-                    col_idx = IOChannelModels.get_field_index(field)
-                    if col_idx != -1:  # 确保字段存在
-                        highlight_cols.append(col_idx + 1)  # Excel列从1开始
-                        # 同时高亮表头（使用深黄色）
-                        header_cell = worksheet.cell(row=header_row, column=col_idx + 1)
-                        header_cell.fill = dark_yellow_fill
-                
-                # 查找各关键列的索引
-                hmi_col_idx = IOChannelModels.get_field_index("变量名称（HMI）") + 1  # Excel列从1开始
-                
-                # 各设定点位列的索引
-                sll_pos_col_idx = IOChannelModels.get_field_index("SLL设定点位") + 1
-                sl_pos_col_idx = IOChannelModels.get_field_index("SL设定点位") + 1
-                sh_pos_col_idx = IOChannelModels.get_field_index("SH设定点位") + 1
-                shh_pos_col_idx = IOChannelModels.get_field_index("SHH设定点位") + 1
-                
-                # 各报警点位列的索引
-                ll_alarm_col_idx = IOChannelModels.get_field_index("LL报警") + 1
-                l_alarm_col_idx = IOChannelModels.get_field_index("L报警") + 1
-                h_alarm_col_idx = IOChannelModels.get_field_index("H报警") + 1
-                hh_alarm_col_idx = IOChannelModels.get_field_index("HH报警") + 1
-                
-                # 维护相关列的索引
-                maint_val_pos_col_idx = IOChannelModels.get_field_index("维护值设定点位") + 1
-                maint_en_pos_col_idx = IOChannelModels.get_field_index("维护使能开关点位") + 1
+            # 获取IO点表字段，按字段顺序输出各列
+            io_point_fields = IOChannelModels.get_io_point_fields()
+            highlight_fields = set(IOChannelModels.get_highlight_fields())
+            highlight_flags = [field in highlight_fields for field in io_point_fields]
+            
+            # 变量名称（HMI）所在列的列名，用于生成设定点位和报警点位的公式
+            hmi_col = xl_col_to_name(IOChannelModels.get_field_index("变量名称（HMI）"))
+            
+            # 创建Excel工作簿，constant_memory模式下逐行写出并释放内存
+            with xlsxwriter.Workbook(temp_file, {'constant_memory': True, 'strings_to_urls': False}) as workbook:
+                worksheet = workbook.add_worksheet("IO点表")
                 
-                # 量程上下限的列索引
-                low_range_col_idx = IOChannelModels.get_field_index("量程低限") + 1
-                high_range_col_idx = IOChannelModels.get_field_index("量程高限") + 1
+                # 表头使用加粗字体和细线边框，需要填写的字段使用深黄色背景
+                header_style = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                header_highlight_style = workbook.add_format({
+                    'bold': True, 'border': 1, 'align': 'center', 'valign': 'top',
+                    'bg_color': '#FFDD00', 'pattern': 1
+                })
+                # 数据单元格使用细线边框，需要填写的单元格使用黄色背景
+                cell_style = workbook.add_format({'border': 1})
+                highlight_style = workbook.add_format({'border': 1, 'bg_color': '#FFFF00', 'pattern': 1})
                 
-                # 获取数据行数
-                data_rows = len(io_points) if io_points else 0
+                # 写入表头
+                for col, (field, highlighted) in enumerate(zip(io_point_fields, highlight_flags)):
+                    worksheet.write_string(0, col, field, header_highlight_style if highlighted else header_style)
                 
-                # 为每行添加公式和额外地址，并高亮需要填写的单元格
-                for row in range(2, data_rows + 2):  # 从第2行开始（跳过表头）
-                    # 获取该行的数据类型
-                    data_type_cell = worksheet.cell(row=row, column=IOChannelModels.get_field_index("数据类型") + 1).value
-                    
-                    # 为所有单元格添加边框
-                    for col in range(1, max_col + 1):
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.border = thin_border
-                    
-                    # 针对不同类型字段添加额外地址列
-                    if data_type_cell == "REAL":
-                        # 为需要添加额外地址的REAL类型字段生成额外地址
-                        # SLL设定点位地址
-                        sll_addr_col = IOChannelModels.get_field_index("SLL设定点位_PLC地址") + 1
-                        sll_comm_col = IOChannelModels.get_field_index("SLL设定点位_通讯地址") + 1
-                        extra_plc_addr = f"%MD{extra_real_address_counter}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "REAL")
-                        worksheet.cell(row=row, column=sll_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=sll_comm_col).value = extra_comm_addr
-                        extra_real_address_counter += 4
-                        
-                        # SL设定点位地址
-                        sl_addr_col = IOChannelModels.get_field_index("SL设定点位_PLC地址") + 1
-                        sl_comm_col = IOChannelModels.get_field_index("SL设定点位_通讯地址") + 1
-                        extra_plc_addr = f"%MD{extra_real_address_counter}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "REAL")
-                        worksheet.cell(row=row, column=sl_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=sl_comm_col).value = extra_comm_addr
-                        extra_real_address_counter += 4
-                        
-                        # SH设定点位地址
-                        sh_addr_col = IOChannelModels.get_field_index("SH设定点位_PLC地址") + 1
-                        sh_comm_col = IOChannelModels.get_field_index("SH设定点位_通讯地址") + 1
-                        extra_plc_addr = f"%MD{extra_real_address_counter}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "REAL")
-                        worksheet.cell(row=row, column=sh_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=sh_comm_col).value = extra_comm_addr
-                        extra_real_address_counter += 4
-                        
-                        # SHH设定点位地址
-                        shh_addr_col = IOChannelModels.get_field_index("SHH设定点位_PLC地址") + 1
-                        shh_comm_col = IOChannelModels.get_field_index("SHH设定点位_通讯地址") + 1
-                        extra_plc_addr = f"%MD{extra_real_address_counter}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "REAL")
-                        worksheet.cell(row=row, column=shh_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=shh_comm_col).value = extra_comm_addr
-                        extra_real_address_counter += 4
-                        
-                        # 维护值设定点位地址
-                        maint_val_addr_col = IOChannelModels.get_field_index("维护值设定点位_PLC地址") + 1
-                        maint_val_comm_col = IOChannelModels.get_field_index("维护值设定点位_通讯地址") + 1
-                        extra_plc_addr = f"%MD{extra_real_address_counter}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "REAL")
-                        worksheet.cell(row=row, column=maint_val_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=maint_val_comm_col).value = extra_comm_addr
-                        extra_real_address_counter += 4
-                        
-                        # 为BOOL类型地址字段添加BOOL类型地址
-                        # LL报警地址(BOOL)
-                        ll_alarm_addr_col = IOChannelModels.get_field_index("LL报警_PLC地址") + 1
-                        ll_alarm_comm_col = IOChannelModels.get_field_index("LL报警_通讯地址") + 1
-                        extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
-                        worksheet.cell(row=row, column=ll_alarm_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=ll_alarm_comm_col).value = extra_comm_addr
-                        # 更新BOOL地址计数器
-                        extra_bool_address_counter[1] += 1
-                        if extra_bool_address_counter[1] > 7:
-                            extra_bool_address_counter[0] += 1
-                            extra_bool_address_counter[1] = 0
-                        
-                        # L报警地址(BOOL)
-                        l_alarm_addr_col = IOChannelModels.get_field_index("L报警_PLC地址") + 1
-                        l_alarm_comm_col = IOChannelModels.get_field_index("L报警_通讯地址") + 1
-                        extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
-                        worksheet.cell(row=row, column=l_alarm_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=l_alarm_comm_col).value = extra_comm_addr
-                        # 更新BOOL地址计数器
-                        extra_bool_address_counter[1] += 1
-                        if extra_bool_address_counter[1] > 7:
-                            extra_bool_address_counter[0] += 1
-                            extra_bool_address_counter[1] = 0
-                        
-                        # H报警地址(BOOL)
-                        h_alarm_addr_col = IOChannelModels.get_field_index("H报警_PLC地址") + 1
-                        h_alarm_comm_col = IOChannelModels.get_field_index("H报警_通讯地址") + 1
-                        extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
-                        worksheet.cell(row=row, column=h_alarm_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=h_alarm_comm_col).value = extra_comm_addr
-                        # 更新BOOL地址计数器
-                        extra_bool_address_counter[1] += 1
-                        if extra_bool_address_counter[1] > 7:
-                            extra_bool_address_counter[0] += 1
-                            extra_bool_address_counter[1] = 0
-                        
-                        # HH报警地址(BOOL)
-                        hh_alarm_addr_col = IOChannelModels.get_field_index("HH报警_PLC地址") + 1
-                        hh_alarm_comm_col = IOChannelModels.get_field_index("HH报警_通讯地址") + 1
-                        extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
-                        worksheet.cell(row=row, column=hh_alarm_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=hh_alarm_comm_col).value = extra_comm_addr
-                        # 更新BOOL地址计数器
-                        extra_bool_address_counter[1] += 1
-                        if extra_bool_address_counter[1] > 7:
-                            extra_bool_address_counter[0] += 1
-                            extra_bool_address_counter[1] = 0
-                        
-                        # 维护使能开关点位地址(BOOL)
-                        maint_en_addr_col = IOChannelModels.get_field_index("维护使能开关点位_PLC地址") + 1
-                        maint_en_comm_col = IOChannelModels.get_field_index("维护使能开关点位_通讯地址") + 1
-                        extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
-                        extra_comm_addr = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
-                        worksheet.cell(row=row, column=maint_en_addr_col).value = extra_plc_addr
-                        worksheet.cell(row=row, column=maint_en_comm_col).value = extra_comm_addr
-                        # 更新BOOL地址计数器
-                        extra_bool_address_counter[1] += 1
-                        if extra_bool_address_counter[1] > 7:
-                            extra_bool_address_counter[0] += 1
-                            extra_bool_address_counter[1] = 0
-                        
-                        # 为REAL类型设置公式字段
-                        # 设置SLL设定点位公式: 变量名称（HMI）+ "_LoLoLimit"
-                        sll_pos_col_idx = IOChannelModels.get_field_index("SLL设定点位") + 1
-                        worksheet.cell(row=row, column=sll_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_LoLoLimit")'
-                        
-                        # 设置SL设定点位公式: 变量名称（HMI）+ "_LoLimit"
-                        sl_pos_col_idx = IOChannelModels.get_field_index("SL设定点位") + 1
-                        worksheet.cell(row=row, column=sl_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_LoLimit")'
-                        
-                        # 设置SH设定点位公式: 变量名称（HMI）+ "_HiLimit"
-                        sh_pos_col_idx = IOChannelModels.get_field_index("SH设定点位") + 1
-                        worksheet.cell(row=row, column=sh_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_HiLimit")'
-                        
-                        # 设置SHH设定点位公式: 变量名称（HMI）+ "_HiHiLimit"
-                        shh_pos_col_idx = IOChannelModels.get_field_index("SHH设定点位") + 1
-                        worksheet.cell(row=row, column=shh_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_HiHiLimit")'
-                        
-                        # 设置LL报警公式: 变量名称（HMI）+ "_LL"
-                        ll_alarm_col_idx = IOChannelModels.get_field_index("LL报警") + 1
-                        worksheet.cell(row=row, column=ll_alarm_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_LL")'
-                        
-                        # 设置L报警公式: 变量名称（HMI）+ "_L"
-                        l_alarm_col_idx = IOChannelModels.get_field_index("L报警") + 1
-                        worksheet.cell(row=row, column=l_alarm_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_L")'
-                        
-                        # 设置H报警公式: 变量名称（HMI）+ "_H"
-                        h_alarm_col_idx = IOChannelModels.get_field_index("H报警") + 1
-                        worksheet.cell(row=row, column=h_alarm_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_H")'
-                        
-                        # 设置HH报警公式: 变量名称（HMI）+ "_HH"
-                        hh_alarm_col_idx = IOChannelModels.get_field_index("HH报警") + 1
-                        worksheet.cell(row=row, column=hh_alarm_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_HH")'
-                        
-                        # 设置维护值设定点位公式: 变量名称（HMI）+ "_whz"
-                        maint_val_pos_col_idx = IOChannelModels.get_field_index("维护值设定点位") + 1
-                        worksheet.cell(row=row, column=maint_val_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_whz")'
-                        
-                        # 设置维护使能开关点位公式: 变量名称（HMI）+ "_MAIN_EN"
-                        maint_en_pos_col_idx = IOChannelModels.get_field_index("维护使能开关点位") + 1
-                        worksheet.cell(row=row, column=maint_en_pos_col_idx).value = f'=IF(ISBLANK({chr(64+hmi_col_idx)}{row}),"",{chr(64+hmi_col_idx)}{row}&"_MAIN_EN")'
-                        
-                        # 设置量程低限和量程高限
-                        low_range_col_idx = IOChannelModels.get_field_index("量程低限") + 1
-                        high_range_col_idx = IOChannelModels.get_field_index("量程高限") + 1
-                        # 量程低限和高限可以自行填写，这里不设置默认公式
-                        
-                        # 设置维护值设定为"/"
-                        maint_val_col_idx = IOChannelModels.get_field_index("维护值设定") + 1
-                        worksheet.cell(row=row, column=maint_val_col_idx).value = "/"
+                # 逐行补全附加地址和公式后直接写出，每行只处理一次
+                for row, point in enumerate(io_points, 1):
+                    if point["数据类型"] == "REAL":
+                        # 为设定点位和维护值设定点位分配REAL类型的附加地址
+                        for field in cls.REAL_EXTRA_ADDRESS_FIELDS:
+                            extra_plc_addr = f"%MD{extra_real_address_counter}"
+                            point[f"{field}_PLC地址"] = extra_plc_addr
+                            point[f"{field}_通讯地址"] = cls.calculate_modbus_address(extra_plc_addr, "REAL")
+                            extra_real_address_counter += 4
+                        
+                        # 为报警点位和维护使能开关点位分配BOOL类型的附加地址
+                        for field in IOChannelModels.BOOL_TYPE_ADDRESS_FIELDS:
+                            extra_plc_addr = f"%MX{extra_bool_address_counter[0]}.{extra_bool_address_counter[1]}"
+                            point[f"{field}_PLC地址"] = extra_plc_addr
+                            point[f"{field}_通讯地址"] = cls.calculate_modbus_address(extra_plc_addr, "BOOL")
+                            # 更新BOOL地址计数器
+                            extra_bool_address_counter[1] += 1
+                            if extra_bool_address_counter[1] > 7:
+                                extra_bool_address_counter[0] += 1
+                                extra_bool_address_counter[1] = 0
+                        
+                        # 设定点位、报警点位和维护点位的公式: 变量名称（HMI）+ 后缀
+                        hmi_cell = f"{hmi_col}{row + 1}"
+                        for field, suffix in cls.POINT_NAME_SUFFIXES:
+                            point[field] = f'=IF(ISBLANK({hmi_cell}),"",{hmi_cell}&"{suffix}")'
+                        
+                        # 量程低限和高限可以自行填写，这里不设置默认公式；维护值设定为"/"
+                        point["维护值设定"] = "/"
                     else:
                         # BOOL类型不需要额外地址和公式，所有相关列设置为"/"
-                        # 获取所有相关列的索引
-                        sll_pos_col_idx = IOChannelModels.get_field_index("SLL设定点位") + 1
-                        sll_addr_col = IOChannelModels.get_field_index("SLL设定点位_PLC地址") + 1
-                        sll_comm_col = IOChannelModels.get_field_index("SLL设定点位_通讯地址") + 1
-                        
-                        sl_pos_col_idx = IOChannelModels.get_field_index("SL设定点位") + 1
-                        sl_addr_col = IOChannelModels.get_field_index("SL设定点位_PLC地址") + 1
-                        sl_comm_col = IOChannelModels.get_field_index("SL设定点位_通讯地址") + 1
-                        
-                        sh_pos_col_idx = IOChannelModels.get_field_index("SH设定点位") + 1
-                        sh_addr_col = IOChannelModels.get_field_index("SH设定点位_PLC地址") + 1
-                        sh_comm_col = IOChannelModels.get_field_index("SH设定点位_通讯地址") + 1
-                        
-                        shh_pos_col_idx = IOChannelModels.get_field_index("SHH设定点位") + 1
-                        shh_addr_col = IOChannelModels.get_field_index("SHH设定点位_PLC地址") + 1
-                        shh_comm_col = IOChannelModels.get_field_index("SHH设定点位_通讯地址") + 1
-                        
-                        ll_alarm_col_idx = IOChannelModels.get_field_index("LL报警") + 1
-                        ll_alarm_addr_col = IOChannelModels.get_field_index("LL报警_PLC地址") + 1
-                        ll_alarm_comm_col = IOChannelModels.get_field_index("LL报警_通讯地址") + 1
-                        
-                        l_alarm_col_idx = IOChannelModels.get_field_index("L报警") + 1
-                        l_alarm_addr_col = IOChannelModels.get_field_index("L报警_PLC地址") + 1
-                        l_alarm_comm_col = IOChannelModels.get_field_index("L报警_通讯地址") + 1
-                        
-                        h_alarm_col_idx = IOChannelModels.get_field_index("H报警") + 1
-                        h_alarm_addr_col = IOChannelModels.get_field_index("H报警_PLC地址") + 1
-                        h_alarm_comm_col = IOChannelModels.get_field_index("H报警_通讯地址") + 1
-                        
-                        hh_alarm_col_idx = IOChannelModels.get_field_index("HH报警") + 1
-                        hh_alarm_addr_col = IOChannelModels.get_field_index("HH报警_PLC地址") + 1
-                        hh_alarm_comm_col = IOChannelModels.get_field_index("HH报警_通讯地址") + 1
-                        
-                        maint_val_pos_col_idx = IOChannelModels.get_field_index("维护值设定点位") + 1
-                        maint_val_addr_col = IOChannelModels.get_field_index("维护值设定点位_PLC地址") + 1
-                        maint_val_comm_col = IOChannelModels.get_field_index("维护值设定点位_通讯地址") + 1
-                        
-                        maint_en_pos_col_idx = IOChannelModels.get_field_index("维护使能开关点位") + 1
-                        maint_en_addr_col = IOChannelModels.get_field_index("维护使能开关点位_PLC地址") + 1
-                        maint_en_comm_col = IOChannelModels.get_field_index("维护使能开关点位_通讯地址") + 1
-                        
-                        low_range_col_idx = IOChannelModels.get_field_index("量程低限") + 1
-                        high_range_col_idx = IOChannelModels.get_field_index("量程高限") + 1
-                        
-                        # 设置所有公式字段为"/"
-                        # 设定值也需要设置为"/"
-                        sll_val_col_idx = IOChannelModels.get_field_index("SLL设定值") + 1
-                        sl_val_col_idx = IOChannelModels.get_field_index("SL设定值") + 1
-                        sh_val_col_idx = IOChannelModels.get_field_index("SH设定值") + 1
-                        shh_val_col_idx = IOChannelModels.get_field_index("SHH设定值") + 1
-                        
-                        # 设置设定值为"/"
-                        worksheet.cell(row=row, column=sll_val_col_idx).value = "/"
-                        worksheet.cell(row=row, column=sl_val_col_idx).value = "/"
-                        worksheet.cell(row=row, column=sh_val_col_idx).value = "/"
-                        worksheet.cell(row=row, column=shh_val_col_idx).value = "/"
-                        
-                        # 设置设定点位和地址为"/"
-                        worksheet.cell(row=row, column=sll_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=sll_addr_col).value = "/"
-                        worksheet.cell(row=row, column=sll_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=sl_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=sl_addr_col).value = "/"
-                        worksheet.cell(row=row, column=sl_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=sh_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=sh_addr_col).value = "/"
-                        worksheet.cell(row=row, column=sh_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=shh_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=shh_addr_col).value = "/"
-                        worksheet.cell(row=row, column=shh_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=ll_alarm_col_idx).value = "/"
-                        worksheet.cell(row=row, column=ll_alarm_addr_col).value = "/"
-                        worksheet.cell(row=row, column=ll_alarm_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=l_alarm_col_idx).value = "/"
-                        worksheet.cell(row=row, column=l_alarm_addr_col).value = "/"
-                        worksheet.cell(row=row, column=l_alarm_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=h_alarm_col_idx).value = "/"
-                        worksheet.cell(row=row, column=h_alarm_addr_col).value = "/"
-                        worksheet.cell(row=row, column=h_alarm_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=hh_alarm_col_idx).value = "/"
-                        worksheet.cell(row=row, column=hh_alarm_addr_col).value = "/"
-                        worksheet.cell(row=row, column=hh_alarm_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=maint_val_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=maint_val_addr_col).value = "/"
-                        worksheet.cell(row=row, column=maint_val_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=maint_en_pos_col_idx).value = "/"
-                        worksheet.cell(row=row, column=maint_en_addr_col).value = "/"
-                        worksheet.cell(row=row, column=maint_en_comm_col).value = "/"
-                        
-                        worksheet.cell(row=row, column=low_range_col_idx).value = "/"
-                        worksheet.cell(row=row, column=high_range_col_idx).value = "/"
-                        
-                        # 设置维护值设定为"/"
-                        maint_val_col_idx = IOChannelModels.get_field_index("维护值设定") + 1
-                        worksheet.cell(row=row, column=maint_val_col_idx).value = "/"
+                        point.update(dict.fromkeys(cls.BOOL_PLACEHOLDER_FIELDS, "/"))
                     
-                    # 在所有值设置完成后，再进行高亮标记
-                    # 为需要高亮的列添加黄色背景
-                    for col in highlight_cols:
-                        cell = worksheet.cell(row=row, column=col)
-                        # 判断单元格是否应该高亮：只要值为"/"就不标黄，无需区分模块类型
-                        if cell.value != "/":  # 只有当值不是"/"时才标黄
-                            cell.fill = yellow_fill
+                    # 需要高亮的列只要值不是"/"就标黄，无需区分模块类型
+                    for col, (field, highlighted) in enumerate(zip(io_point_fields, highlight_flags)):
+                        value = point.get(field, "")
+                        style = highlight_style if highlighted and value != "/" else cell_style
+                        worksheet.write(row, col, value, style)
             
             # 保存成功后，移动临时文件到目标位置
             try:
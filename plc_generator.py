@@ -16,6 +16,7 @@ import xlrd
 import xlwt
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from io_generator import IOChannelModels
 from PySide6.QtWidgets import QMessageBox, QProgressDialog
 from PySide6.QtCore import Qt
@@ -23,6 +24,34 @@ from PySide6.QtCore import Qt
 # 添加导入配置
 from config.settings import TEMPLATE_DIR
 
+# 各数据类型点位的默认字段值，每个点位都会用到，只读共享
+_BOOL_DEFAULT_FIELD_VALUES = MappingProxyType({
+    "初始值": "FALSE",
+    "掉电保护": "FALSE",
+    "可强制": "TRUE",
+    "SOE使能": "TRUE"
+})
+
+_REAL_DEFAULT_FIELD_VALUES = MappingProxyType({
+    "初始值": "0",
+    "掉电保护": "TRUE",  # REAL类型数据的掉电保护设置为TRUE
+    "可强制": "TRUE",
+    "SOE使能": "FALSE"
+})
+
+# PLC点表单元格样式：宋体11号，地址列使用文本格式
+# 样式对象只描述格式，不绑定工作簿，所有导出共用
+_PLC_FONT = xlwt.Font()
+_PLC_FONT.name = '宋体'
+_PLC_FONT.height = 220  # 字体大小 11 (220 = 11 * 20)
+
+_PLC_COMMON_STYLE = xlwt.XFStyle()
+_PLC_COMMON_STYLE.font = _PLC_FONT
+
+_PLC_TEXT_STYLE = xlwt.XFStyle()
+_PLC_TEXT_STYLE.num_format_str = '@'
+_PLC_TEXT_STYLE.font = _PLC_FONT
+
 class PLCGenerator:
     """
     PLC点表生成器类
@@ -74,22 +103,12 @@ class PLCGenerator:
             data_type: 数据类型（如"REAL", "BOOL"等）
             
         Returns:
-            dict: 默认字段值字典
+            Mapping: 默认字段值的只读映射
         """
         if data_type == "BOOL":
-            return {
-                "初始值": "FALSE",
-                "掉电保护": "FALSE",
-                "可强制": "TRUE",
-                "SOE使能": "TRUE"
-            }
-        else:  # REAL或其他类型
-            return {
-                "初始值": "0",
-                "掉电保护": "TRUE",  # REAL类型数据的掉电保护设置为TRUE
-                "可强制": "TRUE",
-                "SOE使能": "FALSE"
-            }
+            return _BOOL_DEFAULT_FIELD_VALUES
+        # REAL或其他类型
+        return _REAL_DEFAULT_FIELD_VALUES
     
     def generate_plc_table(self, equipment_data, station_name, project_number, parent_window=None):
         """
@@ -182,74 +201,61 @@ class PLCGenerator:
             workbook = xlwt.Workbook(encoding='utf-8')
             worksheet = workbook.add_sheet('PLC点表')
             
-            # 创建宋体字体样式，大小为11
-            font = xlwt.Font()
-            font.name = '宋体'
-            font.height = 220  # 字体大小 11 (220 = 11 * 20)
-            
-            # 设置单元格通用样式
-            common_style = xlwt.XFStyle()
-            common_style.font = font
-            
-            # 设置单元格格式：文本格式用于地址列，同时使用宋体
-            text_style = xlwt.XFStyle()
-            text_style.num_format_str = '@'
-            text_style.font = font
+            # 单元格通用样式和地址列的文本样式
+            common_style = _PLC_COMMON_STYLE
+            text_style = _PLC_TEXT_STYLE
             
             # 从模板复制表头和格式（前两行），并应用宋体格式
             for row in range(2):
+                write = worksheet.row(row).write
                 for col in range(template_sheet.ncols):
                     value = template_sheet.cell_value(row, col)
-                    worksheet.write(row, col, value, common_style)
+                    write(col, value, common_style)
             
             # 行计数器，用于记录当前Excel中的行数
             excel_row_counter = 2  # 从第3行开始，前2行是标题
             
             # 处理所有基础变量
             progress.setLabelText("正在生成PLC表数据...")
-            for i, (_, row) in enumerate(self.uploaded_io_data.iterrows(), 1):
-                # 获取基础变量信息
-                var_name = row.get("变量名称（HMI）", "")
-                plc_address = row.get("PLC绝对地址", "")
-                description = row.get("变量描述", "")
-                data_type = row.get("数据类型", "")
-                channel_code = row.get("通道位号", "")
-                
+            # 按固定列顺序逐行取纯元组，基础字段在前，扩展点位的值和PLC地址依次在后；
+            # 缺失的列以空字符串补齐，与按行取值时的默认值一致
+            row_columns = ["变量名称（HMI）", "PLC绝对地址", "变量描述", "数据类型", "通道位号"]
+            for ext_point in PLCGenerator.EXTENDED_POINTS:
+                row_columns += [ext_point["name"], ext_point["plc_addr"]]
+            rows = self.uploaded_io_data.reindex(columns=row_columns, fill_value="").itertuples(index=False, name=None)
+            for i, (var_name, plc_address, description, data_type, channel_code, *ext_values) in enumerate(rows, 1):
                 # 如果变量名为空，则自动补全
                 if pd.isna(var_name) or str(var_name).strip() == "":
                     var_name = f"YLDW{channel_code}"
                     description = f"预留点位{channel_code}" if pd.isna(description) or str(description).strip() == "" else description
                 
-                # 填充基础变量数据
-                worksheet.write(excel_row_counter, var_name_col, var_name, common_style)
-                worksheet.write(excel_row_counter, address_col, str(plc_address), text_style) 
-                worksheet.write(excel_row_counter, comment_col, description, common_style)
-                worksheet.write(excel_row_counter, var_type_col, data_type, common_style)
+                # 填充基础变量数据，同一行的单元格直接写入行对象
+                write = worksheet.row(excel_row_counter).write
+                write(var_name_col, var_name, common_style)
+                write(address_col, str(plc_address), text_style) 
+                write(comment_col, description, common_style)
+                write(var_type_col, data_type, common_style)
                 
                 # 填充默认字段
                 default_values = PLCGenerator.get_default_field_values(data_type)
                 if init_value_col is not None:
-                    worksheet.write(excel_row_counter, init_value_col, default_values["初始值"], common_style)
+                    write(init_value_col, default_values["初始值"], common_style)
                 if power_protect_col is not None:
-                    worksheet.write(excel_row_counter, power_protect_col, default_values["掉电保护"], common_style)
+                    write(power_protect_col, default_values["掉电保护"], common_style)
                 if forcible_col is not None:
-                    worksheet.write(excel_row_counter, forcible_col, default_values["可强制"], common_style)
+                    write(forcible_col, default_values["可强制"], common_style)
                 if soe_enable_col is not None:
-                    worksheet.write(excel_row_counter, soe_enable_col, default_values["SOE使能"], common_style)
+                    write(soe_enable_col, default_values["SOE使能"], common_style)
                 
                 # 增加行计数器
                 excel_row_counter += 1
                 
                 # 处理该行的所有扩展点位
-                for ext_point in PLCGenerator.EXTENDED_POINTS:
+                for ext_point, point_value, point_plc_addr in zip(
+                        PLCGenerator.EXTENDED_POINTS, ext_values[0::2], ext_values[1::2]):
                     point_name = ext_point["name"]
-                    plc_addr_field = ext_point["plc_addr"]
                     point_suffix = ext_point["suffix"]
                     
-                    # 获取扩展点位的值和PLC地址
-                    point_value = row.get(point_name, "")
-                    point_plc_addr = row.get(plc_addr_field, "")
-                    
                     # 如果扩展点位值为空或"/"或None，则跳过
                     if pd.isna(point_value) or not point_value or point_value == "/":
                         continue
@@ -266,21 +272,22 @@ class PLCGenerator:
                     ext_data_type = "REAL" if point_plc_addr.startswith("%MD") else "BOOL"
                     
                     # 填充扩展点位数据
-                    worksheet.write(excel_row_counter, var_name_col, ext_var_name, common_style)
-                    worksheet.write(excel_row_counter, address_col, str(point_plc_addr), text_style)
-                    worksheet.write(excel_row_counter, comment_col, ext_description, common_style)
-                    worksheet.write(excel_row_counter, var_type_col, ext_data_type, common_style)
+                    write = worksheet.row(excel_row_counter).write
+                    write(var_name_col, ext_var_name, common_style)
+                    write(address_col, str(point_plc_addr), text_style)
+                    write(comment_col, ext_description, common_style)
+                    write(var_type_col, ext_data_type, common_style)
                     
                     # 填充默认字段
                     ext_default_values = PLCGenerator.get_default_field_values(ext_data_type)
                     if init_value_col is not None:
-                        worksheet.write(excel_row_counter, init_value_col, ext_default_values["初始值"], common_style)
+                        write(init_value_col, ext_default_values["初始值"], common_style)
                     if power_protect_col is not None:
-                        worksheet.write(excel_row_counter, power_protect_col, ext_default_values["掉电保护"], common_style)
+                        write(power_protect_col, ext_default_values["掉电保护"], common_style)
                     if forcible_col is not None:
-                        worksheet.write(excel_row_counter, forcible_col, ext_default_values["可强制"], common_style)
+                        write(forcible_col, ext_default_values["可强制"], common_style)
                     if soe_enable_col is not None:
-                        worksheet.write(excel_row_counter, soe_enable_col, ext_default_values["SOE使能"], common_style)
+                        write(soe_enable_col, ext_default_values["SOE使能"], common_style)
                     
                     # 增加行计数器
                     excel_row_counter += 1
@@ -295,8 +302,12 @@ class PLCGenerator:
             workbook.save(output_file)
             progress.setValue(95)
             
-            # 检查文件是否生成成功
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
+            # 检查文件是否生成成功，一次os.stat同时判断存在和大小
+            try:
+                output_size = os.stat(output_file).st_size
+            except OSError:
+                output_size = 0
+            if output_size > 0:
                 # 不显示本地文件生成成功的弹窗，只返回结果
                 progress.setValue(100)
                 return True, "PLC点表生成成功", output_file
@@ -179,7 +179,7 @@ def upload_hmi_table(io_data, root_window=None):
         
         # 创建临时文件
         temp_dir = tempfile.gettempdir()
-        temp_hmi_file_path = os.path.join(temp_dir, "HMI点表.xls")
+        temp_hmi_file_path = os.path.join(temp_dir, "HMI点表.xlsx")
         temp_dict_file_path = os.path.join(temp_dir, "数据词典点表.xls")
         
         # 调用HMI生成器生成IO_Server点表
@@ -325,7 +325,7 @@ def upload_fat_table(io_data, root_window=None):
         
         # 创建临时文件
         temp_dir = tempfile.gettempdir()
-        temp_file_path = os.path.join(temp_dir, "FAT点表.xls")
+        temp_file_path = os.path.join(temp_dir, "FAT点表.xlsx")
         
         # 调用FAT生成器生成点表
         success = FATGenerator.generate_fat_table(